@@ -3,6 +3,7 @@
 # SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
 
 import argparse
+import atexit
 import json
 import logging
 import os
@@ -23,6 +24,12 @@ import flask
 from dotenv import load_dotenv
 from flask import Flask, abort, jsonify
 from flask_cors import CORS
+from ttnn_visualizer.csv_queries import (
+    LocalCSVQueryRunner,
+    TracyHostQueries,
+    dataframe_cache,
+    perf_report_cache,
+)
 from ttnn_visualizer.database_migrations import run_alembic_migrations
 from ttnn_visualizer.exceptions import (
     DatabaseFileNotFoundException,
@@ -31,7 +38,15 @@ from ttnn_visualizer.exceptions import (
     ReportNotLoadedException,
 )
 from ttnn_visualizer.instances import create_instance_from_local_paths
+from ttnn_visualizer.offload import (
+    ConcurrencyLimitExceeded,
+    background_offload,
+    process_offload,
+    shutdown_offload,
+)
+from ttnn_visualizer.perf_trends import perf_trend_store
 from ttnn_visualizer.settings import Config, DefaultConfig
+from ttnn_visualizer.ssh_client import ssh_control_masters
 from ttnn_visualizer.utils import (
     find_gunicorn_path,
     get_app_data_directory,
@@ -83,6 +98,35 @@ def create_app(settings_override=None):
     if settings_override:
         app.config.update(settings_override)
 
+    dataframe_cache.configure(max_bytes=int(app.config["CSV_CACHE_MAX_BYTES"]))
+    LocalCSVQueryRunner.STREAMING_THRESHOLD_BYTES = int(
+        app.config["CSV_STREAMING_THRESHOLD_BYTES"]
+    )
+    TracyHostQueries.CSVEXPORT = app.config["TRACY_CSVEXPORT"]
+    perf_report_cache.configure(
+        directory=Path(app.config["APP_DATA_DIRECTORY"]) / "perf-report-cache",
+        max_bytes=int(app.config["PERF_REPORT_CACHE_MAX_BYTES"]),
+    )
+    perf_trend_store.configure(
+        Path(app.config["APP_DATA_DIRECTORY"]) / "perf-trends.db"
+        if app.config["PERF_TRENDS_ENABLED"]
+        else None
+    )
+    process_offload.configure(max_workers=int(app.config["OFFLOAD_PROCESS_WORKERS"]))
+    background_offload.configure(max_workers=1)
+    # Registered once, however many apps the process creates
+    atexit.unregister(shutdown_offload)
+    atexit.register(shutdown_offload)
+    ssh_control_masters.configure(
+        (
+            app.config["SSH_CONTROL_DIRECTORY"]
+            if app.config["SSH_CONTROL_MASTER"]
+            else None
+        ),
+        persist_seconds=int(app.config["SSH_CONTROL_PERSIST"]),
+        start_timeout_seconds=int(app.config["SSH_REMOTE_CHECK_TIMEOUT"]),
+    )
+
     middleware(app)
 
     app.register_blueprint(api, url_prefix=f"{app.config['BASE_PATH']}api")
@@ -180,6 +224,13 @@ def middleware(app: flask.Flask):
         response.status_code = HTTPStatus.NOT_FOUND
         return response
 
+    @app.errorhandler(ConcurrencyLimitExceeded)
+    def handle_concurrency_limit_exceeded(error):
+        response = jsonify({"error": str(error)})
+        response.status_code = HTTPStatus.SERVICE_UNAVAILABLE
+        response.headers["Retry-After"] = "5"
+        return response
+
     @app.errorhandler(HTTPException)
     def handle_http_error(error: HTTPException):
         message = error.description or error.name or "Request failed"
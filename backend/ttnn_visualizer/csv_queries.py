@@ -3,30 +3,51 @@
 # SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
 
 import csv
+import hashlib
+import importlib.metadata
+import importlib.util
 import json
 import logging
+import operator
 import os
+import re
+import shutil
+import subprocess
+import sys
 import tempfile
+import threading
 import traceback
-from io import StringIO
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
 from typing import (
+    BinaryIO,
+    Callable,
     Dict,
+    Hashable,
+    Iterator,
     List,
     Literal,
+    Mapping,
+    NamedTuple,
     Optional,
+    Tuple,
     Union,
     overload,
 )
 
+import numpy as np
+import orjson
 import pandas as pd
-import zstd
+import zstandard
 from tt_perf_report import perf_report
 from ttnn_visualizer.exceptions import (
     DataFormatError,
     PerformanceReportNotLoadedException,
 )
 from ttnn_visualizer.models import Instance
+from ttnn_visualizer.offload import background_offload, run_in_thread
 
 logger = logging.getLogger(__name__)
 
@@ -38,26 +59,588 @@ CSVQueryResult = Union[
 ]
 
 
+CSV_CACHE_DEFAULT_MAX_BYTES = 2 * 1024**3
+
+# (resolved path, mtime_ns, size, *variant): the variant says how the frame was
+# derived from the file (skipped rows and column names, or a derived index).
+CacheKey = Tuple[Hashable, ...]
+
+
+class DataFrameCache:
+    """
+    Process-level LRU cache of parsed CSV frames with a memory budget.
+
+    Entries are keyed by resolved path, mtime and size plus a variant, so a
+    rewritten file is a miss and every stale entry for it is dropped. Frames
+    derived from a file (e.g. the zone index) live beside its parsed frame.
+    Cached frames are shared between requests and must be treated as
+    read-only. A frame larger than the whole budget is returned uncached.
+    """
+
+    def __init__(self, max_bytes: int = CSV_CACHE_DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_bytes: int):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict_to_fit(0)
+
+    def get_or_load(
+        self, key: CacheKey, loader: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Parse outside the lock so a multi-GB load doesn't block cache hits.
+        df = loader()
+        size = int(df.memory_usage(deep=True).sum())
+
+        with self._lock:
+            for stale_key in [
+                k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]
+            ]:
+                self._remove(stale_key)
+            if size > self.max_bytes:
+                logger.info(
+                    f"Not caching {key[0]}: {size} bytes exceeds budget of {self.max_bytes}"
+                )
+                return df
+            self._evict_to_fit(size)
+            self._entries[key] = (df, size)
+            self.current_bytes += size
+        return df
+
+    def _remove(self, key: CacheKey):
+        _, size = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def _evict_to_fit(self, incoming_bytes: int):
+        while self._entries and self.current_bytes + incoming_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+dataframe_cache = DataFrameCache()
+
+
+PERF_REPORT_CACHE_DEFAULT_MAX_BYTES = 512 * 1024**2
+
+
+class ReportResultCache:
+    """
+    On-disk cache of generated perf reports as JSON bodies, shared by worker
+    processes and kept across restarts.
+
+    Keys are hashed to file names; callers include the input file's mtime and
+    size in the key, so a rewritten CSV is a miss. Files are written to a
+    temporary name and renamed, and reading one refreshes its mtime, which
+    drives least-recently-used eviction once the directory exceeds
+    ``max_bytes``. Disabled until ``configure`` sets a directory.
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        max_bytes: int = PERF_REPORT_CACHE_DEFAULT_MAX_BYTES,
+    ):
+        self.directory = Path(directory) if directory else None
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, directory: Optional[Union[str, Path]], max_bytes: int):
+        with self._lock:
+            self.directory = Path(directory) if directory else None
+            self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None and self.max_bytes > 0
+
+    def _path(self, directory: Path, key: CacheKey) -> Path:
+        digest = hashlib.sha256(orjson.dumps(list(key))).hexdigest()
+        return directory / f"{digest}{self.SUFFIX}"
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        directory = self.directory
+        if directory is None or not self.enabled:
+            return None
+        path = self._path(directory, key)
+        try:
+            body = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return body
+
+    def put(self, key: CacheKey, body: bytes) -> bool:
+        """Store ``body`` under ``key``; ``False`` when it couldn't be kept."""
+        directory = self.directory
+        if directory is None or not self.enabled or len(body) > self.max_bytes:
+            return False
+        path = self._path(directory, key)
+        partial = path.with_name(f".{path.name}.partial")
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            partial.write_bytes(body)
+            os.replace(partial, path)
+        except OSError as e:
+            logger.warning(f"Could not cache perf report in {directory}: {e}")
+            partial.unlink(missing_ok=True)
+            return False
+        with self._lock:
+            self._evict_to_fit(directory)
+        return True
+
+    def _entries(self, directory: Path) -> List[Tuple[Path, os.stat_result]]:
+        entries = []
+        for path in directory.glob(f"*{self.SUFFIX}"):
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                continue  # evicted by another worker
+        return entries
+
+    def _evict_to_fit(self, directory: Path):
+        entries = sorted(
+            self._entries(directory), key=lambda entry: entry[1].st_mtime_ns
+        )
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            self.evictions += 1
+
+    def clear(self):
+        directory = self.directory
+        if directory is None or not directory.exists():
+            return
+        with self._lock:
+            for path, _ in self._entries(directory):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            directory = self.directory
+            entries = (
+                self._entries(directory)
+                if directory is not None and self.enabled and directory.exists()
+                else []
+            )
+            return {
+                "entries": len(entries),
+                "bytes": sum(stat.st_size for _, stat in entries),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+perf_report_cache = ReportResultCache()
+
+
+COLUMNAR_SIDECAR_SUFFIX = ".parquet"
+
+
+def columnar_engine_available() -> bool:
+    """Parquet sidecars need pyarrow; an install without it skips them."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def columnar_sidecar_path(csv_path: Union[str, Path]) -> Path:
+    return Path(csv_path).with_suffix(COLUMNAR_SIDECAR_SUFFIX)
+
+
 class LocalCSVQueryRunner:
-    def __init__(self, file_path: Union[str, Path], offset: int = 0):
+    # CSVs at least this large are scanned in chunks per query instead of being
+    # loaded whole; configured from CSV_STREAMING_THRESHOLD_BYTES.
+    STREAMING_THRESHOLD_BYTES = 512 * 1024**2
+    STREAMING_CHUNK_ROWS = 250_000
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        offset: int = 0,
+        column_names: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ):
         self.file_path = file_path
         self.offset = offset
+        self.column_names = column_names
+        self.dtypes = dtypes
         self.df: Optional[pd.DataFrame] = None
+        self.columnar_path: Optional[Path] = None
+        self.streaming = False
+
+    def _cache_key(self) -> CacheKey:
+        return self.derived_cache_key(
+            self.offset, tuple(self.column_names) if self.column_names else None
+        )
+
+    def derived_cache_key(self, *variant: Hashable) -> CacheKey:
+        """Cache key for a frame derived from this runner's file."""
+        path = Path(self.file_path).resolve()
+        stat = path.stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size, *variant)
+
+    def read_columns(self, columns: List[str]) -> pd.DataFrame:
+        """
+        All rows of ``columns`` from whichever source backs this runner. The
+        frame may be shared with the cache and must not be modified in place.
+        Above ``STREAMING_THRESHOLD_BYTES`` only these columns are parsed, a
+        chunk at a time, but every row of them is still returned.
+        """
+        return self._select(columns, None, None)
+
+    def take_rows(self, positions: np.ndarray, columns: List[str]) -> pd.DataFrame:
+        """
+        The rows at ``positions`` of ``columns``, in that order. A loaded frame
+        and the Parquet sidecar are indexed directly; a streamed CSV is walked
+        a chunk at a time, keeping only the requested rows of each chunk.
+        """
+        if self.df is not None:
+            return self.df.iloc[positions][columns].reset_index(drop=True)
+        if self.columnar_path is not None:
+            import pyarrow.dataset as ds
+
+            dataset = ds.dataset(self.columnar_path, format="parquet")
+            return dataset.take(positions, columns=columns).to_pandas()
+
+        ascending = np.argsort(positions, kind="stable")
+        wanted = np.asarray(positions)[ascending]
+        pieces = []
+        offset = 0
+        for chunk in self.iter_chunks(columns):
+            lo = int(wanted.searchsorted(offset, side="left"))
+            hi = int(wanted.searchsorted(offset + len(chunk), side="left"))
+            if hi > lo:
+                pieces.append(chunk.iloc[wanted[lo:hi] - offset])
+            offset += len(chunk)
+            if hi == len(wanted):
+                break
+        if not pieces:
+            return pd.DataFrame(columns=columns)
+        rows = pd.concat(pieces, ignore_index=True)
+        return rows.iloc[np.argsort(ascending)].reset_index(drop=True)
+
+    def cached_derived(
+        self, name: str, build: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        The frame ``build`` derives from this runner's file, kept in the
+        DataFrame cache under ``name``. Files at or above the streaming
+        threshold are rebuilt per call instead, so a derived copy of a log
+        too large to load whole is never held between requests.
+        """
+        if Path(self.file_path).stat().st_size >= self.STREAMING_THRESHOLD_BYTES:
+            return build()
+        return dataframe_cache.get_or_load(self.derived_cache_key(name), build)
+
+    def _load(self) -> pd.DataFrame:
+        df = pd.read_csv(self.file_path, skiprows=self.offset)
+        if self.column_names:
+            df.columns = self.column_names
+        df.columns = df.columns.str.strip()
+        for column, dtype in (self.dtypes or {}).items():
+            if column not in df.columns:
+                continue
+            try:
+                df[column] = df[column].astype(dtype)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Keeping inferred type for {column!r}: {e}")
+        return df
+
+    def _fresh_columnar_path(self) -> Optional[Path]:
+        """The Parquet sidecar, if pyarrow is installed and it postdates the CSV."""
+        sidecar = columnar_sidecar_path(self.file_path)
+        if not columnar_engine_available() or not sidecar.exists():
+            return None
+        if sidecar.stat().st_mtime_ns < Path(self.file_path).stat().st_mtime_ns:
+            return None
+        return sidecar
+
+    def write_columnar_sidecar(self) -> Optional[Path]:
+        """
+        Convert the CSV to a typed Parquet file beside it, a chunk at a time
+        so memory stays flat however large the CSV is. The first chunk's
+        types are kept for the whole file. Written to a temporary name and
+        renamed so readers never see a partial file. Returns ``None`` when
+        pyarrow is missing or a later chunk doesn't fit those types.
+        """
+        if not columnar_engine_available():
+            return None
+        sidecar = columnar_sidecar_path(self.file_path)
+        if self._fresh_columnar_path() is not None:
+            return sidecar
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        partial = sidecar.with_name(f".{sidecar.name}.partial")
+        writer = None
+        try:
+            for chunk in self.iter_chunks(self._header_names()):
+                if writer is None:
+                    schema = self._sidecar_schema(
+                        pa.Schema.from_pandas(chunk, preserve_index=False)
+                    )
+                    writer = pq.ParquetWriter(partial, schema)
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                writer.write_table(table)
+            if writer is None:
+                return None
+            writer.close()
+            writer = None
+            os.replace(partial, sidecar)
+        except Exception as e:
+            if writer is not None:
+                writer.close()
+            logger.warning(
+                f"Could not write columnar sidecar for {self.file_path}: {e}"
+            )
+            partial.unlink(missing_ok=True)
+            return None
+        logger.info(f"Wrote columnar sidecar {sidecar}")
+        return sidecar
+
+    @staticmethod
+    def _sidecar_schema(schema):
+        """
+        The first chunk's schema, loosened where the next chunk would differ
+        only by chance: all-empty columns become strings, and categories get
+        an index wide enough for any chunk's distinct values.
+        """
+        import pyarrow as pa
+
+        fields = []
+        for schema_field in schema:
+            if pa.types.is_null(schema_field.type):
+                schema_field = schema_field.with_type(pa.string())
+            elif pa.types.is_dictionary(schema_field.type):
+                schema_field = schema_field.with_type(
+                    pa.dictionary(pa.int32(), schema_field.type.value_type)
+                )
+            fields.append(schema_field)
+        return pa.schema(fields, metadata=schema.metadata)
+
+    def _read_columnar(
+        self,
+        columns: Optional[List[str]],
+        filters: Optional[Dict[str, Union[str, None]]],
+        limit: Optional[int],
+    ) -> pd.DataFrame:
+        """Read from the sidecar with column projection and predicate pushdown."""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(self.columnar_path, format="parquet")
+        expression = None
+        for col, value in (filters or {}).items():
+            condition = (
+                ds.field(col).is_null() if value is None else ds.field(col) == value
+            )
+            expression = condition if expression is None else expression & condition
+
+        try:
+            if limit is not None:
+                table = dataset.head(limit, columns=columns, filter=expression)
+            else:
+                table = dataset.to_table(columns=columns, filter=expression)
+        except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+            # e.g. a string compared with an integer column: like pandas ``==``,
+            # that simply matches nothing.
+            schema = dataset.schema
+            if columns:
+                schema = pa.schema([schema.field(col) for col in columns])
+            table = schema.empty_table()
+        return table.to_pandas()
+
+    def _header_names(self) -> List[str]:
+        if self.column_names:
+            names = pd.Index(self.column_names)
+        else:
+            names = pd.read_csv(self.file_path, skiprows=self.offset, nrows=0).columns
+        return list(names.str.strip())
+
+    def file_columns(self) -> List[str]:
+        """
+        The file's column names, from the Parquet sidecar when fresh and
+        otherwise the CSV header. Needs no enclosing context.
+        """
+        sidecar = self._fresh_columnar_path()
+        if sidecar is not None:
+            import pyarrow.parquet as pq
+
+            return pq.read_schema(sidecar).names
+        return self._header_names()
+
+    def iter_chunks(
+        self, columns: List[str], chunk_rows: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        The file's ``columns`` in frames of at most ``chunk_rows`` rows, from
+        the Parquet sidecar when fresh and otherwise parsed from the CSV, so
+        a whole file can be walked in flat memory. Requested columns the file
+        doesn't have are left out. Needs no enclosing context.
+        """
+        chunk_rows = chunk_rows or self.STREAMING_CHUNK_ROWS
+        sidecar = self._fresh_columnar_path()
+        if sidecar is not None:
+            import pyarrow.parquet as pq
+
+            parquet = pq.ParquetFile(sidecar)
+            present = [name for name in columns if name in parquet.schema_arrow.names]
+            for batch in parquet.iter_batches(batch_size=chunk_rows, columns=present):
+                yield batch.to_pandas()
+            return
+
+        names = self._header_names()
+        usecols = [name for name in names if name in set(columns)]
+        dtypes = {
+            name: dtype
+            for name, dtype in (self.dtypes or {}).items()
+            if name in usecols
+        }
+        reader = pd.read_csv(
+            self.file_path,
+            skiprows=self.offset + 1,
+            header=None,
+            names=names,
+            usecols=usecols,
+            dtype=dtypes or None,
+            chunksize=chunk_rows,
+        )
+        with reader:
+            yield from reader
+
+    def _read_streaming(
+        self,
+        columns: Optional[List[str]],
+        filters: Optional[Dict[str, Union[str, None]]],
+        limit: Optional[int],
+    ) -> pd.DataFrame:
+        """
+        Scan the CSV in chunks, parsing only the selected and filtered columns,
+        and stop as soon as ``limit`` matching rows have been collected.
+        """
+        names = self._header_names()
+        wanted = list(columns) if columns else names
+        usecols = [name for name in names if name in set(wanted) | set(filters or {})]
+        dtypes = {
+            name: dtype
+            for name, dtype in (self.dtypes or {}).items()
+            if name in usecols
+        }
+
+        def scan(dtype) -> pd.DataFrame:
+            matches: List[pd.DataFrame] = []
+            matched_rows = 0
+            reader = pd.read_csv(
+                self.file_path,
+                skiprows=self.offset + 1,
+                header=None,
+                names=names,
+                usecols=usecols,
+                dtype=dtype,
+                chunksize=self.STREAMING_CHUNK_ROWS,
+            )
+            with reader:
+                for chunk in reader:
+                    chunk = self._apply_filters(chunk, filters)
+                    if chunk.empty:
+                        continue
+                    matches.append(chunk)
+                    matched_rows += len(chunk)
+                    if limit is not None and matched_rows >= limit:
+                        break
+            if not matches:
+                return pd.DataFrame(columns=usecols)
+            return pd.concat(matches, ignore_index=True)
+
+        try:
+            result_df = scan(dtypes or None)
+        except (TypeError, ValueError) as e:
+            # e.g. an int64 column with blanks somewhere past the first chunk
+            logger.debug(f"Streaming {self.file_path} without dtypes: {e}")
+            result_df = scan(None)
+
+        result_df = result_df[wanted]
+        if limit is not None:
+            result_df = result_df.head(limit)
+        return result_df
 
     def __enter__(self):
-        # Load the CSV file
-        self.df = pd.read_csv(self.file_path, skiprows=self.offset)
+        self.columnar_path = self._fresh_columnar_path()
+        if self.columnar_path is not None:
+            return self
+        if Path(self.file_path).stat().st_size >= self.STREAMING_THRESHOLD_BYTES:
+            self.streaming = True
+            return self
+        # Load the CSV file, reusing the parsed frame while the file is unchanged
+        # The pandas C parser releases the GIL, so parse on a native thread
+        self.df = dataframe_cache.get_or_load(
+            self._cache_key(), lambda: run_in_thread(self._load)
+        )
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.df = None
+        self.columnar_path = None
+        self.streaming = False
 
     def get_csv_header(self) -> Dict[str, int]:
-        if self.df is None:
+        if self.df is not None:
+            columns = list(self.df.columns)
+        elif self.streaming:
+            columns = self._header_names()
+        elif self.columnar_path is not None:
+            import pyarrow.parquet as pq
+
+            columns = pq.read_schema(self.columnar_path).names
+        else:
             raise RuntimeError(
                 "DataFrame is not loaded. Ensure the runner is used within a context."
             )
-        return {col: idx + 1 for idx, col in enumerate(self.df.columns)}
+        return {col: idx + 1 for idx, col in enumerate(columns)}
 
     def execute_query(
         self,
@@ -74,19 +657,41 @@ class LocalCSVQueryRunner:
         :param limit: Maximum number of rows to return.
         :return: List of lists or dictionaries containing the result rows.
         """
+        return self._serialize(self._select(columns, filters, limit), as_dict)
+
+    def execute_query_json(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Union[str, None]]] = None,
+        limit: Optional[int] = None,
+    ) -> bytes:
+        """
+        Like ``execute_query(as_dict=True)`` but returns the JSON body directly.
+        orjson already writes NaN as ``null``, so no per-cell sanitizing pass
+        is needed before serializing.
+        """
+        result_df = self._select(columns, filters, limit)
+        return orjson.dumps(self._records(result_df, sanitize_nulls=False))
+
+    def _select(
+        self,
+        columns: Optional[List[str]],
+        filters: Optional[Dict[str, Union[str, None]]],
+        limit: Optional[int],
+    ) -> pd.DataFrame:
+        if self.df is None and self.columnar_path is not None:
+            return self._read_columnar(columns or None, filters, limit)
+
+        if self.df is None and self.streaming:
+            return self._read_streaming(columns, filters, limit)
+
         if self.df is None:
             raise RuntimeError(
                 "DataFrame is not loaded. Ensure the runner is used within a context."
             )
 
         # Apply filters if provided
-        df_filtered = self.df
-        if filters:
-            for col, value in filters.items():
-                if value is None:
-                    df_filtered = df_filtered[df_filtered[col].isna()]
-                else:
-                    df_filtered = df_filtered[df_filtered[col] == value]
+        df_filtered = self._apply_filters(self.df, filters)
 
         # Select specified columns
         if columns:
@@ -98,18 +703,51 @@ class LocalCSVQueryRunner:
         if limit is not None:
             result_df = result_df.head(limit)
 
-        # Replace NaN with None in the query results
-        sanitized_df = result_df.applymap(lambda x: None if pd.isna(x) else x)
+        return result_df
+
+    @staticmethod
+    def _apply_filters(
+        df: pd.DataFrame, filters: Optional[Mapping[str, CSVCell]]
+    ) -> pd.DataFrame:
+        if filters:
+            for col, value in filters.items():
+                if value is None:
+                    df = df[df[col].isna()]
+                else:
+                    df = df[df[col] == value]
+        return df
 
+    @staticmethod
+    def _column_values(series: pd.Series, sanitize_nulls: bool) -> list:
+        """
+        One column as Python scalars. Nulls become ``None`` via a single
+        vectorized mask, and only on columns that actually contain nulls.
+        """
+        if sanitize_nulls and series.hasnans:
+            return series.astype(object).where(series.notna(), None).tolist()
+        return series.tolist()
+
+    @classmethod
+    def _records(
+        cls, result_df: pd.DataFrame, sanitize_nulls: bool = True
+    ) -> List[Dict[str, CSVCell]]:
+        names = [str(col).replace(" ", "_") for col in result_df.columns]
+        values = [
+            cls._column_values(result_df.iloc[:, index], sanitize_nulls)
+            for index in range(len(names))
+        ]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    @classmethod
+    def _serialize(cls, result_df: pd.DataFrame, as_dict: bool) -> CSVQueryResult:
         if as_dict:
-            sanitized_columns = {
-                col: col.replace(" ", "_") for col in sanitized_df.columns
-            }
-            sanitized_df = sanitized_df.copy()
-            sanitized_df.rename(columns=sanitized_columns, inplace=True)
-            return sanitized_df.to_dict(orient="records")
+            return cls._records(result_df)
 
-        return sanitized_df.values.tolist()
+        values = [
+            cls._column_values(result_df.iloc[:, index], sanitize_nulls=True)
+            for index in range(result_df.shape[1])
+        ]
+        return [list(row) for row in zip(*values)]
 
 
 class NPEQueries:
@@ -128,25 +766,48 @@ class NPEQueries:
         with open(file_path, "r") as f:
             return json.load(f)
 
+    # Every zstd frame starts with this magic number
+    ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+    STREAM_CHUNK_BYTES = 1024**2
+
     @staticmethod
-    def get_npe_timeline(instance: Instance, filename: str):
+    def get_npe_timeline_path(instance: Instance, filename: str) -> Path:
         if not filename:
             raise ValueError("filename is required")
 
         if not instance.performance_path:
             raise PerformanceReportNotLoadedException()
 
-        file_path = Path(instance.performance_path, NPEQueries.NPE_FOLDER, filename)
+        return Path(instance.performance_path, NPEQueries.NPE_FOLDER, filename)
+
+    @staticmethod
+    def get_npe_timeline(instance: Instance, filename: str):
+        file_path = NPEQueries.get_npe_timeline_path(instance, filename)
 
         if filename.endswith(".zst"):
-            with open(file_path, "rb") as file:
-                compressed_data = file.read()
-                uncompressed_data = zstd.uncompress(compressed_data)
-                return json.loads(uncompressed_data)
+            return json.loads(b"".join(NPEQueries.iter_decompressed(file_path)))
         else:
             with open(file_path, "r") as f:
                 return json.load(f)
 
+    @staticmethod
+    def is_zstd_file(file_path: Union[str, Path]) -> bool:
+        with open(file_path, "rb") as file:
+            return file.read(len(NPEQueries.ZSTD_MAGIC)) == NPEQueries.ZSTD_MAGIC
+
+    @staticmethod
+    def iter_decompressed(file_path: Union[str, Path]) -> Iterator[bytes]:
+        """
+        The decompressed contents of the zstd file at ``file_path`` in chunks,
+        streamed with ``zstandard`` so the whole file is never held at once.
+        """
+        with open(file_path, "rb") as file:
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                file, read_across_frames=True
+            )
+            while chunk := reader.read(NPEQueries.STREAM_CHUNK_BYTES):
+                yield chunk
+
 
 class DeviceLogProfilerQueries:
     DEVICE_LOG_FILE = "profile_log_device.csv"
@@ -165,6 +826,34 @@ class DeviceLogProfilerQueries:
         "source line",
         "source file",
     ]
+    DEVICE_LOG_DTYPES = {
+        "RISC processor type": "category",
+        "zone name": "category",
+        "zone phase": "category",
+        "time[cycles since reset]": "int64",
+    }
+    CYCLES_COLUMN = "time[cycles since reset]"
+    CYCLE_WINDOW_FILTERS = ["core_x", "core_y", "RISC processor type"]
+    DEFAULT_WINDOW_LIMIT = 10_000
+    MAX_WINDOW_LIMIT = 100_000
+    ZONE_INDEX_KEYS = [
+        "PCIe slot",
+        "core_x",
+        "core_y",
+        "RISC processor type",
+        "zone name",
+        "run ID",
+    ]
+    ZONE_STATISTICS_KEYS = [
+        "zone name",
+        "PCIe slot",
+        "core_x",
+        "core_y",
+        "RISC processor type",
+    ]
+    ZONE_PERCENTILES = (0.5, 0.9, 0.99)
+    KERNEL_ZONE_SUFFIX = "-KERNEL"
+    KERNEL_CORE_KEYS = ["run host ID", "PCIe slot", "core_x", "core_y"]
 
     def __init__(self, instance: Instance):
         """
@@ -180,20 +869,21 @@ class DeviceLogProfilerQueries:
         """
         if not self.instance.performance_path:
             raise PerformanceReportNotLoadedException()
-        self.runner = LocalCSVQueryRunner(
-            file_path=Path(self.instance.performance_path).joinpath(
-                self.DEVICE_LOG_FILE
-            ),
-            offset=1,  # Skip the first line for device log files
-        )
+        self.runner = self.create_runner(self.instance.performance_path)
 
         self.runner.__enter__()
 
-        self.runner.df.columns = self.DEVICE_LOG_COLUMNS
-        self.runner.df.columns = self.runner.df.columns.str.strip()
-
         return self
 
+    @classmethod
+    def create_runner(cls, performance_path: Union[str, Path]) -> LocalCSVQueryRunner:
+        return LocalCSVQueryRunner(
+            file_path=Path(performance_path).joinpath(cls.DEVICE_LOG_FILE),
+            offset=1,  # Skip the first line for device log files
+            column_names=cls.DEVICE_LOG_COLUMNS,
+            dtypes=cls.DEVICE_LOG_DTYPES,
+        )
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Ensure resources are cleaned up when exiting the context.
@@ -256,19 +946,302 @@ class DeviceLogProfilerQueries:
             columns=self.DEVICE_LOG_COLUMNS, as_dict=as_dict, limit=limit
         )
 
+    def get_all_entries_json(self, limit: Optional[int] = None) -> bytes:
+        """
+        ``get_all_entries(as_dict=True)`` serialized straight to JSON bytes.
+        """
+        if self.runner is None:
+            raise RuntimeError(
+                "DeviceLogProfilerQueries must be used as a context manager"
+            )
+        return self.runner.execute_query_json(
+            columns=self.DEVICE_LOG_COLUMNS, limit=limit
+        )
+
+    def query_zone_statistics_json(
+        self, zone_name: str, limit: Optional[int] = None
+    ) -> bytes:
+        """
+        ``query_zone_statistics(as_dict=True)`` serialized straight to JSON bytes.
+        """
+        if self.runner is None:
+            raise RuntimeError(
+                "DeviceLogProfilerQueries must be used as a context manager"
+            )
+        return self.runner.execute_query_json(
+            filters={"zone name": zone_name}, limit=limit
+        )
+
+    def zone_index(self) -> pd.DataFrame:
+        """
+        One row per zone occurrence: ``ZONE_INDEX_KEYS`` plus ``begin``,
+        ``end`` and ``duration`` in cycles. Built once per log file and kept in
+        the DataFrame cache alongside the parsed log, unless the log is
+        streamed.
+        """
+        if self.runner is None:
+            raise RuntimeError(
+                "DeviceLogProfilerQueries must be used as a context manager"
+            )
+        runner = self.runner
+        return runner.cached_derived(
+            "zone_index", lambda: self._build_zone_index(runner)
+        )
+
+    def _build_zone_index(self, runner: LocalCSVQueryRunner) -> pd.DataFrame:
+        keys = self.ZONE_INDEX_KEYS
+        df = runner.read_columns(keys + ["zone phase", self.CYCLES_COLUMN])
+        phase = df["zone phase"].astype(str).str.strip().str.lower()
+
+        # The n-th begin of a (core, RISC, zone, run) pairs with its n-th end,
+        # both taken in timestamp order.
+        def ordered(markers: pd.DataFrame, column: str) -> pd.DataFrame:
+            markers = markers[keys + [self.CYCLES_COLUMN]].sort_values(
+                self.CYCLES_COLUMN, kind="stable"
+            )
+            markers = markers.rename(columns={self.CYCLES_COLUMN: column})
+            markers["occurrence"] = markers.groupby(
+                keys, observed=True, dropna=False
+            ).cumcount()
+            return markers
+
+        pairs = ordered(df[phase == "begin"], "begin").merge(
+            ordered(df[phase == "end"], "end"), on=keys + ["occurrence"]
+        )
+        pairs["duration"] = pairs["end"] - pairs["begin"]
+        return pairs.drop(columns="occurrence").reset_index(drop=True)
+
+    def zone_duration_statistics(
+        self, zone_name: Optional[str] = None
+    ) -> List[Dict[str, CSVCell]]:
+        """
+        Count, total, min, max, mean and percentile durations (cycles) per zone,
+        device, core and RISC, aggregated over runs.
+        """
+        index = self.zone_index()
+        if zone_name is not None:
+            index = index[index["zone name"] == zone_name]
+
+        durations = index.groupby(self.ZONE_STATISTICS_KEYS, observed=True, sort=True)[
+            "duration"
+        ]
+        statistics = durations.agg(["count", "sum", "min", "max", "mean"]).rename(
+            columns={"sum": "total"}
+        )
+        percentiles = durations.quantile(list(self.ZONE_PERCENTILES)).unstack()
+        percentiles.columns = [f"p{round(q * 100)}" for q in percentiles.columns]
+        statistics = statistics.join(percentiles).reset_index()
+        return LocalCSVQueryRunner._records(statistics)
+
+    def cycle_order(self) -> pd.DataFrame:
+        """
+        ``CYCLES_COLUMN`` stably sorted, with each value's ``position`` in the
+        log and its core and RISC, so any cycle window is one contiguous slice
+        of positions that can be filtered before a single row is read. Only
+        this index is kept in the DataFrame cache; the rows themselves are
+        taken from the parsed log or the sidecar the runner already has.
+        """
+        if self.runner is None:
+            raise RuntimeError(
+                "DeviceLogProfilerQueries must be used as a context manager"
+            )
+        runner = self.runner
+        return runner.cached_derived(
+            "cycle_order", lambda: self._build_cycle_order(runner)
+        )
+
+    def _build_cycle_order(self, runner: LocalCSVQueryRunner) -> pd.DataFrame:
+        log = runner.read_columns([self.CYCLES_COLUMN, *self.CYCLE_WINDOW_FILTERS])
+        positions = np.argsort(log[self.CYCLES_COLUMN].to_numpy(), kind="stable")
+        order = log.iloc[positions].reset_index(drop=True)
+        order["position"] = positions
+        return order
+
+    def query_cycle_window(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        core_x: Optional[int] = None,
+        core_y: Optional[int] = None,
+        risc: Optional[str] = None,
+        limit: int = DEFAULT_WINDOW_LIMIT,
+    ) -> bytes:
+        """
+        The first ``limit`` device log rows with ``start <= cycles <= end``,
+        optionally narrowed to one core and RISC, as JSON bytes. The window
+        bounds are found by binary search over the cached cycle order and the
+        filters applied to it, so only the rows returned are read. A streamed
+        log without a sidecar is instead scanned once, a chunk at a time.
+        """
+        if self.runner is None:
+            raise RuntimeError(
+                "DeviceLogProfilerQueries must be used as a context manager"
+            )
+        limit = min(max(limit, 1), self.MAX_WINDOW_LIMIT)
+        filters = {
+            column: value
+            for column, value in zip(self.CYCLE_WINDOW_FILTERS, (core_x, core_y, risc))
+            if value is not None
+        }
+        if self.runner.streaming:
+            window = self._scan_cycle_window(start, end, filters, limit)
+        else:
+            order = self.cycle_order()
+            cycles = order[self.CYCLES_COLUMN].to_numpy()
+            first = 0 if start is None else int(cycles.searchsorted(start, "left"))
+            last = (
+                len(cycles) if end is None else int(cycles.searchsorted(end, "right"))
+            )
+            candidates = LocalCSVQueryRunner._apply_filters(
+                order.iloc[first:last], filters
+            )
+            window = self.runner.take_rows(
+                candidates["position"].to_numpy()[:limit], self.DEVICE_LOG_COLUMNS
+            )
+        return orjson.dumps(LocalCSVQueryRunner._records(window, sanitize_nulls=False))
+
+    def _scan_cycle_window(
+        self,
+        start: Optional[int],
+        end: Optional[int],
+        filters: Mapping[str, CSVCell],
+        limit: int,
+    ) -> pd.DataFrame:
+        """
+        ``query_cycle_window`` over a log too large to load: one pass over its
+        chunks, keeping only the ``limit`` earliest matching rows seen so far.
+        """
+        assert self.runner is not None
+        window = pd.DataFrame()
+        offset = 0
+        for chunk in self.runner.iter_chunks(self.DEVICE_LOG_COLUMNS):
+            chunk = chunk.assign(position=np.arange(offset, offset + len(chunk)))
+            offset += len(chunk)
+            cycles = chunk[self.CYCLES_COLUMN]
+            in_window = pd.Series(True, index=chunk.index)
+            if start is not None:
+                in_window &= cycles >= start
+            if end is not None:
+                in_window &= cycles <= end
+            chunk = chunk[in_window]
+            chunk = LocalCSVQueryRunner._apply_filters(chunk, filters)
+            if chunk.empty:
+                continue
+            window = pd.concat([window, chunk]) if not window.empty else chunk
+            window = window.sort_values(
+                [self.CYCLES_COLUMN, "position"], kind="stable"
+            ).head(limit)
+        return window.drop(columns="position", errors="ignore").reset_index(drop=True)
+
+    def kernel_durations(self) -> pd.DataFrame:
+        """
+        Kernel duration in cycles per op (``run host ID``) and core: from the
+        earliest ``*-KERNEL`` zone begin to the latest end across the core's
+        RISCs. Built once per log file and kept in the DataFrame cache.
+        """
+        if self.runner is None:
+            raise RuntimeError(
+                "DeviceLogProfilerQueries must be used as a context manager"
+            )
+        runner = self.runner
+        return runner.cached_derived(
+            "kernel_durations", lambda: self._build_kernel_durations(runner)
+        )
+
+    def _build_kernel_durations(self, runner: LocalCSVQueryRunner) -> pd.DataFrame:
+        group_keys = self.KERNEL_CORE_KEYS + ["RISC processor type", "zone name"]
+        df = runner.read_columns(group_keys + ["zone phase", self.CYCLES_COLUMN])
+        zone = df["zone name"].astype(str).str.strip()
+        df = df[zone.str.endswith(self.KERNEL_ZONE_SUFFIX).to_numpy()]
+
+        # Sort markers by (op, device, core, RISC, zone, cycles); a kernel zone
+        # is then an adjacent begin/end pair within one group.
+        codes = [pd.factorize(df[key])[0] for key in group_keys]
+        cycles = df[self.CYCLES_COLUMN].to_numpy(dtype=np.int64)
+        order = np.lexsort([cycles] + codes[::-1])
+        codes = [code[order] for code in codes]
+        cycles = cycles[order]
+        phase = df["zone phase"].astype(str).str.strip().str.lower().to_numpy()[order]
+
+        same_group: np.ndarray = np.ones(max(len(cycles) - 1, 0), dtype=bool)
+        for code in codes:
+            same_group &= code[1:] == code[:-1]
+        closes = same_group & (phase[:-1] == "begin") & (phase[1:] == "end")
+
+        pairs = df.iloc[order[1:][closes]][self.KERNEL_CORE_KEYS].reset_index(drop=True)
+        pairs["begin"] = cycles[:-1][closes]
+        pairs["end"] = cycles[1:][closes]
+
+        per_core = pairs.groupby(self.KERNEL_CORE_KEYS, sort=True).agg(
+            begin=("begin", "min"), end=("end", "max")
+        )
+        per_core["duration"] = per_core["end"] - per_core["begin"]
+        return per_core.reset_index()
+
+    def kernel_duration_matrix(self) -> Dict[str, object]:
+        """
+        ``kernel_durations`` pivoted to one row per op and one column per core,
+        with ``None`` where a core did not run the op.
+        """
+        matrix = (
+            self.kernel_durations()
+            .pivot(
+                index="run host ID",
+                columns=["PCIe slot", "core_x", "core_y"],
+                values="duration",
+            )
+            .astype("Int64")
+        )
+        present = matrix.notna()
+        return {
+            "unit": "cycles",
+            "frequency_mhz": self.chip_frequency_mhz(),
+            "cores": [
+                {"device": device, "core_x": core_x, "core_y": core_y}
+                for device, core_x, core_y in matrix.columns.tolist()
+            ],
+            "operations": [
+                {
+                    "run_host_id": run_host_id,
+                    "durations": durations,
+                    "min": shortest,
+                    "max": longest,
+                    "mean": mean,
+                }
+                for run_host_id, durations, shortest, longest, mean in zip(
+                    matrix.index.tolist(),
+                    matrix.astype(object).where(present, None).values.tolist(),
+                    matrix.min(axis=1).astype(object).tolist(),
+                    matrix.max(axis=1).astype(object).tolist(),
+                    matrix.mean(axis=1).tolist(),
+                )
+            ],
+        }
+
+    def chip_frequency_mhz(self) -> Optional[int]:
+        """``CHIP_FREQ[MHz]`` from the device log's first line, if present."""
+        if self.runner is None:
+            raise RuntimeError(
+                "DeviceLogProfilerQueries must be used as a context manager"
+            )
+        return self.read_chip_frequency_mhz(self.runner.file_path)
+
+    @staticmethod
+    def read_chip_frequency_mhz(file_path: Union[str, Path]) -> Optional[int]:
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            match = re.search(r"CHIP_FREQ\[MHz\]:\s*(\d+)", f.readline())
+        return int(match.group(1)) if match else None
+
     @staticmethod
-    def get_raw_csv(instance: Instance):
+    def get_raw_csv_path(instance: Instance) -> Path:
         if not instance.performance_path:
             raise PerformanceReportNotLoadedException()
-        file_path = Path(
-            instance.performance_path, DeviceLogProfilerQueries.DEVICE_LOG_FILE
-        )
-        with open(file_path, "r") as f:
-            return f.read()
+        return Path(instance.performance_path, DeviceLogProfilerQueries.DEVICE_LOG_FILE)
 
 
 class OpsPerformanceQueries:
     PERF_RESULTS_PREFIX = "ops_perf_results"
+    PERF_RESULTS_DTYPES = {"OP TYPE": "category"}
 
     def __init__(self, instance: Instance):
         """
@@ -283,9 +1256,10 @@ class OpsPerformanceQueries:
         :return:
         """
         file_path = OpsPerformanceQueries.get_local_ops_perf_file_path(self.instance)
-        self.runner = LocalCSVQueryRunner(file_path=file_path, offset=0)
+        self.runner = LocalCSVQueryRunner(
+            file_path=file_path, offset=0, dtypes=self.PERF_RESULTS_DTYPES
+        )
         self.runner.__enter__()
-        self.runner.df.columns = self.runner.df.columns.str.strip()
 
         return self
 
@@ -296,11 +1270,7 @@ class OpsPerformanceQueries:
         performance_path = Path(instance.performance_path)
 
         # Find the latest file with the correct prefix
-        perf_files = list(
-            performance_path.glob(f"{OpsPerformanceQueries.PERF_RESULTS_PREFIX}.csv")
-        ) + list(
-            performance_path.glob(f"{OpsPerformanceQueries.PERF_RESULTS_PREFIX}_*.csv")
-        )
+        perf_files = OpsPerformanceQueries.get_ops_perf_file_paths(performance_path)
         if not perf_files:
             raise FileNotFoundError(
                 f"No performance results file found at {performance_path}"
@@ -310,6 +1280,15 @@ class OpsPerformanceQueries:
         latest_file = max(perf_files, key=os.path.getctime)
         return str(latest_file)
 
+    @staticmethod
+    def get_ops_perf_file_paths(performance_path: Union[str, Path]) -> List[Path]:
+        performance_path = Path(performance_path)
+        return list(
+            performance_path.glob(f"{OpsPerformanceQueries.PERF_RESULTS_PREFIX}.csv")
+        ) + list(
+            performance_path.glob(f"{OpsPerformanceQueries.PERF_RESULTS_PREFIX}_*.csv")
+        )
+
     @staticmethod
     def get_remote_ops_perf_file_path(instance):
         from ttnn_visualizer.sftp_operations import resolve_file_path
@@ -320,11 +1299,6 @@ class OpsPerformanceQueries:
             f"{remote_profile_folder}/{OpsPerformanceQueries.PERF_RESULTS_PREFIX}*",
         )
 
-    @staticmethod
-    def get_raw_csv(instance):
-        with open(OpsPerformanceQueries.get_local_ops_perf_file_path(instance)) as f:
-            return f.read()
-
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Clean up resources when exiting the context.
@@ -366,6 +1340,16 @@ class OpsPerformanceQueries:
             )
         return self.runner.execute_query(columns=[], as_dict=as_dict, limit=limit)
 
+    def get_all_entries_json(self, limit: Optional[int] = None) -> bytes:
+        """
+        ``get_all_entries(as_dict=True)`` serialized straight to JSON bytes.
+        """
+        if self.runner is None:
+            raise RuntimeError(
+                "OpsPerformanceQueries must be used as a context manager"
+            )
+        return self.runner.execute_query_json(limit=limit)
+
     @staticmethod
     def get_all_folders(directory: str) -> List[str]:
         """
@@ -382,6 +1366,396 @@ class OpsPerformanceQueries:
             raise RuntimeError(f"Error accessing directory: {e}")
 
 
+class TracyHostQueries:
+    """
+    Host-side zones (op dispatch, Python-side time) from the Tracy capture.
+
+    The ``.tracy`` file is Tracy's own serialized capture, whose layout
+    changes between Tracy versions, so zones are read through Tracy's
+    ``tracy-csvexport`` tool, parsing its output as it streams. Without the
+    tool, the ``tracy_ops_times.csv`` export tt-metal writes beside the
+    capture (its op dispatch zones) is used instead. Zones are kept sorted by
+    start time, in a Parquet sidecar when pyarrow is installed and otherwise
+    in the DataFrame cache, so a time window is a range read.
+    """
+
+    TRACY_FILE = "tracy_profile_log_host.tracy"
+    OPS_TIMES_FILE = "tracy_ops_times.csv"
+    # Configured from TRACY_CSVEXPORT
+    CSVEXPORT = "tracy-csvexport"
+    EXPORT_CHUNK_ROWS = 250_000
+    SIDECAR_ROW_GROUP_ROWS = 65_536
+    DEFAULT_WINDOW_LIMIT = 10_000
+    MAX_WINDOW_LIMIT = 100_000
+    # Columns of ``tracy-csvexport --unwrap``
+    EXPORT_COLUMNS = {
+        "name": "name",
+        "thread": "thread",
+        "ns_since_start": "start_ns",
+        "exec_time_ns": "duration_ns",
+        "src_file": "src_file",
+        "src_line": "src_line",
+    }
+    ZONE_COLUMNS = [
+        "name",
+        "thread",
+        "start_ns",
+        "end_ns",
+        "duration_ns",
+        "src_file",
+        "src_line",
+    ]
+    MAX_DURATION_KEY = b"max_duration_ns"
+
+    def __init__(self, instance: Instance):
+        if not instance.performance_path:
+            raise PerformanceReportNotLoadedException()
+        self.performance_path = Path(instance.performance_path)
+        self.tracy_path = self.performance_path / self.TRACY_FILE
+
+    @classmethod
+    def csvexport_path(cls) -> Optional[str]:
+        return shutil.which(cls.CSVEXPORT)
+
+    def _ops_times_path(self) -> Optional[Path]:
+        """tt-metal's export, if it is at least as new as the capture."""
+        path = self.performance_path / self.OPS_TIMES_FILE
+        if not path.exists():
+            return None
+        if (
+            self.tracy_path.exists()
+            and path.stat().st_mtime_ns < self.tracy_path.stat().st_mtime_ns
+        ):
+            return None
+        return path
+
+    def _source_path(self) -> Path:
+        """The file zones are read from: the capture, or tt-metal's export."""
+        if self.tracy_path.exists() and self.csvexport_path() is not None:
+            return self.tracy_path
+        ops_times = self._ops_times_path()
+        if ops_times is not None:
+            return ops_times
+        if not self.tracy_path.exists():
+            raise FileNotFoundError(f"No Tracy host profile at {self.tracy_path}")
+        return self.tracy_path
+
+    def available(self) -> bool:
+        """Whether zones can be read: an export, or a capture and the tool."""
+        if self._ops_times_path() is not None:
+            return True
+        return self.tracy_path.exists() and self.csvexport_path() is not None
+
+    @classmethod
+    def _normalize_chunk(cls, chunk: pd.DataFrame) -> pd.DataFrame:
+        chunk.columns = chunk.columns.str.strip()
+        missing = {"name", "ns_since_start", "exec_time_ns"} - set(chunk.columns)
+        if missing:
+            raise DataFormatError(
+                f"Tracy zone export is missing columns: {', '.join(sorted(missing))}"
+            )
+        zones = pd.DataFrame(
+            {
+                zone_column: chunk[column]
+                for column, zone_column in cls.EXPORT_COLUMNS.items()
+                if column in chunk.columns
+            }
+        )
+        for column in ("thread", "src_line"):
+            if column not in zones:
+                zones[column] = 0
+        if "src_file" not in zones:
+            zones["src_file"] = ""
+        zones["start_ns"] = zones["start_ns"].astype("int64")
+        zones["duration_ns"] = zones["duration_ns"].astype("int64")
+        zones["end_ns"] = zones["start_ns"] + zones["duration_ns"]
+        zones["name"] = zones["name"].astype(str)
+        zones["src_file"] = zones["src_file"].fillna("").astype(str)
+        zones["thread"] = zones["thread"].fillna(0).astype("int64")
+        zones["src_line"] = zones["src_line"].fillna(0).astype("int64")
+        return zones[cls.ZONE_COLUMNS]
+
+    def _read_export(self, export) -> pd.DataFrame:
+        chunks = [
+            self._normalize_chunk(chunk)
+            for chunk in pd.read_csv(
+                export, chunksize=self.EXPORT_CHUNK_ROWS, skipinitialspace=True
+            )
+        ]
+        if not chunks:
+            return pd.DataFrame(columns=self.ZONE_COLUMNS)
+        zones = pd.concat(chunks, ignore_index=True)
+        return zones.sort_values("start_ns", kind="stable").reset_index(drop=True)
+
+    def export_zones(self) -> pd.DataFrame:
+        """
+        Every host zone, sorted by start. The export is parsed in chunks as
+        ``tracy-csvexport`` writes it, never holding its text whole.
+        """
+        source = self._source_path()
+        if source != self.tracy_path:
+            return self._read_export(source)
+
+        csvexport = self.csvexport_path()
+        if csvexport is None:
+            raise DataFormatError(
+                f"{self.CSVEXPORT} is needed to read {self.TRACY_FILE} "
+                f"and no {self.OPS_TIMES_FILE} export was found"
+            )
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(
+                [csvexport, "--unwrap", str(self.tracy_path)],
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+            )
+            # Always set with stdout=PIPE
+            assert process.stdout is not None
+            try:
+                zones = self._read_export(process.stdout)
+            except pd.errors.EmptyDataError:
+                zones = pd.DataFrame(columns=self.ZONE_COLUMNS)
+            finally:
+                process.stdout.close()
+                returncode = process.wait()
+            if returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode(errors="replace").strip()
+                raise DataFormatError(
+                    f"{self.CSVEXPORT} failed on {self.tracy_path}: {message}"
+                )
+        return zones
+
+    def _cache_key(self, *variant: Hashable) -> CacheKey:
+        path = self._source_path().resolve()
+        stat = path.stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size, *variant)
+
+    def sidecar_path(self) -> Path:
+        return columnar_sidecar_path(self.tracy_path)
+
+    def _fresh_sidecar_path(self) -> Optional[Path]:
+        sidecar = self.sidecar_path()
+        if not columnar_engine_available() or not sidecar.exists():
+            return None
+        if sidecar.stat().st_mtime_ns < self._source_path().stat().st_mtime_ns:
+            return None
+        return sidecar
+
+    def write_sidecar(self) -> Optional[Path]:
+        """
+        Write the sorted zones to a Parquet file beside the capture, in row
+        groups whose start-time statistics let window reads skip the rest.
+        Returns ``None`` without pyarrow or when the zones can't be read.
+        """
+        if not columnar_engine_available():
+            return None
+        sidecar = self.sidecar_path()
+        if self._fresh_sidecar_path() is not None:
+            return sidecar
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        partial = sidecar.with_name(f".{sidecar.name}.partial")
+        try:
+            zones = self.export_zones()
+            max_duration = int(zones["duration_ns"].max()) if len(zones) else 0
+            table = pa.Table.from_pandas(zones, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {
+                    **(table.schema.metadata or {}),
+                    self.MAX_DURATION_KEY: str(max_duration).encode(),
+                }
+            )
+            pq.write_table(table, partial, row_group_size=self.SIDECAR_ROW_GROUP_ROWS)
+            os.replace(partial, sidecar)
+        except (OSError, DataFormatError, ValueError) as e:
+            logger.warning(f"Could not write Tracy zone sidecar {sidecar}: {e}")
+            partial.unlink(missing_ok=True)
+            return None
+        logger.info(f"Wrote Tracy zone sidecar {sidecar}")
+        return sidecar
+
+    def zones(self) -> pd.DataFrame:
+        """The sorted zones, parsed once per capture and kept in the cache."""
+        return dataframe_cache.get_or_load(
+            self._cache_key("tracy_zones"), lambda: run_in_thread(self.export_zones)
+        )
+
+    def _window_from_sidecar(
+        self, sidecar: Path, start: Optional[int], end: Optional[int], name
+    ) -> pd.DataFrame:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_schema(sidecar).metadata or {}
+        max_duration = int(metadata.get(self.MAX_DURATION_KEY, b"0"))
+        expression = None
+
+        def narrow(condition):
+            nonlocal expression
+            expression = condition if expression is None else expression & condition
+
+        # Bounding the sorted start column lets row group statistics prune
+        if start is not None:
+            narrow(ds.field("start_ns") >= start - max_duration)
+            narrow(ds.field("end_ns") >= start)
+        if end is not None:
+            narrow(ds.field("start_ns") <= end)
+        if name is not None:
+            narrow(ds.field("name") == name)
+        table = ds.dataset(sidecar, format="parquet").to_table(filter=expression)
+        return table.to_pandas()
+
+    def _window_from_frame(
+        self, start: Optional[int], end: Optional[int], name
+    ) -> pd.DataFrame:
+        zones = self.zones()
+        starts = zones["start_ns"].to_numpy()
+        first = 0
+        last = len(zones)
+        if start is not None and len(zones):
+            # A zone may start up to the longest duration before the window
+            max_duration = int(zones["duration_ns"].max())
+            first = int(starts.searchsorted(start - max_duration, side="left"))
+        if end is not None:
+            last = int(starts.searchsorted(end, side="right"))
+        window = zones.iloc[first:last]
+        if start is not None:
+            window = window[window["end_ns"].to_numpy() >= start]
+        if name is not None:
+            window = window[window["name"].to_numpy() == name]
+        return window
+
+    def query_window(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        name: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, object]:
+        """
+        Zones overlapping ``start``..``end`` (ns since the capture started),
+        optionally of one ``name``, as columns in start order.
+        """
+        sidecar = self._fresh_sidecar_path()
+        if sidecar is not None:
+            window = self._window_from_sidecar(sidecar, start, end, name)
+        else:
+            window = self._window_from_frame(start, end, name)
+
+        total = len(window)
+        if limit is not None:
+            window = window.head(limit)
+        return {
+            "start": start,
+            "end": end,
+            "total": total,
+            "truncated": len(window) < total,
+            "columns": {
+                column: window[column].tolist() for column in self.ZONE_COLUMNS
+            },
+        }
+
+
+def convert_performance_report_to_columnar(
+    performance_path: Union[str, Path],
+) -> List[Path]:
+    """
+    Write Parquet sidecars for the device log, every ops perf results CSV and
+    the Tracy host zones in a performance report, so later queries skip
+    parsing. Up-to-date sidecars are kept; without pyarrow this is a no-op.
+    Parses whole files, so request handlers go through
+    ``convert_performance_report_in_background`` instead.
+    """
+    if not columnar_engine_available():
+        logger.debug("pyarrow is not installed; skipping columnar sidecars")
+        return []
+
+    runners = [
+        LocalCSVQueryRunner(
+            file_path=path, dtypes=OpsPerformanceQueries.PERF_RESULTS_DTYPES
+        )
+        for path in OpsPerformanceQueries.get_ops_perf_file_paths(performance_path)
+    ]
+    if Path(performance_path, DeviceLogProfilerQueries.DEVICE_LOG_FILE).exists():
+        runners.append(DeviceLogProfilerQueries.create_runner(performance_path))
+
+    written = []
+    for runner in runners:
+        sidecar = runner.write_columnar_sidecar()
+        if sidecar is not None:
+            written.append(sidecar)
+
+    tracy = TracyHostQueries(
+        Instance(instance_id="columnar", performance_path=str(performance_path))
+    )
+    if tracy.available():
+        sidecar = tracy.write_sidecar()
+        if sidecar is not None:
+            written.append(sidecar)
+    return written
+
+
+def convert_performance_report_in_background(performance_path: Union[str, Path]):
+    """Queue the sidecar conversion in the background process pool."""
+
+    def log_failure(future: Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(
+                f"Could not convert {performance_path} to columnar sidecars: "
+                f"{future.exception()}"
+            )
+
+    background_offload.submit(
+        convert_performance_report_to_columnar, str(performance_path)
+    ).add_done_callback(log_failure)
+
+
+@dataclass
+class OpsPerfResultsIndex:
+    """
+    The parts of an ops perf results CSV that the perf report needs, read in
+    a single pass: the data row count, every signpost occurrence and selected
+    columns stored as per-column lists. Row ``idx`` is the ``idx``-th non-blank
+    data row of the file, i.e. report id ``idx + 2``; an index of a slice of
+    the file holds rows ``first_row`` onwards.
+    """
+
+    row_count: int
+    signpost_occurrences: List[Dict[str, Union[int, str]]]
+    columns: Dict[str, List[Optional[str]]]
+    # Byte offset of the first data row, just past the header
+    data_offset: int = 0
+    first_row: int = 0
+
+    @property
+    def signposts(self) -> List[Dict[str, Union[int, str]]]:
+        """The first occurrence of each signpost name, in file order."""
+        return [
+            {"id": occurrence["id"], "op_code": occurrence["op_code"]}
+            for occurrence in self.signpost_occurrences
+            if occurrence["ordinal"] == 0
+        ]
+
+    def value(self, idx: int, column: str) -> Optional[str]:
+        values = self.columns.get(column)
+        idx -= self.first_row
+        if values is None or not 0 <= idx < len(values):
+            return None
+        return values[idx]
+
+
+class SignpostWindow(NamedTuple):
+    """The data rows strictly between two signpost occurrences."""
+
+    first_row: int
+    row_count: int
+    start_offset: int
+    # None reads to the end of the file
+    end_offset: Optional[int]
+
+
 class OpsPerformanceReportQueries:
     REPORT_COLUMNS = [
         "id",
@@ -468,41 +1842,248 @@ class OpsPerformanceReportQueries:
     DEFAULT_CLASSIC_COLORS = False  # Colour scheme for plotted stacked report
     DEFAULT_GROUP_BY = None  # Group by method for stacked report
 
+    # Columns copied into OpsPerfResultsIndex; the few distinct values of the
+    # low-cardinality ones are interned so repeated cells share one string.
+    INDEXED_COLUMNS = [
+        "OP TYPE",
+        "PROGRAM HASH",
+        "PROGRAM CACHE HIT",
+        *PASSTHROUGH_COLUMNS.values(),
+    ]
+    INTERNED_COLUMNS = {"OP TYPE", "PROGRAM CACHE HIT"}
+    # Derived while indexing from the per-input W/Z/Y/X columns (with the
+    # ``_PAD[LOGICAL]`` suffix in newer CSVs), e.g. ``1x1x32x64; 1x1x64x32``
+    INPUT_SHAPES_COLUMN = "INPUT SHAPES"
+    SHAPE_INPUTS = 2
+    SHAPE_DIMENSIONS = ("W", "Z", "Y", "X")
+
+    @classmethod
+    def index_ops_perf_results(
+        cls,
+        csv_file: BinaryIO,
+        window: Optional[SignpostWindow] = None,
+    ) -> OpsPerfResultsIndex:
+        """
+        Stream ``csv_file`` (opened in binary mode) once, collecting the row
+        count, every signpost occurrence with its byte offsets, and
+        ``INDEXED_COLUMNS``. Blank lines are skipped as ``csv.DictReader``
+        does. With a ``window`` only the header and the rows in it are read.
+        """
+        position = csv_file.tell()
+        end_offset = None
+
+        def lines():
+            # Decoded one line at a time so ``position`` tracks where the row
+            # csv.reader last returned ends; it never reads ahead.
+            nonlocal position
+            while end_offset is None or position < end_offset:
+                line = csv_file.readline()
+                if not line:
+                    return
+                position += len(line)
+                yield line.decode("utf-8")
+
+        reader = csv.reader(lines())
+        header = next(reader, None) or []
+        data_offset = position
+        first_row = 0
+        if window is not None:
+            csv_file.seek(window.start_offset)
+            position = window.start_offset
+            end_offset = window.end_offset
+            first_row = window.first_row
+
+        # Like DictReader, the last of any duplicated header names wins
+        positions = {name: index for index, name in enumerate(header)}
+        columns = [column for column in cls.INDEXED_COLUMNS if column in positions]
+        column_positions = [positions[column] for column in columns]
+        full_width = max(column_positions, default=-1) + 1
+
+        def pick(row):
+            return tuple(row[p] for p in column_positions)
+
+        # itemgetter only returns a tuple for two or more positions
+        if len(column_positions) > 1:
+            pick = operator.itemgetter(*column_positions)
+        op_type_position = positions.get("OP TYPE")
+        op_code_position = positions.get("OP CODE")
+        shape_positions = cls._input_shape_positions(positions)
+        # Few distinct shapes repeat across many rows; each is formatted once
+        shape_strings: Dict[Tuple[str, ...], Optional[str]] = {}
+        input_shapes = []
+
+        # Signpost names repeat (e.g. once per iteration), so each occurrence
+        # is kept with its ordinal among occurrences of the same name.
+        signpost_occurrences: List[Dict[str, Union[int, str]]] = []
+        ordinals: Dict[str, int] = {}
+        picked_rows = []
+        row_offset = position
+        for row in reader:
+            if not row:
+                row_offset = position
+                continue
+            width = len(row)
+            if width >= full_width:
+                picked_rows.append(pick(row))
+            else:
+                picked_rows.append(
+                    tuple(row[p] if p < width else None for p in column_positions)
+                )
+            if shape_positions:
+                dimensions = tuple(row[p] if p < width else "" for p in shape_positions)
+                if dimensions not in shape_strings:
+                    shape_strings[dimensions] = cls._format_input_shapes(dimensions)
+                input_shapes.append(shape_strings[dimensions])
+
+            if (
+                op_type_position is not None
+                and op_type_position < width
+                and row[op_type_position] == "signpost"
+                and op_code_position is not None
+                and op_code_position < width
+            ):
+                op_code = row[op_code_position]
+                ordinal = ordinals.get(op_code, 0)
+                ordinals[op_code] = ordinal + 1
+                signpost_occurrences.append(
+                    {
+                        # Match IDs with row numbers in ops perf results csv
+                        "id": first_row + len(picked_rows) + 1,
+                        "op_code": op_code,
+                        "ordinal": ordinal,
+                        "offset": row_offset,
+                        "end_offset": position,
+                    }
+                )
+            row_offset = position
+
+        # Transpose to one list per column
+        indexed: Dict[str, list] = {column: [] for column in columns}
+        for column, values in zip(columns, zip(*picked_rows)):
+            if column in cls.INTERNED_COLUMNS:
+                indexed[column] = [None if v is None else sys.intern(v) for v in values]
+            else:
+                indexed[column] = list(values)
+        if shape_positions:
+            indexed[cls.INPUT_SHAPES_COLUMN] = input_shapes
+
+        return OpsPerfResultsIndex(
+            row_count=len(picked_rows),
+            signpost_occurrences=signpost_occurrences,
+            columns=indexed,
+            data_offset=data_offset,
+            first_row=first_row,
+        )
+
+    @classmethod
+    def _input_shape_positions(cls, positions: Dict[str, int]) -> List[int]:
+        """Header positions of every input's shape columns, or none if absent."""
+        shape_positions = []
+        for index in range(cls.SHAPE_INPUTS):
+            for dimension in cls.SHAPE_DIMENSIONS:
+                name = f"INPUT_{index}_{dimension}"
+                position = positions.get(f"{name}_PAD[LOGICAL]", positions.get(name))
+                if position is None:
+                    return []
+                shape_positions.append(position)
+        return shape_positions
+
+    @classmethod
+    def _format_input_shapes(cls, dimensions: Tuple[str, ...]) -> Optional[str]:
+        per_input = len(cls.SHAPE_DIMENSIONS)
+        shapes = [
+            "x".join(dimensions[start : start + per_input])
+            for start in range(0, len(dimensions), per_input)
+            if any(dimensions[start : start + per_input])
+        ]
+        return sys.intern("; ".join(shapes)) if shapes else None
+
     @staticmethod
-    def extract_signposts(csv_file):
-        logger.info("Reading raw CSV for signpost extraction...")
-        csv_file.seek(0)
-        ops_perf_results = []
-        ops_perf_results_reader = csv.DictReader(csv_file)
-
-        for row in ops_perf_results_reader:
-            ops_perf_results.append(row)
-
-        # Returns a list of unique signposts in the order they appear
-        # TODO: Signpost names are not unique but tt-perf-report treats them as such
-        captured_signposts = set()
-        signposts = []
-        for index, row in enumerate(ops_perf_results):
-            if row.get("OP TYPE") == "signpost":
-                op_code = row["OP CODE"]
-                op_id = index + 2  # Match IDs with row numbers in ops perf results csv
-                if not any(s["op_code"] == op_code for s in signposts):
-                    captured_signposts.add(op_code)
-                    signposts.append(
-                        {
-                            "id": op_id,
-                            "op_code": op_code,
-                        }
-                    )
+    def signpost_window(
+        results_index: OpsPerfResultsIndex,
+        start_signpost: Optional[str],
+        end_signpost: Optional[str],
+        start_ordinal: Optional[int] = None,
+        end_ordinal: Optional[int] = None,
+    ) -> Optional[SignpostWindow]:
+        """
+        The rows after the ``start_ordinal``-th ``start_signpost`` and before
+        the ``end_ordinal``-th ``end_signpost``, as tt-perf-report selects
+        them: ordinals default to the first occurrence, or the one after the
+        start when both names are the same. None when a name without an
+        explicit ordinal isn't found, leaving tt-perf-report to handle it.
+        """
+        by_name: Dict[str, List[Dict]] = {}
+        for occurrence in results_index.signpost_occurrences:
+            by_name.setdefault(str(occurrence["op_code"]), []).append(occurrence)
+
+        def resolve(name, ordinal, default_ordinal):
+            occurrences = by_name.get(name, [])
+            index = default_ordinal if ordinal is None else ordinal
+            if 0 <= index < len(occurrences):
+                return occurrences[index]
+            if ordinal is not None:
+                raise DataFormatError(
+                    f"Signpost '{name}' occurrence {ordinal} not found; "
+                    f"it occurs {len(occurrences)} times"
+                )
+            return None
+
+        start = end = None
+        if start_signpost:
+            start = resolve(start_signpost, start_ordinal, 0)
+            if start is None:
+                return None
+        if end_signpost:
+            default_ordinal = 0
+            if start is not None and end_signpost == start_signpost:
+                default_ordinal = start["ordinal"] + 1
+            end = resolve(end_signpost, end_ordinal, default_ordinal)
+            if end is None:
+                return None
+        if start is not None and end is not None and end["id"] <= start["id"]:
+            if start_ordinal is None and end_ordinal is None:
+                return None
+            raise DataFormatError(
+                f"Signpost '{end_signpost}' ({end['ordinal']}) does not come after "
+                f"'{start_signpost}' ({start['ordinal']})"
+            )
 
-        return ops_perf_results, signposts
+        # Report ids are data row numbers + 2
+        first_row = start["id"] - 1 if start else 0
+        end_row = end["id"] - 2 if end else results_index.row_count
+        return SignpostWindow(
+            first_row=first_row,
+            row_count=end_row - first_row,
+            start_offset=start["end_offset"] if start else results_index.data_offset,
+            end_offset=end["offset"] if end else None,
+        )
 
     @staticmethod
-    def set_op_type_from_results(processed_row, idx, ops_perf_results):
-        if 0 <= idx < len(ops_perf_results):
-            processed_row["op_type"] = ops_perf_results[idx].get("OP TYPE")
-        else:
-            processed_row["op_type"] = None
+    def write_signpost_window(
+        csv_file: BinaryIO, data_offset: int, window: SignpostWindow, output: BinaryIO
+    ):
+        """Copy the header and the rows in ``window`` to ``output``."""
+        chunk_size = 1024**2
+        csv_file.seek(0)
+        output.write(csv_file.read(data_offset))
+        csv_file.seek(window.start_offset)
+        remaining = None
+        if window.end_offset is not None:
+            remaining = window.end_offset - window.start_offset
+        while remaining is None or remaining > 0:
+            chunk = csv_file.read(
+                chunk_size if remaining is None else min(chunk_size, remaining)
+            )
+            if not chunk:
+                break
+            output.write(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+
+    @staticmethod
+    def set_op_type_from_results(processed_row, idx, results_index):
+        processed_row["op_type"] = results_index.value(idx, "OP TYPE")
 
         return processed_row
 
@@ -532,40 +2113,301 @@ class OpsPerformanceReportQueries:
                     logger.warning(f"Could not delete temporary file {file_path}: {e}")
 
     @staticmethod
-    def set_hash_from_results(processed_row, idx, ops_perf_results):
-        if 0 <= idx < len(ops_perf_results):
-            hash_value = ops_perf_results[idx].get("PROGRAM HASH")
-            processed_row["hash"] = hash_value if hash_value else None
-
-            cache_hit_value = ops_perf_results[idx].get("PROGRAM CACHE HIT")
-            if cache_hit_value == "True":
-                processed_row["cache_hit"] = True
-            elif cache_hit_value == "False":
-                processed_row["cache_hit"] = False
-            else:
-                processed_row["cache_hit"] = None
+    def set_hash_from_results(processed_row, idx, results_index):
+        hash_value = results_index.value(idx, "PROGRAM HASH")
+        processed_row["hash"] = hash_value if hash_value else None
+
+        cache_hit_value = results_index.value(idx, "PROGRAM CACHE HIT")
+        if cache_hit_value == "True":
+            processed_row["cache_hit"] = True
+        elif cache_hit_value == "False":
+            processed_row["cache_hit"] = False
         else:
-            processed_row["hash"] = None
             processed_row["cache_hit"] = None
 
         return processed_row
 
+    # Bump when the shape of generate_report's output changes so that reports
+    # cached by an older version are not served.
+    REPORT_CACHE_VERSION = 3
+    REPORT_OPTION_DEFAULTS = {
+        "start_signpost": DEFAULT_START_SIGNPOST,
+        "end_signpost": DEFAULT_END_SIGNPOST,
+        "start_signpost_ordinal": None,
+        "end_signpost_ordinal": None,
+        "print_signposts": DEFAULT_PRINT_SIGNPOSTS,
+        "hide_host_ops": DEFAULT_NO_HOST_OPS,
+        "merge_devices": DEFAULT_MERGE_DEVICES,
+        "tracing_mode": DEFAULT_TRACING_MODE,
+        "group_by": DEFAULT_GROUP_BY,
+        "no_stacked_report": DEFAULT_NO_STACKED_REPORT,
+    }
+
     @classmethod
-    def generate_report(cls, instance, **kwargs):
-        raw_csv = OpsPerformanceQueries.get_raw_csv(instance)
-        csv_file = StringIO(raw_csv)
+    def report_cache_key(cls, instance, **kwargs) -> CacheKey:
+        path = Path(OpsPerformanceQueries.get_local_ops_perf_file_path(instance))
+        stat = path.resolve().stat()
+        try:
+            perf_report_version = importlib.metadata.version("tt-perf-report")
+        except importlib.metadata.PackageNotFoundError:
+            perf_report_version = None
+        options = tuple(
+            kwargs.get(name, default)
+            for name, default in cls.REPORT_OPTION_DEFAULTS.items()
+        )
+        return (
+            str(path.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            cls.REPORT_CACHE_VERSION,
+            perf_report_version,
+            *options,
+        )
 
-        # Validate that we have CSV data with rows
-        csv_lines = raw_csv.strip().split("\n")
-        logger.info(f"CSV has {len(csv_lines)} lines (header + data rows)")
+    # Report columns the table may be sorted by; the rest (advice) are lists
+    REPORT_TABLE_SORT_COLUMNS = [
+        column for column in REPORT_COLUMNS if column != "advice"
+    ] + ["op_type", "hash", "input_shapes", *PASSTHROUGH_COLUMNS]
 
-        if len(csv_lines) < 2:
-            raise DataFormatError(
-                f"CSV must have at least header + 1 data row, got {len(csv_lines)} lines"
+    @staticmethod
+    def _is_numeric_column(values: pd.Series) -> bool:
+        present = values.dropna()
+        if present.empty:
+            # All blank: NaN floats compare and filter like any number column
+            return True
+        try:
+            # Cheap rejection of text columns before parsing all of them
+            float(present.iloc[0])
+        except (TypeError, ValueError):
+            return False
+        return pd.to_numeric(present, errors="coerce").notna().all()
+
+    @classmethod
+    def report_table(
+        cls, key: CacheKey, load_report: Callable[[], Dict]
+    ) -> pd.DataFrame:
+        """
+        The rows of the report generated under ``key`` as a typed frame:
+        numeric columns are parsed and text columns are categorical. Each
+        original row is kept in ``row`` as its JSON bytes, which the cache
+        sizes honestly, so pages are returned exactly as in the full report.
+        """
+
+        def load():
+            rows = load_report()["report"]
+            table = pd.DataFrame.from_records(
+                rows, columns=cls.REPORT_TABLE_SORT_COLUMNS
+            )
+            for column in table.columns:
+                values = table[column].replace("", None)
+                if cls._is_numeric_column(values):
+                    table[column] = pd.to_numeric(values)
+                else:
+                    table[column] = values.astype("category")
+            table["row"] = [orjson.dumps(row) for row in rows]
+            return table
+
+        return dataframe_cache.get_or_load((*key, "report_table"), load)
+
+    @classmethod
+    def report_table_extras(
+        cls, key: CacheKey, load_report: Callable[[], Dict]
+    ) -> pd.DataFrame:
+        """Everything in the report but its rows, as JSON bytes in a single row."""
+
+        def load():
+            report = dict(load_report())
+            report.pop("report", None)
+            return pd.DataFrame({"extras": [orjson.dumps(report)]})
+
+        return dataframe_cache.get_or_load((*key, "report_table_extras"), load)
+
+    @classmethod
+    def report_table_order(cls, key: CacheKey, table: pd.DataFrame) -> pd.DataFrame:
+        """
+        Per column, the ascending sort permutation of ``table`` and, under
+        ``-column``, the descending one; text sorts case-insensitively. Equal
+        values keep report order either way, and missing values sort last.
+        """
+
+        def load():
+            orders = {}
+            for column in cls.REPORT_TABLE_SORT_COLUMNS:
+                values = table[column]
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    categories = values.cat.categories.astype(str).str.lower()
+                    category_ranks = np.empty(len(categories) + 1, dtype=np.float64)
+                    category_ranks[np.argsort(categories, kind="stable")] = np.arange(
+                        len(categories)
+                    )
+                    # Code -1 (missing) picks the NaN rank
+                    category_ranks[-1] = np.nan
+                    keys = category_ranks[values.cat.codes.to_numpy()]
+                else:
+                    keys = values.to_numpy(dtype=np.float64, na_value=np.nan)
+                # NaN sorts last in both directions
+                orders[column] = np.argsort(keys, kind="stable").astype(np.int32)
+                orders[f"-{column}"] = np.argsort(-keys, kind="stable").astype(np.int32)
+            return pd.DataFrame(orders)
+
+        return dataframe_cache.get_or_load((*key, "report_table_order"), load)
+
+    @classmethod
+    def query_report_table(
+        cls,
+        key: CacheKey,
+        body: bytes,
+        sort: Optional[str] = None,
+        descending: bool = False,
+        op_code: Optional[str] = None,
+        bound: Optional[List[str]] = None,
+        device: Optional[List[int]] = None,
+        min_device_time: Optional[float] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Dict:
+        """
+        One page of the report rows matching the filters, in ``sort`` order
+        (report order by default, which also breaks ties). ``total`` counts
+        all matching rows. Rows without a value in the sort column come last
+        either way.
+        """
+        if sort is not None and sort not in cls.REPORT_TABLE_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort the perf report by '{sort}'")
+
+        parsed: Dict = {}
+
+        def load_report():
+            # Parsed at most once, and only when a cached frame is missing
+            if not parsed:
+                parsed.update(orjson.loads(body))
+            return parsed
+
+        table = cls.report_table(key, load_report)
+        mask: np.ndarray = np.ones(len(table), dtype=bool)
+        if op_code:
+            mask &= (
+                table["op_code"]
+                .str.contains(op_code, case=False, regex=False, na=False)
+                .to_numpy()
             )
+        if bound:
+            mask &= table["bound"].isin(bound).to_numpy()
+        if device:
+            mask &= table["device"].isin(device).to_numpy()
+        if min_device_time is not None:
+            mask &= (table["device_time"] >= min_device_time).to_numpy()
+
+        if sort is None:
+            positions = np.flatnonzero(mask)
+        else:
+            column = f"-{sort}" if descending else sort
+            order = cls.report_table_order(key, table)[column].to_numpy()
+            positions = order[mask[order]]
+
+        stop = None if limit is None else offset + limit
+        rows = table["row"].to_numpy()[positions[offset:stop]]
+        return {
+            **orjson.loads(cls.report_table_extras(key, load_report)["extras"].iat[0]),
+            "report": orjson.loads(b"[" + b",".join(rows) + b"]"),
+            "total": len(positions),
+            "offset": offset,
+            "limit": limit,
+        }
+
+    @classmethod
+    def signpost_index_cache_key(cls, csv_path) -> CacheKey:
+        path = Path(csv_path).resolve()
+        stat = path.stat()
+        return (
+            str(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            "signpost_index",
+            cls.REPORT_CACHE_VERSION,
+        )
+
+    @classmethod
+    def cached_signpost_index(cls, csv_path) -> Optional[OpsPerfResultsIndex]:
+        """The signposts of ``csv_path`` from ``perf_report_cache``, without columns."""
+        body = perf_report_cache.get(cls.signpost_index_cache_key(csv_path))
+        if body is None:
+            return None
+        cached = orjson.loads(body)
+        return OpsPerfResultsIndex(
+            row_count=cached["row_count"],
+            signpost_occurrences=cached["signpost_occurrences"],
+            columns={},
+            data_offset=cached["data_offset"],
+        )
+
+    @classmethod
+    def cache_signpost_index(cls, csv_path, results_index: OpsPerfResultsIndex):
+        perf_report_cache.put(
+            cls.signpost_index_cache_key(csv_path),
+            orjson.dumps(
+                {
+                    "row_count": results_index.row_count,
+                    "signpost_occurrences": results_index.signpost_occurrences,
+                    "data_offset": results_index.data_offset,
+                }
+            ),
+        )
+
+    @classmethod
+    def generate_report(cls, instance, **kwargs):
+        csv_path = OpsPerformanceQueries.get_local_ops_perf_file_path(instance)
+        start_signpost = kwargs.get("start_signpost", cls.DEFAULT_START_SIGNPOST)
+        end_signpost = kwargs.get("end_signpost", cls.DEFAULT_END_SIGNPOST)
+        print_signposts = kwargs.get("print_signposts", cls.DEFAULT_PRINT_SIGNPOSTS)
+
+        with open(csv_path, "rb") as csv_file:
+            # The signpost index is kept with the cached reports, so a signpost
+            # range can be cut out of the CSV without first reading all of it.
+            signpost_index = cls.cached_signpost_index(csv_path)
+            results_index = None
+            if signpost_index is None:
+                # One pass for the row count, signposts and the raw columns the
+                # report rows are enriched with below.
+                results_index = signpost_index = cls.index_ops_perf_results(csv_file)
+                cls.cache_signpost_index(csv_path, signpost_index)
+
+            window = None
+            if start_signpost or end_signpost:
+                window = cls.signpost_window(
+                    signpost_index,
+                    start_signpost,
+                    end_signpost,
+                    kwargs.get("start_signpost_ordinal"),
+                    kwargs.get("end_signpost_ordinal"),
+                )
+
+            # Validate that we have CSV data with rows
+            data_row_count = window.row_count if window else signpost_index.row_count
+            logger.info(f"CSV has {data_row_count + 1} lines (header + data rows)")
+
+            if data_row_count < 1:
+                raise DataFormatError(
+                    f"CSV must have at least header + 1 data row, got {data_row_count + 1} lines"
+                )
+
+            if results_index is None:
+                csv_file.seek(0)
+                results_index = cls.index_ops_perf_results(csv_file, window)
+
+            report_csv_path = csv_path
+            if window is not None:
+                # tt-perf-report only sees the rows in the range, so its ids
+                # count from the window's first row.
+                with tempfile.NamedTemporaryFile(
+                    suffix=".csv", delete=False
+                ) as window_file:
+                    report_csv_path = window_file.name
+                    cls.write_signpost_window(
+                        csv_file, signpost_index.data_offset, window, window_file
+                    )
 
         # Determine if we should skip stacked report
-        data_row_count = len(csv_lines) - 1
         no_stacked_report = kwargs.get(
             "no_stacked_report", cls.DEFAULT_NO_STACKED_REPORT
         )
@@ -583,22 +2425,24 @@ class OpsPerformanceReportQueries:
             csv_summary_file.close()
             csv_output_file.close()
 
-            start_signpost = kwargs.get("start_signpost", cls.DEFAULT_START_SIGNPOST)
-            end_signpost = kwargs.get("end_signpost", cls.DEFAULT_END_SIGNPOST)
-            print_signposts = kwargs.get("print_signposts", cls.DEFAULT_PRINT_SIGNPOSTS)
             no_host_ops = kwargs.get("hide_host_ops", cls.DEFAULT_NO_HOST_OPS)
             merge_devices = kwargs.get("merge_devices", cls.DEFAULT_MERGE_DEVICES)
             tracing_mode = kwargs.get("tracing_mode", cls.DEFAULT_TRACING_MODE)
             group_by = kwargs.get("group_by", cls.DEFAULT_GROUP_BY)
 
-            if start_signpost or end_signpost:
+            if window is not None:
+                # Already cut to the range, which tt-perf-report would otherwise
+                # find by loading the whole file
+                start_signpost = end_signpost = None
+                ignore_signposts = True
+            elif start_signpost or end_signpost:
                 ignore_signposts = False
             else:
                 ignore_signposts = cls.DEFAULT_IGNORE_SIGNPOSTS
 
             try:
                 perf_report.generate_perf_report(
-                    [csv_file],
+                    [report_csv_path],
                     start_signpost,
                     end_signpost,
                     ignore_signposts,
@@ -625,14 +2469,9 @@ class OpsPerformanceReportQueries:
                 logger.error(f"Full traceback:\n{traceback.format_exc()}")
                 raise DataFormatError(e)
 
-            try:
-                ops_perf_results, signposts = cls.extract_signposts(csv_file)
-            except Exception as e:
-                logger.error(f"Error extracting signposts: {e}")
-                ops_perf_results = []
-                signposts = []
-
+            signposts = signpost_index.signposts
             logger.info(f"Found {len(signposts)} signposts...")
+            first_row = window.first_row if window else 0
 
             report = []
 
@@ -652,10 +2491,19 @@ class OpsPerformanceReportQueries:
                             else:
                                 for row in reader:
                                     try:
-                                        op_id = int(row[0])
                                         # IDs in result column one correspond to row numbers in ops perf results csv
+                                        op_id = int(row[0]) + first_row
                                         idx = op_id - 2
 
+                                        # Signposts inside a window are kept by ignore_signposts
+                                        if (
+                                            window is not None
+                                            and not print_signposts
+                                            and results_index.value(idx, "OP TYPE")
+                                            == "signpost"
+                                        ):
+                                            continue
+
                                         processed_row = {
                                             column: row[index]
                                             for index, column in enumerate(
@@ -664,6 +2512,9 @@ class OpsPerformanceReportQueries:
                                             if index < len(row)
                                         }
 
+                                        if "id" in processed_row:
+                                            processed_row["id"] = str(op_id)
+
                                         if (
                                             "advice" in processed_row
                                             and processed_row["advice"]
@@ -678,20 +2529,23 @@ class OpsPerformanceReportQueries:
                                             key,
                                             value,
                                         ) in cls.PASSTHROUGH_COLUMNS.items():
-                                            if 0 <= idx < len(ops_perf_results):
-                                                processed_row[key] = ops_perf_results[
-                                                    idx
-                                                ].get(value)
-                                            else:
-                                                processed_row[key] = None
+                                            processed_row[key] = results_index.value(
+                                                idx, value
+                                            )
 
                                         # Get the op type from the raw file for this row as it is not returned from tt-perf-report
                                         cls.set_op_type_from_results(
-                                            processed_row, idx, ops_perf_results
+                                            processed_row, idx, results_index
                                         )
 
                                         cls.set_hash_from_results(
-                                            processed_row, idx, ops_perf_results
+                                            processed_row, idx, results_index
+                                        )
+
+                                        processed_row["input_shapes"] = (
+                                            results_index.value(
+                                                idx, cls.INPUT_SHAPES_COLUMN
+                                            )
                                         )
 
                                         report.append(processed_row)
@@ -763,10 +2617,20 @@ class OpsPerformanceReportQueries:
                 "report": report,
                 "stacked_report": stacked_report,
                 "signposts": signposts,
+                "signpost_occurrences": [
+                    {key: occurrence[key] for key in ("id", "op_code", "ordinal")}
+                    for occurrence in signpost_index.signpost_occurrences
+                ],
             }
 
         finally:
             # Ensure cleanup always happens, even if exceptions are raised
-            cls.cleanup_temp_files(
-                [csv_output_file, summary_csv_path, summary_png_path, csv_summary_file]
-            )
+            temp_files = [
+                csv_output_file,
+                summary_csv_path,
+                summary_png_path,
+                csv_summary_file,
+            ]
+            if window is not None:
+                temp_files.append(report_csv_path)
+            cls.cleanup_temp_files(temp_files)
@@ -20,6 +20,7 @@ from ttnn_visualizer.exceptions import (
     SSHException,
 )
 from ttnn_visualizer.instances import get_or_create_instance
+from ttnn_visualizer.offload import get_concurrency_limit
 from ttnn_visualizer.ssh_client import SSH_AUTH_FAILURE_MESSAGE
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,25 @@ def with_instance(func):
     return wrapper
 
 
+def concurrency_limit(name: str, max_concurrent: int, max_queued: int):
+    """
+    Let at most ``max_concurrent`` requests run the route at once and up to
+    ``max_queued`` more wait; further requests get 503 straight away.
+    Routes decorated with the same ``name`` share one limit.
+    """
+    limit = get_concurrency_limit(name, max_concurrent, max_queued)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with limit.acquire():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 def remote_exception_handler(func):
     from flask import current_app
 
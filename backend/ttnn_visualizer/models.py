@@ -35,6 +35,37 @@ class Operation(SerializeableDataclass):
     rank: int = 0
 
 
+@dataclasses.dataclass
+class OperationRankSummary(SerializeableDataclass):
+    """
+    Cross-rank duration statistics for one operation in a multi-host report.
+
+    ``max_rank`` is the rank that recorded ``max_duration`` — the straggler.
+    ``stddev_duration`` is the population standard deviation across ranks.
+    """
+
+    operation_id: int
+    name: str
+    rank_count: int
+    min_duration: Optional[float]
+    max_duration: Optional[float]
+    mean_duration: Optional[float]
+    stddev_duration: Optional[float]
+    max_rank: int
+
+
+@dataclasses.dataclass
+class OperationBufferTotals(SerializeableDataclass):
+    """Per-(operation, device) buffer totals; sizes are per bank."""
+
+    operation_id: int
+    device_id: int
+    buffer_count: int
+    total_size: int
+    l1_size: int
+    rank: int = 0
+
+
 @dataclasses.dataclass
 class Device(SerializeableDataclass):
     device_id: int
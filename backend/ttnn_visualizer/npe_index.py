@@ -0,0 +1,331 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Chunked index of NPE timelines for windowed, level-of-detail reads.
+
+An NPE timeline records link demand for every timestep, which for long runs
+is far more than the frontend can draw at once. The first windowed read
+builds an index file beside the timeline: a manifest with a small summary of
+every timestep and of every ``CHUNK_TIMESTEPS``-timestep chunk, followed by
+the chunks' raw timesteps and transfers, each zstd-compressed. A window then
+returns either summary buckets or, once zoomed in far enough, the raw
+timesteps and transfers of just the chunks it overlaps.
+
+Index layout: an 8-byte little-endian manifest length, the JSON manifest,
+then the chunk blobs at the offsets the manifest lists.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import orjson
+import zstd
+from ttnn_visualizer.csv_queries import NPEQueries
+from ttnn_visualizer.offload import run_in_process
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".index"
+CHUNK_TIMESTEPS = 256
+DEFAULT_RESOLUTION = 1000
+MAX_RESOLUTION = 10_000
+
+MANIFEST_LENGTH = struct.Struct("<Q")
+
+
+def index_path(timeline_path: Union[str, Path]) -> Path:
+    """Beside the timeline, hidden so it stays out of NPE file listings."""
+    timeline_path = Path(timeline_path)
+    return timeline_path.with_name(f".{timeline_path.name}{INDEX_SUFFIX}")
+
+
+def fallback_index_path(timeline_path: Union[str, Path]) -> Path:
+    """For timelines in directories that can't be written to."""
+    digest = hashlib.sha256(str(Path(timeline_path).resolve()).encode()).hexdigest()
+    return Path(tempfile.gettempdir(), "ttnn-visualizer-npe-index", digest)
+
+
+def load_timeline(timeline_path: Union[str, Path]) -> Dict:
+    if str(timeline_path).endswith(".zst"):
+        return orjson.loads(b"".join(NPEQueries.iter_decompressed(timeline_path)))
+    return orjson.loads(Path(timeline_path).read_bytes())
+
+
+def _summarize_timesteps(timesteps: List[Dict]) -> Dict[str, np.ndarray]:
+    return {
+        "start_cycle": np.array([t["start_cycle"] for t in timesteps], dtype=np.int64),
+        "end_cycle": np.array([t["end_cycle"] for t in timesteps], dtype=np.int64),
+        "avg_link_util": np.array(
+            [t.get("avg_link_util", 0) for t in timesteps], dtype=np.float64
+        ),
+        "avg_link_demand": np.array(
+            [t.get("avg_link_demand", 0) for t in timesteps], dtype=np.float64
+        ),
+        # link_demand entries are [device, row, col, noc_id, demand, ...]
+        "max_link_demand": np.array(
+            [
+                max((link[4] for link in t.get("link_demand", ())), default=0)
+                for t in timesteps
+            ],
+            dtype=np.float64,
+        ),
+        "active_transfers": np.array(
+            [len(t.get("active_transfers", ())) for t in timesteps], dtype=np.int64
+        ),
+    }
+
+
+def _aggregate(
+    columns: Dict[str, np.ndarray], boundaries: np.ndarray
+) -> List[Dict[str, Union[int, float]]]:
+    """
+    Summaries of the timestep ranges starting at each of ``boundaries``.
+    Means are of the timesteps' own averages.
+    """
+    if len(boundaries) == 0:
+        return []
+    counts: np.ndarray = np.diff(np.append(boundaries, len(columns["start_cycle"])))
+    start_cycles = columns["start_cycle"][boundaries]
+    end_cycles = np.maximum.reduceat(columns["end_cycle"], boundaries)
+    util = np.add.reduceat(columns["avg_link_util"], boundaries) / counts
+    demand = np.add.reduceat(columns["avg_link_demand"], boundaries) / counts
+    max_demand = np.maximum.reduceat(columns["max_link_demand"], boundaries)
+    # Peak concurrent transfers within the range
+    transfers = np.maximum.reduceat(columns["active_transfers"], boundaries)
+    return [
+        {
+            "start_cycle": int(start_cycles[i]),
+            "end_cycle": int(end_cycles[i]),
+            "timesteps": int(counts[i]),
+            "avg_link_util": float(util[i]),
+            "avg_link_demand": float(demand[i]),
+            "max_link_demand": float(max_demand[i]),
+            "active_transfers": int(transfers[i]),
+        }
+        for i in range(len(boundaries))
+    ]
+
+
+def build_index(timeline_path: str) -> str:
+    """
+    Index the timeline at ``timeline_path`` and return where the index was
+    written. Runs in a pool process, so takes and returns only strings.
+    """
+    stat = Path(timeline_path).stat()
+    timeline = load_timeline(timeline_path)
+    timesteps = sorted(
+        timeline.get("timestep_data", []), key=lambda t: t["start_cycle"]
+    )
+    transfers = timeline.get("noc_transfers", [])
+    columns = _summarize_timesteps(timesteps)
+
+    chunk_starts = np.arange(0, len(timesteps), CHUNK_TIMESTEPS)
+    chunk_summaries = _aggregate(columns, chunk_starts)
+
+    # A transfer is stored with every chunk whose cycles it overlaps, along
+    # with its position in the timeline so a window can drop the repeats
+    chunk_transfers: List[List[Dict]] = [[] for _ in chunk_starts]
+    chunk_ordinals: List[List[int]] = [[] for _ in chunk_starts]
+    if len(chunk_starts):
+        chunk_start_cycles = np.array([c["start_cycle"] for c in chunk_summaries])
+        chunk_end_cycles = np.array([c["end_cycle"] for c in chunk_summaries])
+        for ordinal, transfer in enumerate(transfers):
+            first = np.searchsorted(chunk_end_cycles, transfer["start_cycle"], "right")
+            last = np.searchsorted(chunk_start_cycles, transfer["end_cycle"], "right")
+            for chunk in range(first, last):
+                chunk_transfers[chunk].append(transfer)
+                chunk_ordinals[chunk].append(ordinal)
+
+    blobs = []
+    offset = 0
+    for chunk, start in enumerate(chunk_starts):
+        blob = zstd.compress(
+            orjson.dumps(
+                {
+                    "timestep_data": timesteps[start : start + CHUNK_TIMESTEPS],
+                    "noc_transfers": chunk_transfers[chunk],
+                    "noc_transfer_ordinals": chunk_ordinals[chunk],
+                }
+            )
+        )
+        chunk_summaries[chunk].update(offset=offset, length=len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+
+    manifest = orjson.dumps(
+        {
+            "version": INDEX_VERSION,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "common_info": timeline.get("common_info", {}),
+            "chips": timeline.get("chips", {}),
+            "timesteps": {name: values.tolist() for name, values in columns.items()},
+            "chunks": chunk_summaries,
+        }
+    )
+
+    for path in (index_path(timeline_path), fallback_index_path(timeline_path)):
+        partial = path.with_name(f".{path.name}.partial")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(partial, "wb") as file:
+                file.write(MANIFEST_LENGTH.pack(len(manifest)))
+                file.write(manifest)
+                for blob in blobs:
+                    file.write(blob)
+            os.replace(partial, path)
+        except OSError as e:
+            logger.warning(f"Could not write NPE timeline index {path}: {e}")
+            partial.unlink(missing_ok=True)
+            continue
+        logger.info(f"Wrote NPE timeline index {path}")
+        return str(path)
+    raise OSError(f"Could not write an index for {timeline_path}")
+
+
+@lru_cache(maxsize=8)
+def _read_manifest(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parsed once per index file version; mtime and size key the cache."""
+    with open(path, "rb") as file:
+        (length,) = MANIFEST_LENGTH.unpack(file.read(MANIFEST_LENGTH.size))
+        manifest = orjson.loads(file.read(length))
+    manifest["data_offset"] = MANIFEST_LENGTH.size + length
+    manifest["timesteps"] = {
+        name: np.asarray(values) for name, values in manifest["timesteps"].items()
+    }
+    return manifest
+
+
+class NPETimelineIndex:
+    def __init__(self, path: Path, manifest: Dict):
+        self.path = path
+        self.manifest = manifest
+
+    @classmethod
+    def find(cls, timeline_path: Union[str, Path]) -> Optional["NPETimelineIndex"]:
+        """The up-to-date index of ``timeline_path``, if one has been built."""
+        stat = Path(timeline_path).stat()
+        for path in (index_path(timeline_path), fallback_index_path(timeline_path)):
+            try:
+                index_stat = path.stat()
+                manifest = _read_manifest(
+                    str(path), index_stat.st_mtime_ns, index_stat.st_size
+                )
+            except (OSError, ValueError, struct.error):
+                continue
+            if (
+                manifest.get("version") == INDEX_VERSION
+                and manifest.get("source_mtime_ns") == stat.st_mtime_ns
+                and manifest.get("source_size") == stat.st_size
+            ):
+                return cls(path, manifest)
+        return None
+
+    @classmethod
+    def load(cls, timeline_path: Union[str, Path]) -> "NPETimelineIndex":
+        """The index of ``timeline_path``, built in the process pool if stale."""
+        index = cls.find(timeline_path)
+        if index is None:
+            run_in_process(build_index, str(timeline_path))
+            index = cls.find(timeline_path)
+        if index is None:
+            raise OSError(f"NPE timeline index for {timeline_path} is unreadable")
+        return index
+
+    def _timestep_range(self, start: Optional[int], end: Optional[int]):
+        """Indices of the timesteps overlapping cycles ``start``..``end``."""
+        timesteps = self.manifest["timesteps"]
+        first = 0
+        last = len(timesteps["start_cycle"])
+        if start is not None:
+            first = int(np.searchsorted(timesteps["end_cycle"], start, "right"))
+        if end is not None:
+            last = int(np.searchsorted(timesteps["start_cycle"], end, "right"))
+        return first, max(first, last)
+
+    def _read_chunks(self, first_chunk: int, last_chunk: int) -> List[Dict]:
+        chunks = self.manifest["chunks"][first_chunk:last_chunk]
+        if not chunks:
+            return []
+        data_offset = self.manifest["data_offset"]
+        with open(self.path, "rb") as file:
+            file.seek(data_offset + chunks[0]["offset"])
+            data = file.read(sum(chunk["length"] for chunk in chunks))
+        decoded = []
+        position = 0
+        for chunk in chunks:
+            blob = data[position : position + chunk["length"]]
+            decoded.append(orjson.loads(zstd.uncompress(blob)))
+            position += chunk["length"]
+        return decoded
+
+    def window(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        resolution: int = DEFAULT_RESOLUTION,
+    ) -> Dict:
+        """
+        The timesteps overlapping cycles ``start`` to ``end``: raw, with the
+        transfers active in them, when there are at most ``resolution`` of
+        them, otherwise summarized into ``resolution`` buckets.
+        """
+        resolution = min(max(resolution, 1), MAX_RESOLUTION)
+        first, last = self._timestep_range(start, end)
+        timesteps = self.manifest["timesteps"]
+        count = last - first
+        result = {
+            "common_info": self.manifest["common_info"],
+            "chips": self.manifest["chips"],
+            "start_cycle": int(timesteps["start_cycle"][first]) if count else start,
+            "end_cycle": int(timesteps["end_cycle"][last - 1]) if count else end,
+            "timesteps": count,
+        }
+
+        if count > resolution:
+            window = {name: values[first:last] for name, values in timesteps.items()}
+            boundaries = np.unique(
+                np.linspace(0, count, resolution, endpoint=False).astype(np.int64)
+            )
+            result["level"] = "summary"
+            result["summary"] = _aggregate(window, boundaries)
+            return result
+
+        result["level"] = "raw"
+        result["timestep_data"] = []
+        result["noc_transfers"] = []
+        if not count:
+            return result
+
+        first_chunk = first // CHUNK_TIMESTEPS
+        chunks = self._read_chunks(first_chunk, -(-last // CHUNK_TIMESTEPS))
+        chunk_offset = first_chunk * CHUNK_TIMESTEPS
+        timestep_data = [t for chunk in chunks for t in chunk["timestep_data"]]
+        result["timestep_data"] = timestep_data[
+            first - chunk_offset : last - chunk_offset
+        ]
+
+        # Transfers spanning several chunks are stored with each of them, so
+        # keep one per timeline position, in timeline order
+        transfers = {}
+        for chunk in chunks:
+            for ordinal, transfer in zip(
+                chunk["noc_transfer_ordinals"], chunk["noc_transfers"]
+            ):
+                if (
+                    transfer["end_cycle"] >= result["start_cycle"]
+                    and transfer["start_cycle"] <= result["end_cycle"]
+                ):
+                    transfers[ordinal] = transfer
+        result["noc_transfers"] = [transfers[o] for o in sorted(transfers)]
+        return result
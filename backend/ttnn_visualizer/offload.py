@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Keep CPU-bound work off the gevent event loop.
+
+Under the gevent worker every request shares one OS thread, so a long pandas
+parse or tt-perf-report run stalls all other requests, health checks
+included. Work that releases the GIL (zstd, the pandas C parser) runs on
+gevent's native threadpool via ``run_in_thread``; pure-Python work runs in a
+shared spawned process pool via ``run_in_process``. ``ConcurrencyLimit``
+bounds how many requests of one kind may run or wait at once.
+
+Outside gevent (tests, the threaded dev server) ``run_in_thread`` calls the
+function directly, since the caller is already on its own thread.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, TypeVar
+
+from gevent import get_hub, monkey
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def run_in_thread(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run GIL-releasing ``fn`` on gevent's threadpool, yielding meanwhile."""
+    if not monkey.is_module_patched("threading"):
+        return fn(*args, **kwargs)
+    return get_hub().threadpool.apply(fn, args, kwargs)
+
+
+class ProcessOffload:
+    """A lazily started, shared process pool that replaces itself if broken."""
+
+    def __init__(self):
+        self.max_workers = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def configure(self, max_workers: int):
+        """``max_workers`` of 0 sizes the pool by CPU count."""
+        with self._lock:
+            self.max_workers = max_workers
+
+    def executor(self) -> Executor:
+        with self._lock:
+            # _broken is set once a worker dies; such a pool rejects submits
+            if self._executor is None or getattr(self._executor, "_broken", False):
+                if self._executor is not None:
+                    logger.warning("Process pool is broken; starting a new one")
+                    self._executor.shutdown(wait=False)
+                # Spawned, not forked: a fork would copy the gevent hub and any
+                # open sockets into every worker.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers or os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def submit(self, fn: Callable[..., T], *args) -> "Future[T]":
+        """``fn`` and its arguments must be picklable (module-level)."""
+        return self.executor().submit(fn, *args)
+
+    def shutdown(self):
+        """Stop the pool, terminating workers mid-job rather than waiting."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        workers = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for worker in workers:
+            worker.terminate()
+
+
+process_offload = ProcessOffload()
+# Work nobody is waiting on (e.g. reports for the trend store), kept off the
+# pool that serves requests
+background_offload = ProcessOffload()
+
+
+def shutdown_offload():
+    """
+    Stop both process pools, terminating any jobs still running. The app
+    factory registers this with ``atexit``; concurrent.futures waits for
+    running jobs before atexit hooks run, so call it directly to exit mid-job.
+    """
+    background_offload.shutdown()
+    process_offload.shutdown()
+
+
+def run_in_process(fn: Callable[..., T], *args) -> T:
+    """Run pure-Python ``fn`` in the shared process pool and wait for it."""
+    return process_offload.submit(fn, *args).result()
+
+
+class ConcurrencyLimitExceeded(Exception):
+    pass
+
+
+class ConcurrencyLimit:
+    """
+    At most ``max_concurrent`` holders at once, with up to ``max_queued`` more
+    waiting for a slot. Beyond that, ``acquire`` raises immediately so excess
+    load is refused rather than piling up behind a slow operation.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queued: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.rejected = 0
+
+    @contextmanager
+    def acquire(self):
+        with self._lock:
+            if self.admitted >= self.max_concurrent + self.max_queued:
+                self.rejected += 1
+                raise ConcurrencyLimitExceeded(
+                    f"Too many concurrent {self.name} requests; try again shortly"
+                )
+            self.admitted += 1
+        try:
+            with self._slots:
+                yield
+        finally:
+            with self._lock:
+                self.admitted -= 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "running": min(self.admitted, self.max_concurrent),
+                "queued": max(self.admitted - self.max_concurrent, 0),
+                "max_concurrent": self.max_concurrent,
+                "max_queued": self.max_queued,
+                "rejected": self.rejected,
+            }
+
+
+concurrency_limits: Dict[str, ConcurrencyLimit] = {}
+
+
+def get_concurrency_limit(
+    name: str, max_concurrent: int, max_queued: int
+) -> ConcurrencyLimit:
+    """
+    The limit registered under ``name``, created on first use. Every use of
+    a name must ask for the same bounds, or the first registration would
+    silently win.
+    """
+    limit = concurrency_limits.setdefault(
+        name, ConcurrencyLimit(name, max_concurrent, max_queued)
+    )
+    if (limit.max_concurrent, limit.max_queued) != (max_concurrent, max_queued):
+        raise ValueError(
+            f"Concurrency limit '{name}' is registered with max_concurrent="
+            f"{limit.max_concurrent}, max_queued={limit.max_queued}"
+        )
+    return limit
@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Join a memory report's operations with the rows of a perf report.
+
+Neither file names the other's ids, so operations are aligned the way the
+frontend has always done it: each operation's device operations (the
+``function_start`` nodes of its captured graph that name a device op) are
+listed in ``operation_id`` order and matched position by position with the
+perf report's device op rows, checking that ``raw_op_code`` agrees. Operations
+repeated once per device are collapsed first, like the perf report's merged
+devices. Alignment stops at the first disagreement, so a report pair that
+doesn't describe the same run maps only its common prefix.
+"""
+
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from ttnn_visualizer.csv_queries import CacheKey
+from ttnn_visualizer.models import Operation
+from ttnn_visualizer.queries import DatabaseQueries
+
+# Graph nodes with these in their name are host-side functions, not device ops
+HOST_FUNCTION_MARKERS = ("(torch)", "::", "ttnn.")
+
+# Perf report columns carried into the joined view, parsed as numbers
+PERF_NUMBER_COLUMNS = ("device_time", "op_to_op_gap", "flops_percent", "dram_percent")
+
+DeviceOperationMapping = List[Tuple[int, str]]
+
+
+def is_device_operation(name: str) -> bool:
+    return bool(name) and not any(marker in name for marker in HOST_FUNCTION_MARKERS)
+
+
+def device_operation_names(captured_graph: str) -> List[str]:
+    """Device ops started in a captured graph, in graph order."""
+    try:
+        nodes = orjson.loads(captured_graph)
+    except orjson.JSONDecodeError:
+        return []
+    if not isinstance(nodes, list):
+        return []
+    return [
+        node["params"]["name"]
+        for node in nodes
+        if node.get("node_type") == "function_start"
+        and is_device_operation((node.get("params") or {}).get("name", ""))
+    ]
+
+
+def map_device_operations(
+    db: DatabaseQueries, operations: List[Operation], rank: Optional[int] = None
+) -> DeviceOperationMapping:
+    """
+    ``(operation_id, device op name)`` for every device op of ``operations``,
+    in execution order, with per-device repeats collapsed.
+    """
+    device_count = len(
+        list(db.query_devices(db.merge_rank_filter("devices", None, rank)))
+    )
+    graphs = {
+        device_operation.operation_id: device_operation.captured_graph
+        for device_operation in db.query_device_operations(
+            db.merge_rank_filter("captured_graph", None, rank)
+        )
+    }
+    operation_ids = sorted({operation.operation_id for operation in operations})
+    return [
+        (operation_id, name)
+        for operation_id in operation_ids
+        for name in collapse_device_repeats(
+            device_operation_names(graphs.get(operation_id, "[]")), device_count
+        )
+    ]
+
+
+def collapse_device_repeats(names: List[str], device_count: int) -> List[str]:
+    """
+    An op launched on every device shows up once per device in its graph, so
+    each name keeps its count divided by ``device_count``, plus the remainder
+    of launches on fewer devices. The first occurrences are kept, in order.
+    """
+    if device_count <= 1:
+        return names
+    kept = {
+        name: count // device_count + count % device_count
+        for name, count in Counter(names).items()
+    }
+    collapsed = []
+    for name in names:
+        if kept[name]:
+            collapsed.append(name)
+            kept[name] -= 1
+    return collapsed
+
+
+def _number(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def join_operations_with_perf(
+    db: DatabaseQueries, report: List[Dict], rank: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    One column per field over every matched device op: its operation, perf
+    report row and the operation's buffer totals. Peak L1 is the largest
+    per-bank L1 footprint on any one device.
+    """
+    operations = list(
+        db.query_operations(db.merge_rank_filter("operations", None, rank))
+    )
+    mapping = map_device_operations(db, operations, rank)
+    perf_rows = [row for row in report if row.get("op_type") != "signpost"]
+
+    matched = 0
+    for (_, name), row in zip(mapping, perf_rows):
+        if row.get("raw_op_code") != name:
+            break
+        matched += 1
+
+    # Multi-rank reports list an operation once per rank; the first is kept
+    by_id: Dict[int, Operation] = {}
+    for operation in operations:
+        by_id.setdefault(operation.operation_id, operation)
+    buffer_counts: Dict[int, int] = {}
+    peak_l1: Dict[int, int] = {}
+    matched_ids = {operation_id for operation_id, _ in mapping[:matched]}
+    if matched_ids:
+        for totals in db.query_operation_buffer_totals(
+            db.merge_rank_filter("buffers", None, rank)
+        ):
+            if totals.operation_id not in matched_ids:
+                continue
+            buffer_counts[totals.operation_id] = (
+                buffer_counts.get(totals.operation_id, 0) + totals.buffer_count
+            )
+            peak_l1[totals.operation_id] = max(
+                peak_l1.get(totals.operation_id, 0), totals.l1_size or 0
+            )
+
+    columns: Dict[str, List[Any]] = {
+        "operation_id": [],
+        "operation_name": [],
+        "device_operation": [],
+        "perf_id": [],
+        "global_call_count": [],
+        "duration": [],
+        "bound": [],
+        **{column: [] for column in PERF_NUMBER_COLUMNS},
+        "peak_l1": [],
+        "buffer_count": [],
+    }
+    for (operation_id, name), row in zip(mapping[:matched], perf_rows):
+        columns["operation_id"].append(operation_id)
+        columns["operation_name"].append(by_id[operation_id].name)
+        columns["device_operation"].append(name)
+        columns["perf_id"].append(row.get("id"))
+        global_call_count = _number(row.get("global_call_count"))
+        columns["global_call_count"].append(
+            None if global_call_count is None else int(global_call_count)
+        )
+        columns["duration"].append(by_id[operation_id].duration)
+        columns["bound"].append(row.get("bound") or None)
+        for column in PERF_NUMBER_COLUMNS:
+            columns[column].append(_number(row.get(column)))
+        columns["peak_l1"].append(peak_l1.get(operation_id, 0))
+        columns["buffer_count"].append(buffer_counts.get(operation_id, 0))
+
+    return {
+        "columns": columns,
+        "matched": matched,
+        "device_operations": len(mapping),
+        "perf_rows": len(perf_rows),
+    }
+
+
+def joined_cache_key(
+    report_key: CacheKey, profiler_path: str, rank: Optional[int]
+) -> CacheKey:
+    """The perf report's cache key extended with the memory report file's."""
+    path = Path(profiler_path).resolve()
+    stat = path.stat()
+    return (*report_key, str(path), stat.st_mtime_ns, stat.st_size, rank, "joined")
@@ -0,0 +1,315 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Background perf report generation.
+
+``tt_perf_report`` can take minutes on large ops perf CSVs, longer than a
+gunicorn worker may block. Jobs run in the shared offload process pool
+instead; identical in-flight requests share one job, status changes are
+pushed over socketio, and queued jobs are cancelled once no connected tab is
+waiting for them. Background jobs, which nobody waits on, run in their own
+single-process pool and give way to a request for the same report while
+still queued.
+"""
+
+import logging
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Executor, Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Set
+
+import orjson
+from ttnn_visualizer.csv_queries import (
+    CacheKey,
+    OpsPerformanceQueries,
+    OpsPerformanceReportQueries,
+    perf_report_cache,
+)
+from ttnn_visualizer.exceptions import PerformanceReportNotLoadedException
+from ttnn_visualizer.models import Instance
+from ttnn_visualizer.offload import background_offload, process_offload
+from ttnn_visualizer.perf_trends import PerfTrendStore, perf_trend_store
+from ttnn_visualizer.sockets import (
+    ReportJobStatus,
+    ReportJobUpdate,
+    emit_report_job_update,
+)
+
+logger = logging.getLogger(__name__)
+
+# Subscribes the jobs started for the trend store; no tab disconnect cancels them
+TREND_SUBSCRIBER = "perf-trends"
+# The report page's default options, so its first load is a cache hit
+TREND_REPORT_OPTIONS = {
+    "print_signposts": True,
+    "hide_host_ops": True,
+    "merge_devices": True,
+    "tracing_mode": False,
+}
+
+
+def records_trends(options: Dict) -> bool:
+    """Only whole-run reports with merged devices are comparable across runs."""
+    return (
+        not options.get("start_signpost")
+        and not options.get("end_signpost")
+        and options.get(
+            "merge_devices", OpsPerformanceReportQueries.DEFAULT_MERGE_DEVICES
+        )
+    )
+
+
+def generate_report_body(
+    performance_path: str,
+    options: Dict,
+    trend_store_path: Optional[str] = None,
+    report_cache_directory: Optional[str] = None,
+    report_cache_max_bytes: int = 0,
+) -> bytes:
+    """
+    Worker entry point; runs in a pool process, so takes only picklable args.
+    A spawned worker starts with ``perf_report_cache`` unconfigured, so its
+    settings are passed in for the signpost index kept there.
+    """
+    if report_cache_directory:
+        perf_report_cache.configure(report_cache_directory, report_cache_max_bytes)
+    instance = Instance(instance_id="report-job", performance_path=performance_path)
+    report = OpsPerformanceReportQueries.generate_report(instance, **options)
+    if trend_store_path and records_trends(options):
+        try:
+            PerfTrendStore(trend_store_path).record_run(
+                performance_path,
+                OpsPerformanceQueries.get_local_ops_perf_file_path(instance),
+                report["report"],
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not record perf trends of {performance_path}: {e}")
+    return orjson.dumps(report)
+
+
+@dataclass
+class ReportJob:
+    job_id: str
+    key: CacheKey
+    status: ReportJobStatus = ReportJobStatus.QUEUED
+    error: Optional[str] = None
+    # Kept only when the report cache couldn't take the body
+    result: Optional[bytes] = None
+    # Tabs (instance ids) waiting on this job
+    subscribers: Set[str] = field(default_factory=set)
+    # Every tab that submitted it, which alone may look the job up
+    owners: Set[str] = field(default_factory=set)
+    # Requests blocked in ``ReportJobQueue.wait``
+    waiters: int = 0
+    # Submitted with ``background=True``, to the background pool
+    background: bool = False
+    future: Optional[Future] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "error": self.error,
+        }
+
+
+class ReportJobQueue:
+    # Finished jobs are kept for polling; the oldest are dropped past this
+    MAX_FINISHED_JOBS = 32
+
+    def __init__(
+        self,
+        executor_factory: Optional[Callable[[], Executor]] = None,
+        background_executor_factory: Optional[Callable[[], Executor]] = None,
+    ):
+        # Default to the shared offload and background process pools
+        self._executor_factory = executor_factory or process_offload.executor
+        self._background_executor_factory = (
+            background_executor_factory or background_offload.executor
+        )
+        self._jobs: "OrderedDict[str, ReportJob]" = OrderedDict()
+        self._in_flight: Dict[CacheKey, ReportJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self, instance: Instance, background: bool = False, **options
+    ) -> ReportJob:
+        """
+        Start generating the perf report for ``instance``, or join the
+        identical job already in flight. Served straight from the report
+        cache when possible. A ``background`` job runs in the background pool;
+        a request for the same report cancels it while it is still queued
+        and starts its own job in the request pool.
+        """
+        if not instance.performance_path:
+            raise PerformanceReportNotLoadedException()
+        key = OpsPerformanceReportQueries.report_cache_key(instance, **options)
+        cached = perf_report_cache.get(key)
+
+        if not background:
+            with self._lock:
+                queued = self._in_flight.get(key)
+            # Outside the lock: cancelling runs _finish, which takes it
+            if queued is not None and queued.background and queued.future:
+                if queued.future.cancel():
+                    logger.info(f"Cancelled background perf report {queued.job_id}")
+
+        submitted = None
+        with self._lock:
+            job = self._in_flight.get(key)
+            if job is None:
+                job = ReportJob(job_id=uuid.uuid4().hex, key=key, background=background)
+                self._jobs[job.job_id] = job
+                if cached is not None:
+                    # Served from the cache, so the body isn't kept here
+                    job.status = ReportJobStatus.FINISHED
+                else:
+                    self._in_flight[key] = job
+                    executor_factory = (
+                        self._background_executor_factory
+                        if background
+                        else self._executor_factory
+                    )
+                    submitted = job.future = executor_factory().submit(
+                        generate_report_body,
+                        instance.performance_path,
+                        options,
+                        (
+                            str(perf_trend_store.path)
+                            if perf_trend_store.enabled
+                            else None
+                        ),
+                        (
+                            str(perf_report_cache.directory)
+                            if perf_report_cache.enabled
+                            else None
+                        ),
+                        perf_report_cache.max_bytes,
+                    )
+                self._trim_finished()
+            job.subscribers.add(instance.instance_id)
+            job.owners.add(instance.instance_id)
+
+        # Outside the lock: the callback runs immediately if already done
+        if submitted is not None:
+            submitted.add_done_callback(lambda future: self._finish(job, future))
+        return job
+
+    def _finish(self, job: ReportJob, future: Future):
+        with self._lock:
+            try:
+                job.result = future.result()
+                job.status = ReportJobStatus.FINISHED
+            except CancelledError:
+                job.status = ReportJobStatus.CANCELLED
+            except Exception as e:
+                logger.error(f"Perf report job {job.job_id} failed: {e}")
+                job.status = ReportJobStatus.FAILED
+                job.error = str(e)
+            if self._in_flight.get(job.key) is job:
+                del self._in_flight[job.key]
+            subscribers = set(job.subscribers)
+
+        if job.result is not None and perf_report_cache.put(job.key, job.result):
+            # Finished jobs are kept for polling; only the cache keeps the body
+            with self._lock:
+                job.result = None
+                job.future = None
+        emit_report_job_update(
+            ReportJobUpdate(job_id=job.job_id, status=job.status, error=job.error),
+            subscribers,
+        )
+
+    def wait(self, job: ReportJob) -> bytes:
+        """
+        The report body once ``job`` is done, re-raising its error, or
+        ``CancelledError`` if it was cancelled before this wait began or its
+        body has since left the report cache. Waits cooperatively under
+        gevent; a job with waiters is never cancelled.
+        """
+        with self._lock:
+            future = job.future
+            if future is not None:
+                job.waiters += 1
+        if future is None:
+            body = self.result(job)
+            if body is None:
+                raise CancelledError(f"Perf report job {job.job_id} has no result")
+            return body
+        try:
+            return future.result()
+        finally:
+            with self._lock:
+                job.waiters -= 1
+
+    def result(self, job: ReportJob) -> Optional[bytes]:
+        """
+        The body of a finished ``job``: from the report cache, or from the job
+        itself when the cache couldn't take it. ``None`` until it finishes,
+        and once the cache has evicted it.
+        """
+        if job.status is not ReportJobStatus.FINISHED:
+            return None
+        with self._lock:
+            body = job.result
+        return body if body is not None else perf_report_cache.get(job.key)
+
+    def get(self, job_id: str, instance_id: str) -> Optional[ReportJob]:
+        """The job, if ``instance_id`` is one of the tabs that submitted it."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or instance_id not in job.owners:
+                return None
+            return job
+
+    def release(self, instance_id: str):
+        """
+        Called when a tab disconnects. Queued jobs no other tab or blocked
+        request waits on are cancelled; a job already running in a worker
+        can't be interrupted and is left to finish, so its result still lands
+        in the report cache.
+        """
+        with self._lock:
+            abandoned = []
+            for job in self._in_flight.values():
+                job.subscribers.discard(instance_id)
+                if not job.subscribers and not job.waiters:
+                    abandoned.append(job)
+        for job in abandoned:
+            if job.future is not None and job.future.cancel():
+                logger.info(f"Cancelled perf report job {job.job_id}")
+
+    def submit_for_trends(self, performance_path: str) -> Optional[ReportJob]:
+        """
+        Report a newly uploaded or synced run as a background job, which
+        records it in the trend store and warms the report cache. Nothing
+        happens when the trend store is off (``PERF_TRENDS_ENABLED``) or the
+        folder holds no ops perf CSV.
+        """
+        if not perf_trend_store.enabled:
+            return None
+        instance = Instance(
+            instance_id=TREND_SUBSCRIBER, performance_path=str(performance_path)
+        )
+        try:
+            return self.submit(instance, background=True, **TREND_REPORT_OPTIONS)
+        except FileNotFoundError:
+            logger.info(f"No ops perf results to report in {performance_path}")
+            return None
+
+    def _trim_finished(self):
+        finished = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status is not ReportJobStatus.QUEUED
+        ]
+        for job_id in finished[: max(len(finished) - self.MAX_FINISHED_JOBS, 0)]:
+            del self._jobs[job_id]
+
+
+report_jobs = ReportJobQueue()
@@ -0,0 +1,333 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Cross-run performance trends.
+
+Each whole-run perf report that is generated leaves a per-op summary in a
+local SQLite store: device time, FLOPs % and DRAM % keyed by op code, a hash
+of the op's input shapes and datatypes, and its global call count. Trend and
+regression queries are answered from the store's indexes, so comparing the
+last N runs never reloads their CSVs.
+
+Runs are ordered by the modification time of their ops perf CSV, and
+re-reporting the same CSV replaces its summaries rather than adding a run.
+There is one store per server, so trends span every run it has reported,
+whichever instance or user the run belongs to.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    performance_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    source_mtime_ns INTEGER NOT NULL,
+    source_size INTEGER NOT NULL,
+    recorded_at REAL NOT NULL,
+    UNIQUE (performance_path, source_mtime_ns, source_size)
+);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (source_mtime_ns);
+CREATE TABLE IF NOT EXISTS op_summaries (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    op_code TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    global_call_count INTEGER NOT NULL,
+    input_shapes TEXT,
+    input_datatypes TEXT,
+    device_time REAL NOT NULL,
+    flops_percent REAL,
+    dram_percent REAL,
+    PRIMARY KEY (op_code, signature, global_call_count, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS op_summaries_by_run ON op_summaries (run_id);
+"""
+
+DEFAULT_RUNS = 30
+MAX_RUNS = 1000
+DEFAULT_REGRESSION_THRESHOLD = 5.0
+DEFAULT_REGRESSION_LIMIT = 100
+
+
+def _number(value) -> Optional[float]:
+    """Report cells are strings, percentages sometimes with a ``%`` suffix."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(str(value).replace(",", "").rstrip(" %"))
+    except ValueError:
+        return None
+
+
+def input_signature(row: Dict) -> str:
+    """Hash of the input shapes and datatypes of a perf report row."""
+    parts = (
+        row.get("input_shapes") or "",
+        row.get("input_0_datatype") or "",
+        row.get("input_1_datatype") or "",
+    )
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:16]
+
+
+def summarize_report(report: Iterable[Dict]) -> List[Dict]:
+    """
+    One summary per device op in a perf report. Rows that share a key (the
+    same op on several devices when they aren't merged) keep the slowest.
+    """
+    summaries: Dict[Tuple[str, str, int], Dict] = {}
+    for row in report:
+        device_time = _number(row.get("device_time"))
+        global_call_count = _number(row.get("global_call_count"))
+        if (
+            not row.get("op_code")
+            or row.get("op_type") == "signpost"
+            or device_time is None
+            or global_call_count is None
+        ):
+            continue
+        datatypes = [row.get("input_0_datatype"), row.get("input_1_datatype")]
+        summary = {
+            "op_code": row["op_code"],
+            "signature": input_signature(row),
+            "global_call_count": int(global_call_count),
+            "input_shapes": row.get("input_shapes"),
+            "input_datatypes": ", ".join(d for d in datatypes if d) or None,
+            "device_time": device_time,
+            "flops_percent": _number(row.get("flops_percent")),
+            "dram_percent": _number(row.get("dram_percent")),
+        }
+        key = (summary["op_code"], summary["signature"], summary["global_call_count"])
+        if key not in summaries or device_time > summaries[key]["device_time"]:
+            summaries[key] = summary
+    return list(summaries.values())
+
+
+def _change_percent(latest: float, baseline: Optional[float]) -> Optional[float]:
+    if not baseline:
+        return None
+    return (latest - baseline) / baseline * 100
+
+
+class PerfTrendStore:
+    """
+    SQLite store of per-op perf summaries across runs, shared by worker
+    processes through WAL mode. Disabled until ``configure`` sets a path.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def configure(self, path: Optional[Union[str, Path]]):
+        with self._lock:
+            self.path = Path(path) if path else None
+            self._initialized = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def _connect(self) -> sqlite3.Connection:
+        path = self.path
+        if path is None:
+            raise RuntimeError("The perf trend store is not configured")
+        connection = sqlite3.connect(path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        with self._lock:
+            if not self._initialized:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                connection.execute("PRAGMA journal_mode = WAL")
+                connection.executescript(SCHEMA)
+                self._initialized = True
+        return connection
+
+    def record_run(
+        self,
+        performance_path: Union[str, Path],
+        csv_path: Union[str, Path],
+        report: Iterable[Dict],
+    ) -> Optional[int]:
+        """
+        Store the summaries of a whole-run ``report`` of ``csv_path``,
+        replacing any earlier ones for the same file. Returns the run id.
+        """
+        if not self.enabled:
+            return None
+        stat = Path(csv_path).stat()
+        performance_path = Path(performance_path).resolve()
+        summaries = summarize_report(report)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "DELETE FROM runs WHERE performance_path = ? "
+                "AND source_mtime_ns = ? AND source_size = ?",
+                (str(performance_path), stat.st_mtime_ns, stat.st_size),
+            )
+            run_id = connection.execute(
+                "INSERT INTO runs (performance_path, name, source_mtime_ns, "
+                "source_size, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(performance_path),
+                    performance_path.name,
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    time.time(),
+                ),
+            ).lastrowid
+            connection.executemany(
+                "INSERT INTO op_summaries (run_id, op_code, signature, "
+                "global_call_count, input_shapes, input_datatypes, device_time, "
+                "flops_percent, dram_percent) VALUES (:run_id, :op_code, "
+                ":signature, :global_call_count, :input_shapes, "
+                ":input_datatypes, :device_time, :flops_percent, :dram_percent)",
+                ({"run_id": run_id, **summary} for summary in summaries),
+            )
+        logger.info(
+            f"Recorded {len(summaries)} op summaries for {performance_path.name}"
+        )
+        return run_id
+
+    def _latest_runs(self, connection, runs: int) -> List[Dict]:
+        """The last ``runs`` runs, oldest first."""
+        rows = connection.execute(
+            "SELECT id, name, performance_path, source_mtime_ns, recorded_at "
+            "FROM runs ORDER BY source_mtime_ns DESC, id DESC LIMIT ?",
+            (runs,),
+        ).fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+    def trends(
+        self,
+        op_code: str,
+        runs: int = DEFAULT_RUNS,
+        signature: Optional[str] = None,
+        global_call_count: Optional[int] = None,
+    ) -> Dict:
+        """
+        Per-key series of ``op_code`` over the last ``runs`` runs, each with
+        the change of its latest device time against the mean of the earlier
+        runs. Series are ordered by that change, worst first.
+        """
+        if not self.enabled:
+            return {"op_code": op_code, "runs": [], "series": []}
+        with closing(self._connect()) as connection:
+            latest_runs = self._latest_runs(connection, runs)
+            run_order = {run["id"]: index for index, run in enumerate(latest_runs)}
+            query = "SELECT * FROM op_summaries WHERE op_code = ?"
+            parameters: List[Union[str, int]] = [op_code]
+            if signature is not None:
+                query += " AND signature = ?"
+                parameters.append(signature)
+            if global_call_count is not None:
+                query += " AND global_call_count = ?"
+                parameters.append(global_call_count)
+            if latest_runs:
+                query += " AND run_id >= ?"
+                parameters.append(min(run_order))
+            rows = connection.execute(query, parameters).fetchall()
+
+        series: Dict[Tuple[str, int], Dict] = {}
+        for row in rows:
+            if row["run_id"] not in run_order:
+                continue
+            key = (row["signature"], row["global_call_count"])
+            entry = series.setdefault(
+                key,
+                {
+                    "signature": row["signature"],
+                    "global_call_count": row["global_call_count"],
+                    "input_shapes": row["input_shapes"],
+                    "input_datatypes": row["input_datatypes"],
+                    "points": [],
+                },
+            )
+            entry["points"].append(
+                {
+                    "run_id": row["run_id"],
+                    "device_time": row["device_time"],
+                    "flops_percent": row["flops_percent"],
+                    "dram_percent": row["dram_percent"],
+                }
+            )
+
+        for entry in series.values():
+            points = entry["points"]
+            points.sort(key=lambda point: run_order[point["run_id"]])
+            earlier = [point["device_time"] for point in points[:-1]]
+            entry["latest"] = points[-1]["device_time"]
+            entry["baseline"] = sum(earlier) / len(earlier) if earlier else None
+            entry["change_percent"] = _change_percent(
+                entry["latest"], entry["baseline"]
+            )
+
+        ordered = sorted(
+            series.values(),
+            key=lambda entry: (
+                entry["change_percent"] is None,
+                -(entry["change_percent"] or 0),
+                entry["global_call_count"],
+            ),
+        )
+        return {"op_code": op_code, "runs": latest_runs, "series": ordered}
+
+    def regressions(
+        self,
+        runs: int = DEFAULT_RUNS,
+        threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+        limit: int = DEFAULT_REGRESSION_LIMIT,
+    ) -> Dict:
+        """
+        Ops whose device time in the latest run is at least ``threshold``
+        percent above their mean over the earlier of the last ``runs`` runs,
+        worst first.
+        """
+        if not self.enabled:
+            return {"runs": [], "regressions": []}
+        with closing(self._connect()) as connection:
+            latest_runs = self._latest_runs(connection, runs)
+            if len(latest_runs) < 2:
+                return {"runs": latest_runs, "regressions": []}
+            earlier_ids = [run["id"] for run in latest_runs[:-1]]
+            placeholders = ", ".join("?" * len(earlier_ids))
+            rows = connection.execute(
+                "SELECT latest.op_code, latest.signature, latest.global_call_count, "
+                "latest.input_shapes, latest.input_datatypes, "
+                "latest.device_time AS latest, "
+                "AVG(earlier.device_time) AS baseline, "
+                "COUNT(earlier.run_id) AS earlier_runs "
+                "FROM op_summaries AS latest "
+                "JOIN op_summaries AS earlier "
+                "ON earlier.op_code = latest.op_code "
+                "AND earlier.signature = latest.signature "
+                "AND earlier.global_call_count = latest.global_call_count "
+                f"AND earlier.run_id IN ({placeholders}) "
+                "WHERE latest.run_id = ? "
+                "GROUP BY latest.op_code, latest.signature, latest.global_call_count "
+                "HAVING baseline > 0 AND latest >= baseline * (1 + ? / 100.0) "
+                "ORDER BY (latest - baseline) / baseline DESC LIMIT ?",
+                (*earlier_ids, latest_runs[-1]["id"], threshold, limit),
+            ).fetchall()
+
+        regressions = []
+        for row in rows:
+            regression = dict(row)
+            regression["change_percent"] = _change_percent(
+                row["latest"], row["baseline"]
+            )
+            regressions.append(regression)
+        return {"runs": latest_runs, "regressions": regressions}
+
+
+perf_trend_store = PerfTrendStore()
@@ -4,6 +4,7 @@
 
 import dataclasses
 import enum
+import math
 import sqlite3
 import types
 from pathlib import Path
@@ -28,6 +29,7 @@ from ttnn_visualizer.models import (
     Buffer,
     BufferChunk,
     BufferPage,
+    BufferType,
     Device,
     DeviceOperation,
     ErrorRecord,
@@ -35,6 +37,8 @@ from ttnn_visualizer.models import (
     Instance,
     Operation,
     OperationArgument,
+    OperationBufferTotals,
+    OperationRankSummary,
     OutputTensor,
     ProducersConsumers,
     SourceFile,
@@ -290,6 +294,132 @@ class DatabaseQueries:
         for row in rows:
             yield Operation(*row)
 
+    def query_operation_window(
+        self,
+        after_operation_id: Optional[int] = None,
+        limit: int = 1000,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Operation]:
+        """
+        Return up to ``limit`` operations ordered by ``operation_id``, starting
+        after ``after_operation_id``. Lets callers page through a report
+        without holding every operation row at once.
+        """
+        select_clause = self._dataclass_select_clause("operations", Operation)
+        conditions = ""
+        params: List[Any] = []
+        if after_operation_id is not None:
+            conditions += "AND operation_id > ? "
+            params.append(after_operation_id)
+        conditions += "ORDER BY operation_id LIMIT ?"
+        params.append(limit)
+        rows = self._query_table(
+            "operations",
+            filters,
+            additional_conditions=conditions,
+            additional_params=params,
+            select_clause=select_clause,
+        )
+        return [Operation(*row) for row in rows]
+
+    def query_operation_buffer_totals(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Generator[OperationBufferTotals, None, None]:
+        """
+        Yield buffer count and summed per-bank sizes (all buffers, and L1 only)
+        for each ``(operation_id, device_id[, rank])`` in ``buffers``.
+        """
+        has_rank = "rank" in self._get_table_columns("buffers")
+        rank_select = "rank" if has_rank else "0"
+        rank_group = ", rank" if has_rank else ""
+
+        select_clause = f"""
+            operation_id,
+            device_id,
+            COUNT(*) AS buffer_count,
+            SUM(max_size_per_bank) AS total_size,
+            SUM(
+                CASE WHEN buffer_type = {BufferType.L1.value}
+                THEN max_size_per_bank ELSE 0 END
+            ) AS l1_size,
+            {rank_select} AS rank
+        """
+        rows = self._query_table(
+            "buffers",
+            filters,
+            additional_conditions=f"GROUP BY operation_id, device_id{rank_group}",
+            select_clause=select_clause,
+        )
+        for row in rows:
+            yield OperationBufferTotals(*row)
+
+    def query_operation_rank_summary(
+        self,
+    ) -> Generator[OperationRankSummary, None, None]:
+        """
+        Yield per-operation duration statistics across every rank in one
+        grouped pass over ``operations``.
+
+        ``max_rank`` is picked by a ``ROW_NUMBER()`` window over each
+        operation's ranks, so the straggler comes out of the same scan as the
+        aggregates. SQLite has no ``STDDEV``, so the variance is derived from
+        ``AVG(d*d) - AVG(d)^2`` and rooted here. Legacy reports without a
+        ``rank`` column summarise as a single rank 0.
+        """
+        has_rank = "rank" in self._get_table_columns("operations")
+        rank_select = "rank" if has_rank else "0"
+        query = f"""
+            SELECT
+                operation_id,
+                name,
+                COUNT(*) AS rank_count,
+                MIN(duration) AS min_duration,
+                MAX(duration) AS max_duration,
+                AVG(duration) AS mean_duration,
+                AVG(duration * duration) AS mean_square_duration,
+                MAX(CASE WHEN duration_order = 1 THEN rank END) AS max_rank
+            FROM (
+                SELECT
+                    operation_id,
+                    name,
+                    duration,
+                    {rank_select} AS rank,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY operation_id ORDER BY duration DESC
+                    ) AS duration_order
+                FROM operations
+            )
+            GROUP BY operation_id
+            ORDER BY operation_id
+        """
+        rows = self.query_runner.execute_query(query)
+        for row in rows:
+            (
+                operation_id,
+                name,
+                rank_count,
+                min_duration,
+                max_duration,
+                mean_duration,
+                mean_square_duration,
+                max_rank,
+            ) = row
+            stddev_duration = None
+            if mean_duration is not None and mean_square_duration is not None:
+                # Clamp float cancellation noise so identical durations give 0.
+                variance = max(mean_square_duration - mean_duration**2, 0.0)
+                stddev_duration = math.sqrt(variance)
+            yield OperationRankSummary(
+                operation_id,
+                name,
+                rank_count,
+                min_duration,
+                max_duration,
+                mean_duration,
+                stddev_duration,
+                max_rank if max_rank is not None else 0,
+            )
+
     def query_buffers(
         self, filters: Optional[Dict[str, Any]] = None
     ) -> Generator[Buffer, None, None]:
@@ -713,6 +843,20 @@ class DatabaseQueries:
                 rank=rank_val,
             )
 
+    def query_tensor_memory_configs(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[int, Optional[str]]:
+        """
+        Map ``tensor_id`` to its raw ``memory_config`` string without the
+        joins ``query_tensors`` needs for sizes, lifetimes and device addresses.
+        """
+        if filters and filters.get("tensor_id") == []:
+            return {}
+        rows = self._query_table(
+            "tensors", filters, columns=["tensor_id", "memory_config"]
+        )
+        return {tensor_id: memory_config for tensor_id, memory_config in rows}
+
     def query_input_tensors(
         self, filters: Optional[Dict[str, Any]] = None
     ) -> Generator[InputTensor, None, None]:
@@ -0,0 +1,445 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Run the SQL behind every ``DatabaseQueries`` method through
+``EXPLAIN QUERY PLAN`` against a real report and flag full-table scans.
+
+Usage::
+
+    python -m ttnn_visualizer.query_plan_audit path/to/db.sqlite [--min-rows N]
+
+Each method is invoked with representative filters (the first operation,
+tensor and buffer in the report) so the dynamically assembled SQL matches what
+the API issues. Every statement is recorded, explained and checked for
+``SCAN`` steps over tables with at least ``--min-rows`` rows. For each flagged
+scan the audit prints the index on the filtered/joined columns that would turn
+it into a ``SEARCH``; scans with no usable predicate (full reads) get none.
+"""
+
+import argparse
+import dataclasses
+import re
+import sqlite3
+import sys
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ttnn_visualizer.queries import DatabaseQueries, LocalQueryRunner
+
+DEFAULT_MIN_ROWS = 10_000
+
+# Schema probes issued by the query helpers themselves; never worth auditing.
+_IGNORED_STATEMENT_PREFIXES = ("PRAGMA", "SELECT NAME FROM SQLITE_MASTER")
+
+_TABLE_REFERENCE_RE = re.compile(
+    r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!WHERE\b|ON\b|LEFT\b|JOIN\b|"
+    r"INNER\b|GROUP\b|ORDER\b|LIMIT\b)(\w+))?",
+    re.IGNORECASE,
+)
+# ``[alias.]column <op> (?|literal|alias.column|IN (...))``; a qualified
+# right-hand column makes it a join predicate.
+_PREDICATE_RE = re.compile(
+    r"(?:\b(?P<lq>\w+)\.)?\b(?P<lc>[A-Za-z_]\w*)\s*"
+    r"(?:(?P<op>>=|<=|=|>|<)\s*(?:(?P<rq>\w+)\.(?P<rc>\w+)|\?|[-\w']+)"
+    r"|(?P<in>\bIN\s*\())",
+    re.IGNORECASE,
+)
+_CASE_RE = re.compile(r"\bCASE\b.*?\bEND\b", re.IGNORECASE | re.DOTALL)
+_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+_SEARCH_RE = re.compile(r"^SEARCH (?:TABLE )?(\w+)")
+
+
+@dataclasses.dataclass
+class ScanFinding:
+    method: str
+    table: str
+    rows: int
+    estimated_cost: int
+    detail: str
+    suggested_index: Optional[str]
+
+
+@dataclasses.dataclass
+class AuditedStatement:
+    method: str
+    sql: str
+    plan: List[str]
+    findings: List[ScanFinding]
+
+
+class _RecordingQueryRunner(LocalQueryRunner):
+    """Executes normally and remembers each statement for later explanation."""
+
+    def __init__(self, connection):
+        super().__init__(connection=connection)
+        self.statements: List[Tuple[str, List[Any]]] = []
+
+    def execute_query(self, query: str, params: Optional[List] = None) -> List:
+        normalized = " ".join(query.split()).upper()
+        if not normalized.startswith(_IGNORED_STATEMENT_PREFIXES):
+            self.statements.append((query, list(params or [])))
+        return super().execute_query(query, params)
+
+
+def _first_value(runner: LocalQueryRunner, table: str, column: str) -> Optional[Any]:
+    try:
+        rows = runner.execute_query(
+            f"SELECT {column} FROM {table} ORDER BY {column} LIMIT 1"
+        )
+    except sqlite3.OperationalError:
+        return None
+    return rows[0][0] if rows else None
+
+
+def _audit_calls(
+    db: DatabaseQueries,
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    Representative invocation of every public ``DatabaseQueries`` query method.
+
+    Filters mirror what the views pass: a single id, a rank (on multi-host
+    reports) and the list-valued ``IN`` filters used for batched lookups.
+    """
+    runner = db.query_runner
+    operation_id = _first_value(runner, "operations", "operation_id") or 0
+    tensor_id = _first_value(runner, "tensors", "tensor_id") or 0
+    address = _first_value(runner, "buffers", "address") or 0
+    source_file_id = _first_value(runner, "source_files", "id") or 0
+    rank = 0 if db.report_has_rank_column() else None
+
+    def ranked(table: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+        return db.merge_rank_filter(table, filters, rank)
+
+    by_operation = {"operation_id": operation_id}
+    by_tensor = {"tensor_id": tensor_id}
+
+    return [
+        ("query_operations", lambda: db.query_operations(ranked("operations", {}))),
+        (
+            "query_operations[operation_id]",
+            lambda: db.query_operations(ranked("operations", by_operation)),
+        ),
+        (
+            "query_operation_window",
+            lambda: db.query_operation_window(
+                operation_id, 1000, ranked("operations", {})
+            ),
+        ),
+        (
+            "query_operation_arguments",
+            lambda: db.query_operation_arguments(
+                ranked("operation_arguments", by_operation)
+            ),
+        ),
+        (
+            "query_operation_buffer_totals",
+            lambda: db.query_operation_buffer_totals(
+                ranked("buffers", {"operation_id": [operation_id]})
+            ),
+        ),
+        ("query_operation_rank_summary", db.query_operation_rank_summary),
+        (
+            "query_device_operations",
+            lambda: db.query_device_operations(ranked("captured_graph", by_operation)),
+        ),
+        (
+            "query_buffers",
+            lambda: db.query_buffers(
+                ranked("buffers", {**by_operation, "buffer_type": 1})
+            ),
+        ),
+        (
+            "query_buffer_pages",
+            lambda: db.query_buffer_pages(ranked("buffer_pages", by_operation)),
+        ),
+        (
+            "query_buffer_chunks",
+            lambda: db.query_buffer_chunks(
+                ranked(db.buffer_chunks_source_table() or "buffers", by_operation)
+            ),
+        ),
+        (
+            "query_next_buffer",
+            lambda: db.query_next_buffer(operation_id, str(address), rank),
+        ),
+        ("query_tensors", lambda: db.query_tensors(ranked("tensors", {}))),
+        (
+            "query_tensors[tensor_id]",
+            lambda: db.query_tensors(ranked("tensors", by_tensor)),
+        ),
+        (
+            "query_tensor_memory_configs",
+            lambda: db.query_tensor_memory_configs(
+                ranked("tensors", {"tensor_id": [tensor_id]})
+            ),
+        ),
+        (
+            "query_input_tensors",
+            lambda: db.query_input_tensors(ranked("input_tensors", by_operation)),
+        ),
+        (
+            "query_input_tensors[tensor_id]",
+            lambda: db.query_input_tensors(ranked("input_tensors", by_tensor)),
+        ),
+        (
+            "query_output_tensors",
+            lambda: db.query_output_tensors(ranked("output_tensors", by_operation)),
+        ),
+        (
+            "query_output_tensors[tensor_id]",
+            lambda: db.query_output_tensors(ranked("output_tensors", by_tensor)),
+        ),
+        (
+            "query_producers_consumers",
+            lambda: db.query_producers_consumers(rank),
+        ),
+        (
+            "query_stack_traces",
+            lambda: db.query_stack_traces(ranked("stack_traces", by_operation)),
+        ),
+        (
+            "query_source_files",
+            lambda: db.query_source_files({"id": source_file_id}),
+        ),
+        (
+            "query_error_records",
+            lambda: db.query_error_records(ranked("errors", by_operation)),
+        ),
+        (
+            "query_tensor_comparisons",
+            lambda: db.query_tensor_comparisons(True, by_tensor),
+        ),
+        (
+            "query_tensor_comparisons[global]",
+            lambda: db.query_tensor_comparisons(False, by_tensor),
+        ),
+        ("query_devices", lambda: db.query_devices(ranked("devices", {}))),
+        ("query_report_metadata", db.query_report_metadata),
+    ]
+
+
+def _table_aliases(sql: str) -> Dict[str, str]:
+    """Map every alias (and bare table name) in ``sql`` to its table."""
+    aliases: Dict[str, str] = {}
+    for table, alias in _TABLE_REFERENCE_RE.findall(sql):
+        aliases[table] = table
+        if alias:
+            aliases[alias] = table
+    return aliases
+
+
+def _predicate_columns(
+    sql: str,
+    table: str,
+    aliases: Dict[str, str],
+    table_columns: List[str],
+    inner_loop: bool,
+) -> List[str]:
+    """
+    Columns of ``table`` compared in ``sql``, equality predicates first so the
+    suggested index can serve them before any range predicate.
+
+    Join predicates only count when ``table`` is scanned in an inner loop; an
+    index on the driving table's join columns would never be probed.
+    """
+    # CASE expressions compare columns inside the SELECT list, not as filters.
+    sql = _CASE_RE.sub(" ", sql)
+    tables_in_query = set(aliases.values())
+    equality: List[str] = []
+    ranged: List[str] = []
+
+    def belongs(qualifier: Optional[str], column: str) -> bool:
+        if column not in table_columns:
+            return False
+        if qualifier:
+            return aliases.get(qualifier) == table
+        return len(tables_in_query) == 1
+
+    def add(column: str, operator: str):
+        target = ranged if operator in (">", "<", ">=", "<=") else equality
+        if column not in target:
+            target.append(column)
+
+    for match in _PREDICATE_RE.finditer(sql):
+        left = (match.group("lq"), match.group("lc"))
+        right = (match.group("rq"), match.group("rc"))
+        operator = match.group("op") or "IN"
+        if right[1] is None:
+            if belongs(*left):
+                add(left[1], operator)
+            continue
+        if not inner_loop:
+            continue
+        for qualifier, column in (left, right):
+            if belongs(qualifier, column):
+                add(column, operator)
+
+    return equality + [column for column in ranged if column not in equality]
+
+
+def _explain(
+    connection: sqlite3.Connection, sql: str, params: List[Any]
+) -> List[Tuple[int, int, str]]:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [(row[0], row[1], row[3]) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def _audit_statement(
+    connection: sqlite3.Connection,
+    method: str,
+    sql: str,
+    params: List[Any],
+    min_rows: int,
+    row_counts: Dict[str, int],
+) -> AuditedStatement:
+    plan = _explain(connection, sql, params)
+    aliases = _table_aliases(sql)
+
+    def rows_in(table: str) -> int:
+        if table not in row_counts:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                row_counts[table] = cursor.fetchone()[0]
+            finally:
+                cursor.close()
+        return row_counts[table]
+
+    findings: List[ScanFinding] = []
+    # Loop nesting is per parent: each SCAN multiplies the work of the steps
+    # that follow it at the same level, so an inner-loop scan of a join costs
+    # outer rows x inner rows. SEARCH steps are treated as O(1) per probe.
+    loop_rows: Dict[int, int] = {}
+    for _, parent, detail in plan:
+        inner_loop = parent in loop_rows
+        outer = loop_rows.get(parent, 1)
+        scan = _SCAN_RE.match(detail)
+        search = _SEARCH_RE.match(detail)
+        if search:
+            loop_rows[parent] = outer
+            continue
+        if not scan:
+            continue
+        table = aliases.get(scan.group(1), scan.group(1))
+        try:
+            rows = rows_in(table)
+        except sqlite3.OperationalError:
+            # CTE / subquery names are not real tables.
+            continue
+        estimated_cost = outer * max(rows, 1)
+        loop_rows[parent] = estimated_cost
+        if rows < min_rows:
+            continue
+
+        columns = _predicate_columns(
+            sql,
+            table,
+            aliases,
+            [row[1] for row in connection.execute(f"PRAGMA table_info({table})")],
+            inner_loop=inner_loop,
+        )
+        suggested_index = None
+        if columns:
+            suggested_index = (
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(columns)} "
+                f"ON {table}({', '.join(columns)})"
+            )
+        findings.append(
+            ScanFinding(
+                method=method,
+                table=table,
+                rows=rows,
+                estimated_cost=estimated_cost,
+                detail=detail,
+                suggested_index=suggested_index,
+            )
+        )
+
+    return AuditedStatement(
+        method=method,
+        sql=" ".join(sql.split()),
+        plan=[detail for _, _, detail in plan],
+        findings=findings,
+    )
+
+
+def audit_query_plans(
+    connection: sqlite3.Connection, min_rows: int = DEFAULT_MIN_ROWS
+) -> List[AuditedStatement]:
+    """
+    Explain the SQL of every ``DatabaseQueries`` query method against the
+    report behind ``connection``. Methods whose tables are missing from the
+    report are skipped.
+    """
+    runner = _RecordingQueryRunner(connection)
+    db = DatabaseQueries(connection=connection)
+    db.query_runner = runner
+
+    row_counts: Dict[str, int] = {}
+    audited: List[AuditedStatement] = []
+    for method, call in _audit_calls(db):
+        runner.statements.clear()
+        try:
+            result = call()
+            if isinstance(result, types.GeneratorType):
+                list(result)
+        except sqlite3.OperationalError:
+            continue
+        for sql, params in runner.statements:
+            audited.append(
+                _audit_statement(connection, method, sql, params, min_rows, row_counts)
+            )
+    return audited
+
+
+def format_audit(audited: List[AuditedStatement]) -> str:
+    findings = [finding for statement in audited for finding in statement.findings]
+    lines = [
+        f"Audited {len(audited)} statements; {len(findings)} full scan(s) flagged."
+    ]
+    for finding in sorted(findings, key=lambda f: f.estimated_cost, reverse=True):
+        lines.append("")
+        lines.append(
+            f"{finding.method}: {finding.detail} "
+            f"({finding.rows:,} rows, estimated cost {finding.estimated_cost:,})"
+        )
+        if finding.suggested_index:
+            lines.append(f"  fix: {finding.suggested_index};")
+        else:
+            lines.append("  no predicate on this table; an index will not help")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Flag full-table scans in the SQL issued by DatabaseQueries"
+    )
+    parser.add_argument("report", help="Path to a profiler report db.sqlite")
+    parser.add_argument(
+        "--min-rows",
+        type=int,
+        default=DEFAULT_MIN_ROWS,
+        help=f"Only flag scans of tables with at least this many rows (default: {DEFAULT_MIN_ROWS})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    connection = sqlite3.connect(f"file:{args.report}?mode=ro", uri=True)
+    try:
+        audited = audit_query_plans(connection, min_rows=args.min_rows)
+    finally:
+        connection.close()
+    print(format_audit(audited))
+    return 1 if any(statement.findings for statement in audited) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
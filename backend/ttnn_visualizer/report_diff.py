@@ -0,0 +1,258 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Align the operations of two memory reports and diff them.
+
+Operations are matched on ``(name, argument hash, ordinal)`` where the ordinal
+counts earlier operations in the same report that share the name and argument
+hash. Both reports are paged through in ``operation_id`` order side by side;
+each window is hash-joined against whatever the other report has left
+unmatched, so only the current window plus the unmatched backlog is held in
+memory. For two runs of the same model the backlog stays close to empty.
+"""
+
+import dataclasses
+import hashlib
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple
+
+from ttnn_visualizer.queries import DatabaseQueries
+from ttnn_visualizer.utils import SerializeableDataclass
+
+DIFF_WINDOW_SIZE = 500
+
+OperationKey = Tuple[str, str, int]
+
+
+@dataclasses.dataclass
+class _OperationSnapshot:
+    operation_id: int
+    name: str
+    duration: Optional[float]
+    buffer_size: int
+    l1_size: int
+    output_memory_configs: Dict[int, Optional[str]]
+
+
+@dataclasses.dataclass
+class MemoryConfigChange(SerializeableDataclass):
+    output_index: int
+    base: Optional[str]
+    candidate: Optional[str]
+
+
+@dataclasses.dataclass
+class OperationDiff(SerializeableDataclass):
+    name: str
+    ordinal: int
+    base_operation_id: int
+    candidate_operation_id: int
+    base_duration: Optional[float]
+    candidate_duration: Optional[float]
+    duration_delta: Optional[float]
+    buffer_size_delta: int
+    l1_size_delta: int
+    memory_config_changes: List[MemoryConfigChange]
+
+
+@dataclasses.dataclass
+class UnmatchedOperation(SerializeableDataclass):
+    operation_id: int
+    name: str
+    ordinal: int
+
+
+def _argument_hash(arguments: List[Tuple[str, str]]) -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    for name, value in sorted(arguments):
+        digest.update(f"{name}\x1f{value}\x1e".encode("utf-8", "replace"))
+    return digest.hexdigest()
+
+
+class _ReportStream:
+    """Pages one report's operations, keyed for alignment, one window at a time."""
+
+    def __init__(self, db: DatabaseQueries, rank: Optional[int], window_size: int):
+        self.db = db
+        self.rank = rank
+        self.window_size = window_size
+        self.ordinals: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        self.l1_peak = 0
+
+    def _filters(self, table_name: str, filters: Optional[Dict[str, Any]] = None):
+        return self.db.merge_rank_filter(table_name, filters, self.rank)
+
+    def windows(self) -> Iterator[List[Tuple[OperationKey, _OperationSnapshot]]]:
+        after: Optional[int] = None
+        while True:
+            operations = self.db.query_operation_window(
+                after, self.window_size, self._filters("operations")
+            )
+            if not operations:
+                return
+            after = operations[-1].operation_id
+            yield self._snapshot_window(operations)
+
+    def _snapshot_window(
+        self, operations
+    ) -> List[Tuple[OperationKey, _OperationSnapshot]]:
+        operation_ids = [operation.operation_id for operation in operations]
+
+        arguments: DefaultDict[int, List[Tuple[str, str]]] = defaultdict(list)
+        for argument in self.db.query_operation_arguments(
+            self._filters("operation_arguments", {"operation_id": operation_ids})
+        ):
+            arguments[argument.operation_id].append((argument.name, argument.value))
+
+        buffer_sizes: DefaultDict[int, int] = defaultdict(int)
+        l1_sizes: DefaultDict[int, int] = defaultdict(int)
+        for totals in self.db.query_operation_buffer_totals(
+            self._filters("buffers", {"operation_id": operation_ids})
+        ):
+            buffer_sizes[totals.operation_id] += totals.total_size or 0
+            l1_sizes[totals.operation_id] += totals.l1_size or 0
+            # Peak is per device: L1 on one chip doesn't add to another's.
+            self.l1_peak = max(self.l1_peak, totals.l1_size or 0)
+
+        outputs = list(
+            self.db.query_output_tensors(
+                self._filters("output_tensors", {"operation_id": operation_ids})
+            )
+        )
+        memory_configs = self.db.query_tensor_memory_configs(
+            self._filters(
+                "tensors", {"tensor_id": [output.tensor_id for output in outputs]}
+            )
+        )
+        output_memory_configs: DefaultDict[int, Dict[int, Optional[str]]] = defaultdict(
+            dict
+        )
+        for output in outputs:
+            output_memory_configs[output.operation_id][output.output_index] = (
+                memory_configs.get(output.tensor_id)
+            )
+
+        window = []
+        for operation in operations:
+            argument_hash = _argument_hash(arguments[operation.operation_id])
+            ordinal = self.ordinals[(operation.name, argument_hash)]
+            self.ordinals[(operation.name, argument_hash)] += 1
+            window.append(
+                (
+                    (operation.name, argument_hash, ordinal),
+                    _OperationSnapshot(
+                        operation_id=operation.operation_id,
+                        name=operation.name,
+                        duration=operation.duration,
+                        buffer_size=buffer_sizes[operation.operation_id],
+                        l1_size=l1_sizes[operation.operation_id],
+                        output_memory_configs=output_memory_configs[
+                            operation.operation_id
+                        ],
+                    ),
+                )
+            )
+        return window
+
+
+def _diff_operation(
+    key: OperationKey, base: _OperationSnapshot, candidate: _OperationSnapshot
+) -> OperationDiff:
+    duration_delta = None
+    if base.duration is not None and candidate.duration is not None:
+        duration_delta = candidate.duration - base.duration
+
+    memory_config_changes = [
+        MemoryConfigChange(
+            output_index=index,
+            base=base.output_memory_configs.get(index),
+            candidate=candidate.output_memory_configs.get(index),
+        )
+        for index in sorted(
+            set(base.output_memory_configs) | set(candidate.output_memory_configs)
+        )
+        if base.output_memory_configs.get(index)
+        != candidate.output_memory_configs.get(index)
+    ]
+
+    return OperationDiff(
+        name=key[0],
+        ordinal=key[2],
+        base_operation_id=base.operation_id,
+        candidate_operation_id=candidate.operation_id,
+        base_duration=base.duration,
+        candidate_duration=candidate.duration,
+        duration_delta=duration_delta,
+        buffer_size_delta=candidate.buffer_size - base.buffer_size,
+        l1_size_delta=candidate.l1_size - base.l1_size,
+        memory_config_changes=memory_config_changes,
+    )
+
+
+def diff_reports(
+    base_db: DatabaseQueries,
+    candidate_db: DatabaseQueries,
+    rank: Optional[int] = None,
+    window_size: int = DIFF_WINDOW_SIZE,
+) -> Dict[str, Any]:
+    """
+    Diff two reports operation by operation.
+
+    Returns matched ``operations`` (in match order), operations only present in
+    the base (``removed``) or candidate (``added``), and the per-device L1 peak
+    of each report.
+    """
+    base_stream = _ReportStream(base_db, rank, window_size)
+    candidate_stream = _ReportStream(candidate_db, rank, window_size)
+
+    pending_base: Dict[OperationKey, _OperationSnapshot] = {}
+    pending_candidate: Dict[OperationKey, _OperationSnapshot] = {}
+    matched: List[OperationDiff] = []
+
+    def join(window, pending_own, pending_other, base_side: bool):
+        for key, snapshot in window:
+            other = pending_other.pop(key, None)
+            if other is None:
+                pending_own[key] = snapshot
+            elif base_side:
+                matched.append(_diff_operation(key, snapshot, other))
+            else:
+                matched.append(_diff_operation(key, other, snapshot))
+
+    base_windows = base_stream.windows()
+    candidate_windows = candidate_stream.windows()
+    base_done = candidate_done = False
+    while not (base_done and candidate_done):
+        if not base_done:
+            window = next(base_windows, None)
+            if window is None:
+                base_done = True
+            else:
+                join(window, pending_base, pending_candidate, base_side=True)
+        if not candidate_done:
+            window = next(candidate_windows, None)
+            if window is None:
+                candidate_done = True
+            else:
+                join(window, pending_candidate, pending_base, base_side=False)
+
+    def unmatched(pending: Dict[OperationKey, _OperationSnapshot]):
+        return [
+            UnmatchedOperation(snapshot.operation_id, key[0], key[2]).to_dict()
+            for key, snapshot in sorted(
+                pending.items(), key=lambda item: item[1].operation_id
+            )
+        ]
+
+    return {
+        "operations": [dataclasses.asdict(diff) for diff in matched],
+        "removed": unmatched(pending_base),
+        "added": unmatched(pending_candidate),
+        "l1_peak": {
+            "base": base_stream.l1_peak,
+            "candidate": candidate_stream.l1_peak,
+            "delta": candidate_stream.l1_peak - base_stream.l1_peak,
+        },
+    }
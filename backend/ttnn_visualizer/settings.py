@@ -63,6 +63,41 @@ class DefaultConfig(object):
     # Remote SSH subprocess timeouts (seconds).
     SSH_SUBPROCESS_TIMEOUT = int(os.getenv("SSH_SUBPROCESS_TIMEOUT", "120"))
     SSH_REMOTE_CHECK_TIMEOUT = int(os.getenv("SSH_REMOTE_CHECK_TIMEOUT", "45"))
+    # Remote sync: files fetched per sftp session, and sftp sessions open at
+    # once against one host (across all syncs in this process).
+    SFTP_BATCH_SIZE = int(os.getenv("SFTP_BATCH_SIZE", "64"))
+    SFTP_SESSIONS_PER_HOST = int(os.getenv("SFTP_SESSIONS_PER_HOST", "4"))
+    # Share one SSH connection (an OpenSSH ControlMaster) per user@host:port
+    # across remote commands, kept open this many seconds after its last use.
+    # The socket directory must be private to the user and have a short path.
+    SSH_CONTROL_MASTER = str_to_bool(os.getenv("SSH_CONTROL_MASTER", "true"))
+    SSH_CONTROL_PERSIST = int(os.getenv("SSH_CONTROL_PERSIST", "600"))
+    SSH_CONTROL_DIRECTORY = os.getenv(
+        "SSH_CONTROL_DIRECTORY",
+        f"/tmp/ttnn-visualizer-ssh-{os.getuid()}" if os.name == "posix" else "",
+    )
+
+    # Memory budget (bytes) for parsed performance CSVs kept per worker process;
+    # 0 disables the cache.
+    CSV_CACHE_MAX_BYTES = int(os.getenv("CSV_CACHE_MAX_BYTES", str(2 * 1024**3)))
+    # Performance CSVs at least this large are streamed in chunks per query
+    # rather than loaded whole (and never enter the cache above).
+    CSV_STREAMING_THRESHOLD_BYTES = int(
+        os.getenv("CSV_STREAMING_THRESHOLD_BYTES", str(512 * 1024**2))
+    )
+    # Disk budget (bytes) for generated perf reports cached under
+    # APP_DATA_DIRECTORY; 0 disables the cache.
+    PERF_REPORT_CACHE_MAX_BYTES = int(
+        os.getenv("PERF_REPORT_CACHE_MAX_BYTES", str(512 * 1024**2))
+    )
+    # Tracy's csvexport tool, used to read host zones from Tracy captures
+    TRACY_CSVEXPORT = os.getenv("TRACY_CSVEXPORT", "tracy-csvexport")
+    # Keep per-op summaries of every generated perf report in a SQLite store
+    # under APP_DATA_DIRECTORY for cross-run trend and regression queries.
+    PERF_TRENDS_ENABLED = str_to_bool(os.getenv("PERF_TRENDS_ENABLED", "true"))
+    # Processes for CPU-bound work (perf reports, NPE decoding) offloaded from
+    # the gevent worker; 0 uses the CPU count.
+    OFFLOAD_PROCESS_WORKERS = int(os.getenv("OFFLOAD_PROCESS_WORKERS", "0"))
 
     # File Name Configs
     TEST_CONFIG_FILE = "config.json"
@@ -7,14 +7,17 @@ import logging
 import os
 import shlex
 import subprocess
+import threading
 import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from http import HTTPStatus
 from pathlib import Path
 from threading import Thread
-from typing import List, NoReturn, Optional
+from typing import Callable, List, NoReturn, Optional, Tuple, Union
 
 import yaml
 from flask import current_app
+from ttnn_visualizer.csv_queries import convert_performance_report_in_background
 from ttnn_visualizer.decorators import remote_exception_handler
 from ttnn_visualizer.enums import ConnectionTestStates, SyncMethod
 from ttnn_visualizer.exceptions import (
@@ -26,8 +29,14 @@ from ttnn_visualizer.exceptions import (
     SSHException,
 )
 from ttnn_visualizer.models import Instance, RemoteConnection, RemoteReportFolder
+from ttnn_visualizer.perf_report_jobs import report_jobs
 from ttnn_visualizer.sockets import FileProgress, FileStatus, emit_file_status
-from ttnn_visualizer.ssh_client import SSHClient, raise_for_ssh_subprocess_error
+from ttnn_visualizer.ssh_client import (
+    SSHClient,
+    raise_for_ssh_subprocess_error,
+    ssh_auth_options,
+    ssh_control_masters,
+)
 from ttnn_visualizer.utils import (
     PROFILER_CONFIG_BASENAME,
     pick_cluster_descriptor_path,
@@ -37,6 +46,23 @@ from ttnn_visualizer.utils import (
 
 logger = logging.getLogger(__name__)
 
+# (remote path, size in bytes, local path) of one file to download
+FileTransfer = Tuple[str, int, Path]
+
+# Errors that end a whole sync rather than failing one file
+_FATAL_SSH_ERRORS = (
+    HostKeyVerificationException,
+    AuthenticationException,
+    NoValidConnectionsError,
+    SSHException,
+)
+
+# Seconds allowed per file in an sftp or scp download
+DOWNLOAD_TIMEOUT_PER_FILE = 300
+# Cap on one batch's sftp session, however many files it holds; a batch that
+# runs over is retried one file at a time, each with the per-file timeout
+DOWNLOAD_TIMEOUT_PER_BATCH = 900
+
 # Hosts where the SFTP subsystem is unavailable but scp over SSH still works,
 # keyed by (username, host, port). Process-global and never evicted: a single
 # subsystem failure pins that endpoint to scp for the rest of the process
@@ -81,6 +107,39 @@ def _ssh_remote_check_timeout_seconds() -> int:
         return int(os.getenv("SSH_REMOTE_CHECK_TIMEOUT", "45"))
 
 
+def _sftp_batch_size() -> int:
+    """Files fetched per sftp session. Configurable via SFTP_BATCH_SIZE."""
+    try:
+        return max(int(current_app.config["SFTP_BATCH_SIZE"]), 1)
+    except RuntimeError:
+        return max(int(os.getenv("SFTP_BATCH_SIZE", "64")), 1)
+
+
+def _sftp_sessions_per_host() -> int:
+    """Concurrent sftp sessions per host. Configurable via SFTP_SESSIONS_PER_HOST."""
+    try:
+        return max(int(current_app.config["SFTP_SESSIONS_PER_HOST"]), 1)
+    except RuntimeError:
+        return max(int(os.getenv("SFTP_SESSIONS_PER_HOST", "4")), 1)
+
+
+# Download sessions open against each (username, host, port), shared by every
+# sync in the process so that concurrent syncs of one host don't add up to
+# more sessions than sshd's MaxStartups lets through.
+_host_session_slots: dict[tuple[str, str, int], threading.BoundedSemaphore] = {}
+_host_session_slots_lock = threading.Lock()
+
+
+def _host_sessions(
+    remote_connection: RemoteConnection, sessions: int
+) -> threading.BoundedSemaphore:
+    key = _remote_transfer_key(remote_connection)
+    with _host_session_slots_lock:
+        if key not in _host_session_slots:
+            _host_session_slots[key] = threading.BoundedSemaphore(sessions)
+        return _host_session_slots[key]
+
+
 TEST_CONFIG_FILE = PROFILER_CONFIG_BASENAME
 TEST_DB_FILE = "db.sqlite"
 TEST_PROFILER_FILE = "profile_log_device.csv"
@@ -88,13 +147,8 @@ TEST_PROFILER_FILE = "profile_log_device.csv"
 
 def _ssh_cmd_prefix(remote_connection: RemoteConnection) -> List[str]:
     """Build SSH command prefix (never prompts for password). Includes BatchMode=yes and optional identity file."""
-    cmd = ["ssh"]
-    identity = (getattr(remote_connection, "identityFile", None) or "").strip()
-    if identity:
-        cmd.extend(["-F", os.devnull])
-    cmd.extend(["-o", "BatchMode=yes", "-o", "PasswordAuthentication=no"])
-    if identity:
-        cmd.extend(["-o", "IdentitiesOnly=yes", "-i", identity])
+    cmd = ["ssh", *ssh_auth_options(remote_connection)]
+    cmd.extend(ssh_control_masters.options(remote_connection))
     if remote_connection.port != 22:
         cmd.extend(["-p", str(remote_connection.port)])
     cmd.append(f"{remote_connection.username}@{remote_connection.host}")
@@ -103,13 +157,8 @@ def _ssh_cmd_prefix(remote_connection: RemoteConnection) -> List[str]:
 
 def _sftp_cmd_prefix(remote_connection: RemoteConnection) -> List[str]:
     """Build SFTP command prefix (never prompts for password). Includes BatchMode=yes and optional identity file."""
-    cmd = ["sftp"]
-    identity = (getattr(remote_connection, "identityFile", None) or "").strip()
-    if identity:
-        cmd.extend(["-F", os.devnull])
-    cmd.extend(["-o", "BatchMode=yes", "-o", "PasswordAuthentication=no"])
-    if identity:
-        cmd.extend(["-o", "IdentitiesOnly=yes", "-i", identity])
+    cmd = ["sftp", *ssh_auth_options(remote_connection)]
+    cmd.extend(ssh_control_masters.options(remote_connection))
     if remote_connection.port != 22:
         cmd.extend(["-P", str(remote_connection.port)])
     cmd.extend(["-b", "-", f"{remote_connection.username}@{remote_connection.host}"])
@@ -123,13 +172,8 @@ def _scp_cmd_prefix(remote_connection: RemoteConnection) -> List[str]:
     the SFTP subsystem, which is exactly the subsystem that's unavailable on the
     hosts this fallback targets; `-O` transfers over a plain remote exec instead.
     """
-    cmd = ["scp", "-O"]
-    identity = (getattr(remote_connection, "identityFile", None) or "").strip()
-    if identity:
-        cmd.extend(["-F", os.devnull])
-    cmd.extend(["-o", "BatchMode=yes", "-o", "PasswordAuthentication=no"])
-    if identity:
-        cmd.extend(["-o", "IdentitiesOnly=yes", "-i", identity])
+    cmd = ["scp", "-O", *ssh_auth_options(remote_connection)]
+    cmd.extend(ssh_control_masters.options(remote_connection))
     if remote_connection.port != 22:
         cmd.extend(["-P", str(remote_connection.port)])
     return cmd
@@ -333,9 +377,9 @@ def sync_files_and_directories(
     # Download files with progress reporting.
     #
     # NOTE: byte progress is file-granular, not streaming. SFTP gives us no
-    # per-chunk callback, so `bytes_transferred` jumps up only after each
-    # full file completes; the UI may look idle between updates while a
-    # large file is in flight (compounded by the 500ms debounce in
+    # per-chunk callback, so `bytes_transferred` jumps up only as each batch
+    # of files completes; the UI may look idle between updates while a
+    # batch is in flight (compounded by the 500ms debounce in
     # emit_file_status). Acceptable for v1 — streaming byte progress would
     # require Paramiko or rsync.
     total_files = len(all_files)
@@ -372,73 +416,112 @@ def sync_files_and_directories(
             sid,
         )
 
+    transfers: List[FileTransfer] = []
     for remote_file, remote_file_size in all_files:
         try:
             # Calculate relative path from the base remote folder
             relative_path = Path(remote_file).relative_to(remote_profiler_folder)
-            local_file = destination_dir / relative_path
-
-            if should_emit_progress:
-                emit_file_status(
-                    FileProgress(
-                        current_file_name=str(relative_path),
-                        number_of_files=total_files,
-                        percent_of_current=0,
-                        finished_files=finished_files,
-                        bytes_transferred=bytes_transferred,
-                        bytes_total=total_bytes,
-                        current_file_size=remote_file_size,
-                        status=FileStatus.DOWNLOADING,
-                    ),
-                    sid,
-                )
-
-            # Download the file using SFTP (or scp fallback)
-            methods_used.add(
-                download_single_file_sftp(remote_connection, remote_file, local_file)
-            )
-
-            finished_files += 1
-            bytes_transferred += remote_file_size
-
-            # Emit progress
-            progress = FileProgress(
-                current_file_name=str(relative_path),
-                number_of_files=total_files,
-                percent_of_current=100,  # We don't get per-file progress with SFTP
-                finished_files=finished_files,
-                bytes_transferred=bytes_transferred,
-                bytes_total=total_bytes,
-                current_file_size=remote_file_size,
-                status=FileStatus.DOWNLOADING,
-            )
-
-            if should_emit_progress:
-                emit_file_status(progress, sid)
-
-            if finished_files % 10 == 0:  # Log every 10 files
-                logger.info(f"Downloaded {finished_files}/{total_files} files")
-
         except ValueError:
             # Skip if remote_file is not relative to remote_profiler_folder
             logger.warning(f"Skipping file outside base folder: {remote_file}")
             continue
-        except (
-            HostKeyVerificationException,
-            AuthenticationException,
-            NoValidConnectionsError,
-            SSHException,
-        ):
-            # Fatal SSH errors must not be swallowed — the decorator maps host-key
-            # and auth failures to actionable 422 responses; connectivity
-            # (NoValidConnectionsError) surfaces as a 500.
-            raise
-        except Exception as e:
-            last_download_error = f"{remote_file}: {e}"
-            logger.error("Failed to download %s: %s", remote_file, e)
-            failed_count += 1
-            # Best-effort: try remaining files, but do not report success if any fail.
-            continue
+        transfers.append(
+            (remote_file, remote_file_size, destination_dir / relative_path)
+        )
+
+    # Files go in batches, one sftp session (and SSH handshake) per batch,
+    # with up to SFTP_SESSIONS_PER_HOST sessions running at once. Batches are
+    # shrunk for small syncs so every session gets work.
+    sessions = _sftp_sessions_per_host()
+    batch_size = min(_sftp_batch_size(), max(-(-len(transfers) // sessions), 1))
+    batches = [
+        transfers[start : start + batch_size]
+        for start in range(0, len(transfers), batch_size)
+    ]
+    slots = _host_sessions(remote_connection, sessions)
+    # Set once the sync ends early, so running batches start no more sessions
+    cancelled = threading.Event()
+
+    def batch_started(batch: List[FileTransfer]):
+        if should_emit_progress:
+            _, remote_file_size, local_file = batch[0]
+            emit_file_status(
+                FileProgress(
+                    current_file_name=str(local_file.relative_to(destination_dir)),
+                    number_of_files=total_files,
+                    percent_of_current=0,
+                    finished_files=finished_files,
+                    bytes_transferred=bytes_transferred,
+                    bytes_total=total_bytes,
+                    current_file_size=remote_file_size,
+                    status=FileStatus.DOWNLOADING,
+                ),
+                sid,
+            )
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(min(sessions, len(batches)), 1),
+        thread_name_prefix="sftp-sync",
+    )
+    try:
+        pending = {
+            executor.submit(
+                _download_batch,
+                remote_connection,
+                batch,
+                slots,
+                cancelled,
+                batch_started,
+            )
+            for batch in batches
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+            for future in done:
+                # Fatal SSH errors must not be swallowed — the decorator maps
+                # host-key and auth failures to actionable 422 responses;
+                # connectivity (NoValidConnectionsError) surfaces as a 500.
+                results = future.result()
+                for (remote_file, remote_file_size, local_file), outcome in results:
+                    if isinstance(outcome, Exception):
+                        last_download_error = f"{remote_file}: {outcome}"
+                        logger.error("Failed to download %s: %s", remote_file, outcome)
+                        failed_count += 1
+                        # Best-effort: the other files still download, but the
+                        # sync is not reported as a success.
+                        continue
+
+                    methods_used.add(outcome)
+                    finished_files += 1
+                    bytes_transferred += remote_file_size
+
+                    # Emit progress; byte progress is per file, as each
+                    # batch completes
+                    if should_emit_progress:
+                        emit_file_status(
+                            FileProgress(
+                                current_file_name=str(
+                                    local_file.relative_to(destination_dir)
+                                ),
+                                number_of_files=total_files,
+                                percent_of_current=100,
+                                finished_files=finished_files,
+                                bytes_transferred=bytes_transferred,
+                                bytes_total=total_bytes,
+                                current_file_size=remote_file_size,
+                                status=FileStatus.DOWNLOADING,
+                            ),
+                            sid,
+                        )
+
+                    if finished_files % 10 == 0:  # Log every 10 files
+                        logger.info(f"Downloaded {finished_files}/{total_files} files")
+    finally:
+        # After a fatal error, drop the queued batches and wait out the
+        # sessions still running rather than leave them downloading behind
+        # the error; each is bounded by its timeout.
+        cancelled.set()
+        executor.shutdown(wait=True, cancel_futures=True)
 
     # scp wins the label if any file needed the fallback; otherwise sftp.
     run_sync_method = (
@@ -681,7 +764,7 @@ def download_single_file_scp(
             capture_output=True,
             text=True,
             check=True,
-            timeout=300,
+            timeout=DOWNLOAD_TIMEOUT_PER_FILE,
         )
         logger.debug("Downloaded via scp: %s -> %s", remote_file, local_file)
         return SyncMethod.SCP
@@ -726,7 +809,7 @@ def download_single_file_sftp(
             capture_output=True,
             text=True,
             check=True,
-            timeout=300,  # 5 minute timeout per file
+            timeout=DOWNLOAD_TIMEOUT_PER_FILE,
         )
         logger.debug("Downloaded via sftp: %s -> %s", remote_file, local_file)
         return SyncMethod.SFTP
@@ -765,6 +848,139 @@ def download_single_file_sftp(
         raise RuntimeError(f"Failed to download {remote_file}: {type(e).__name__}: {e}")
 
 
+def download_files_sftp(
+    remote_connection: RemoteConnection, transfers: List[Tuple[str, Path]]
+) -> SyncMethod:
+    """Download ``(remote_file, local_file)`` pairs in a single SFTP session.
+
+    Falls back to scp like ``download_single_file_sftp``, which a lone file
+    goes through. sftp stops at the first failed ``get``, so a failure leaves
+    the files before it downloaded and the rest not; the error doesn't say
+    which file failed. Returns the transport actually used.
+    """
+    if len(transfers) == 1:
+        return download_single_file_sftp(remote_connection, *transfers[0])
+
+    transfer_key = _remote_transfer_key(remote_connection)
+    if transfer_key not in _sftp_subsystem_unavailable:
+        for _, local_file in transfers:
+            local_file.parent.mkdir(parents=True, exist_ok=True)
+        # Batch script is parsed by sftp, not the shell — quote paths for spaces/special chars.
+        sftp_commands = "".join(
+            f"get {shlex.quote(remote_file)} {shlex.quote(str(local_file))}\n"
+            for remote_file, local_file in transfers
+        )
+        try:
+            subprocess.run(
+                _sftp_cmd_prefix(remote_connection),
+                input=f"{sftp_commands}quit\n",
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=min(
+                    DOWNLOAD_TIMEOUT_PER_FILE * len(transfers),
+                    DOWNLOAD_TIMEOUT_PER_BATCH,
+                ),
+            )
+            logger.debug("Downloaded %s files via sftp", len(transfers))
+            return SyncMethod.SFTP
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr or ""
+            if not _is_sftp_subsystem_unavailable(stderr):
+                logger.error(
+                    "Error downloading a batch of %s files (rc=%s): %s",
+                    len(transfers),
+                    e.returncode,
+                    stderr.strip() or "no stderr",
+                )
+                if e.returncode == 255:  # SSH protocol errors
+                    handle_ssh_subprocess_error(e, remote_connection)  # always raises
+                detail = stderr.strip() or "no stderr"
+                raise RuntimeError(
+                    f"Failed to download a batch of {len(transfers)} files: {detail}"
+                )
+            logger.warning(
+                "SFTP subsystem unavailable on %s@%s:%s; using scp for remaining files",
+                remote_connection.username,
+                remote_connection.host,
+                remote_connection.port,
+            )
+            _sftp_subsystem_unavailable.add(transfer_key)
+        except subprocess.TimeoutExpired:
+            logger.error("Timeout downloading a batch of %s files", len(transfers))
+            raise RuntimeError(f"Timeout downloading a batch of {len(transfers)} files")
+
+    for remote_file, local_file in transfers:
+        download_single_file_scp(remote_connection, remote_file, local_file)
+    return SyncMethod.SCP
+
+
+def _written_since(local_file: Path, size: int, since: float) -> bool:
+    try:
+        stat = local_file.stat()
+    except OSError:
+        return False
+    # sftp get doesn't keep the remote mtime; allow for coarse fs timestamps
+    return stat.st_size == size and stat.st_mtime >= since - 1
+
+
+def _download_batch(
+    remote_connection: RemoteConnection,
+    batch: List[FileTransfer],
+    slots: threading.BoundedSemaphore,
+    cancelled: threading.Event,
+    on_start: Callable[[List[FileTransfer]], None],
+) -> List[Tuple[FileTransfer, Union[SyncMethod, Exception]]]:
+    """Download ``batch`` in one session while holding one of the host's slots.
+
+    Returns each file's transport, or the error it failed with. When the
+    session fails partway, the files it already wrote are kept and the rest
+    are retried one at a time, so each error belongs to its own file. Fatal
+    SSH errors are raised. Once ``cancelled`` is set no further session is
+    started and the files not yet tried are left out of the results.
+    """
+    with slots:
+        if cancelled.is_set():
+            return []
+        on_start(batch)
+        started = time.time()
+        try:
+            method = download_files_sftp(
+                remote_connection,
+                [(remote_file, local_file) for remote_file, _, local_file in batch],
+            )
+            return [(transfer, method) for transfer in batch]
+        except _FATAL_SSH_ERRORS:
+            raise
+        except Exception as e:
+            if len(batch) == 1:
+                return [(batch[0], e)]
+            logger.warning("Retrying a failed batch one file at a time: %s", e)
+
+        results: List[Tuple[FileTransfer, Union[SyncMethod, Exception]]] = []
+        for transfer in batch:
+            if cancelled.is_set():
+                break
+            remote_file, size, local_file = transfer
+            if _written_since(local_file, size, started):
+                results.append((transfer, SyncMethod.SFTP))
+                continue
+            try:
+                results.append(
+                    (
+                        transfer,
+                        download_single_file_sftp(
+                            remote_connection, remote_file, local_file
+                        ),
+                    )
+                )
+            except _FATAL_SSH_ERRORS:
+                raise
+            except Exception as e:
+                results.append((transfer, e))
+        return results
+
+
 def get_remote_profiler_folder_from_config_path(
     remote_connection: RemoteConnection, config_path: str
 ) -> RemoteReportFolder:
@@ -1198,6 +1414,9 @@ def sync_remote_performance_folders(
         profile_folder,
     )
     destination_dir.mkdir(parents=True, exist_ok=True)
-    return sync_files_and_directories(
+    sync_method = sync_files_and_directories(
         remote_connection, remote_folder_path, destination_dir, exclude_patterns, sid
     )
+    convert_performance_report_in_background(destination_dir)
+    report_jobs.submit_for_trends(str(destination_dir))
+    return sync_method
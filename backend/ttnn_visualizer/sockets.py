@@ -22,6 +22,7 @@ socketio: Any | None = None
 class Messages(object):
     FILE_TRANSFER_PROGRESS = "fileTransferProgress"
     REPORT_GENERATED = "reportGenerated"
+    REPORT_JOB_UPDATE = "reportJobUpdate"
 
 
 class FileStatus(Enum):
@@ -31,6 +32,13 @@ class FileStatus(Enum):
     STARTED = "STARTED"
 
 
+class ReportJobStatus(Enum):
+    QUEUED = "QUEUED"
+    FINISHED = "FINISHED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
 class ExitStatus(Enum):
     PASS = "PASS"
     FAIL = "FAIL"
@@ -65,6 +73,15 @@ class ReportGenerated(SerializeableDataclass):
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+@dataclass
+class ReportJobUpdate(SerializeableDataclass):
+    job_id: str
+    status: ReportJobStatus
+    error: str | None = None
+    message_type: str = "report_job_update"
+    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+
 # For tracking connected clients subscriber ID (instance_id -> socket sid)
 tab_clients: dict[str, str] = {}
 
@@ -170,6 +187,15 @@ def emit_report_generated(report_generated: ReportGenerated):
         pass  # Can silently pass since we know the NameError is from sockets being disabled
 
 
+def emit_report_job_update(update: ReportJobUpdate, instance_ids):
+    """Emit a perf report job status change to the tabs waiting on it."""
+    if socketio is None or not hasattr(socketio, "emit"):
+        return
+    data = update.to_dict()
+    for instance_id in instance_ids:
+        socketio.emit(Messages.REPORT_JOB_UPDATE, data, to=instance_id)
+
+
 def register_handlers(socketio_instance):
     global socketio
     socketio = socketio_instance
@@ -206,8 +232,11 @@ def register_handlers(socketio_instance):
                 instance_id = key
                 break
         if instance_id:
+            from ttnn_visualizer.perf_report_jobs import report_jobs
+
             leave_room(instance_id)
             del tab_clients[instance_id]
+            report_jobs.release(instance_id)
             logger.info(
                 f"Client disconnected from instanceId: {instance_id}, Socket ID: {sid}"
             )
@@ -2,13 +2,17 @@
 #
 # SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
 
+import hashlib
 import logging
 import os
 import shlex
 import subprocess
+import tempfile
+import threading
+import time
 from http import HTTPStatus
 from pathlib import Path
-from typing import List, NoReturn, Optional, Union
+from typing import Dict, List, NoReturn, Optional, Tuple, Union
 
 from ttnn_visualizer.enums import ConnectionTestStates
 from ttnn_visualizer.exceptions import (
@@ -93,6 +97,280 @@ def raise_for_ssh_subprocess_error(
     raise SSHException(f"SSH command failed: {e.stderr}")
 
 
+def ssh_auth_options(connection: RemoteConnection) -> List[str]:
+    """The never-prompt and identity options every ssh command is built with."""
+    options = []
+    identity = (getattr(connection, "identityFile", None) or "").strip()
+    if identity:
+        # Use empty config so only our -i key is tried (ignore ~/.ssh/config IdentityFile).
+        options.extend(["-F", os.devnull])
+    options.extend(["-o", "BatchMode=yes", "-o", "PasswordAuthentication=no"])
+    if identity:
+        options.extend(["-o", "IdentitiesOnly=yes", "-i", identity])
+    return options
+
+
+class SSHControlMasters:
+    """
+    Shared OpenSSH ControlMaster connections, one per (username, host, port,
+    identity file).
+
+    A master is started in the background (``ssh -M -N -f``) the first time a
+    command for its endpoint is built, and exits by itself after
+    ``persist_seconds`` unused. ssh, sftp and scp commands built with
+    ``options`` run over its already authenticated connection, so each costs
+    one round trip rather than a TCP and auth handshake. Worker processes
+    share masters, so none is stopped when the process that started it exits;
+    ``ControlPersist`` retires it once every worker has stopped using it.
+
+    Sockets are named by a hash of the endpoint in a private directory, which
+    keeps their paths inside the unix socket length limit and lets worker
+    processes share them. A master is health-probed (``ssh -O check``) at
+    most every ``PROBE_INTERVAL_SECONDS`` and replaced when it has gone; when
+    one can't be started, commands connect directly as before. Disabled
+    until ``configure`` sets a directory.
+    """
+
+    PROBE_INTERVAL_SECONDS = 30
+    PROBE_TIMEOUT_SECONDS = 5
+    # The most a command waits for its master to start; ``configure`` lowers it
+    START_TIMEOUT_SECONDS = 30
+    # After a master fails to start, connect directly for this long
+    START_RETRY_SECONDS = 60
+
+    def __init__(self):
+        self.directory: Optional[Path] = None
+        self.persist_seconds = 600
+        self.start_timeout_seconds = self.START_TIMEOUT_SECONDS
+        self._lock = threading.Lock()
+        self._endpoint_locks: Dict[Tuple[str, str, int, str], threading.Lock] = {}
+        self._checked: Dict[Tuple[str, str, int, str], float] = {}
+        self._failed: Dict[Tuple[str, str, int, str], float] = {}
+
+    def configure(
+        self,
+        directory: Optional[Union[str, Path]],
+        persist_seconds: int = 600,
+        start_timeout_seconds: Optional[int] = None,
+    ):
+        """
+        ``start_timeout_seconds`` caps the wait for a master to start, which
+        the first command for an endpoint blocks on; it is never above
+        ``START_TIMEOUT_SECONDS``.
+        """
+        with self._lock:
+            self.directory = (
+                Path(directory) if directory and os.name == "posix" else None
+            )
+            self.persist_seconds = persist_seconds
+            self.start_timeout_seconds = min(
+                start_timeout_seconds or self.START_TIMEOUT_SECONDS,
+                self.START_TIMEOUT_SECONDS,
+            )
+            self._checked.clear()
+            self._failed.clear()
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    @staticmethod
+    def _endpoint(connection: RemoteConnection) -> Tuple[str, str, int, str]:
+        # A master authenticates once, so each identity file needs its own
+        identity = (getattr(connection, "identityFile", None) or "").strip()
+        return (connection.username, connection.host, connection.port, identity)
+
+    @staticmethod
+    def _destination(connection: RemoteConnection) -> str:
+        return f"{connection.username}@{connection.host}"
+
+    def socket_path(self, connection: RemoteConnection) -> Path:
+        directory = self.directory
+        if directory is None:
+            raise RuntimeError("SSH control masters are not configured")
+        endpoint = "{}@{}:{} {}".format(*self._endpoint(connection))
+        return directory / f"{hashlib.sha1(endpoint.encode()).hexdigest()[:16]}"
+
+    def options(self, connection: RemoteConnection) -> List[str]:
+        """
+        ssh ``-o`` options that route a command through the endpoint's master,
+        starting one if needed, or none when there is no usable master.
+        """
+        if not self.enabled:
+            return []
+        endpoint = self._endpoint(connection)
+        with self._lock:
+            endpoint_lock = self._endpoint_locks.setdefault(endpoint, threading.Lock())
+        with endpoint_lock:
+            now = time.monotonic()
+            if (
+                now - self._checked.get(endpoint, float("-inf"))
+                < self.PROBE_INTERVAL_SECONDS
+            ):
+                return self._client_options(connection)
+            if (
+                now - self._failed.get(endpoint, float("-inf"))
+                < self.START_RETRY_SECONDS
+            ):
+                return []
+            if self.check(connection) or self._start(connection):
+                self._checked[endpoint] = time.monotonic()
+                return self._client_options(connection)
+            self._failed[endpoint] = time.monotonic()
+            return []
+
+    def _client_options(self, connection: RemoteConnection) -> List[str]:
+        # ControlMaster=no: a command never becomes a master itself, and
+        # connects directly if the socket has gone since the last probe.
+        return [
+            "-o",
+            "ControlMaster=no",
+            "-o",
+            f"ControlPath={self.socket_path(connection)}",
+        ]
+
+    def check(self, connection: RemoteConnection) -> bool:
+        """Whether the endpoint's master is up and accepting commands."""
+        if not self.enabled or not self.socket_path(connection).exists():
+            return False
+        try:
+            result = subprocess.run(
+                [
+                    "ssh",
+                    "-o",
+                    f"ControlPath={self.socket_path(connection)}",
+                    "-O",
+                    "check",
+                    self._destination(connection),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=self.PROBE_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0
+
+    def _private_directory(self) -> bool:
+        directory = self.directory
+        if directory is None:
+            return False
+        try:
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            stat = directory.stat()
+        except OSError as e:
+            logger.warning(f"Cannot create SSH control directory {directory}: {e}")
+            return False
+        if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+            logger.warning(
+                f"SSH control directory {directory} is not private to this "
+                "user; not multiplexing SSH connections"
+            )
+            return False
+        return True
+
+    def _start(self, connection: RemoteConnection) -> bool:
+        if not self._private_directory():
+            return False
+        path = self.socket_path(connection)
+        lock_path = path.with_suffix(".lock")
+        with open(lock_path, "w") as lock_file:
+            # Another worker process may be starting the same master
+            if not self._lock_file(lock_file):
+                return False
+            if self.check(connection):
+                return True
+            # A socket left by a master that died would block the new one
+            path.unlink(missing_ok=True)
+            command = [
+                "ssh",
+                *ssh_auth_options(connection),
+                "-o",
+                "ControlMaster=yes",
+                "-o",
+                f"ControlPath={path}",
+                "-o",
+                f"ControlPersist={self.persist_seconds}",
+                "-o",
+                f"ConnectTimeout={self.start_timeout_seconds}",
+                "-N",
+                "-f",
+            ]
+            if connection.port != 22:
+                command.extend(["-p", str(connection.port)])
+            command.append(self._destination(connection))
+            # The backgrounded master keeps stderr open, so it goes to a file
+            # rather than a pipe that would never reach EOF.
+            with tempfile.TemporaryFile() as stderr:
+                try:
+                    result = subprocess.run(
+                        command,
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=stderr,
+                        timeout=self.start_timeout_seconds,
+                    )
+                except (OSError, subprocess.TimeoutExpired) as e:
+                    logger.warning(
+                        f"Could not start SSH master for {self._destination(connection)}: {e}"
+                    )
+                    return False
+                if result.returncode != 0:
+                    stderr.seek(0)
+                    logger.warning(
+                        f"Could not start SSH master for {self._destination(connection)}: "
+                        f"{stderr.read().decode(errors='replace').strip()}"
+                    )
+                    return False
+        logger.info(f"Started SSH master for {self._destination(connection)}")
+        return True
+
+    def _lock_file(self, lock_file) -> bool:
+        import fcntl
+
+        deadline = time.monotonic() + self.start_timeout_seconds
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() > deadline:
+                    return False
+                # A sleep rather than a blocking flock, which would stall gevent
+                time.sleep(0.1)
+
+    def close(self, connection: RemoteConnection):
+        """
+        Stop the endpoint's master, if any: ``-O stop`` refuses new commands
+        at once, and the master exits when the ones running have finished.
+        """
+        endpoint = self._endpoint(connection)
+        with self._lock:
+            self._checked.pop(endpoint, None)
+        if not self.enabled or not self.socket_path(connection).exists():
+            return
+        try:
+            subprocess.run(
+                [
+                    "ssh",
+                    "-o",
+                    f"ControlPath={self.socket_path(connection)}",
+                    "-O",
+                    "stop",
+                    self._destination(connection),
+                ],
+                capture_output=True,
+                timeout=self.PROBE_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(
+                f"Could not stop SSH master for {self._destination(connection)}: {e}"
+            )
+
+
+ssh_control_masters = SSHControlMasters()
+
+
 class SSHClient:
     """
     Centralized SSH client that handles all SSH/SFTP operations with consistent
@@ -111,14 +389,8 @@ class SSHClient:
 
     def _build_base_ssh_cmd(self) -> List[str]:
         """Build the base SSH command with common options. Never prompts for password."""
-        cmd = ["ssh"]
-        identity = (getattr(self.connection, "identityFile", None) or "").strip()
-        if identity:
-            # Use empty config so only our -i key is tried (ignore ~/.ssh/config IdentityFile).
-            cmd.extend(["-F", os.devnull])
-        cmd.extend(["-o", "BatchMode=yes", "-o", "PasswordAuthentication=no"])
-        if identity:
-            cmd.extend(["-o", "IdentitiesOnly=yes", "-i", identity])
+        cmd = ["ssh", *ssh_auth_options(self.connection)]
+        cmd.extend(ssh_control_masters.options(self.connection))
         if self.connection.port != 22:
             cmd.extend(["-p", str(self.connection.port)])
         cmd.append(f"{self.connection.username}@{self.connection.host}")
@@ -126,13 +398,8 @@ class SSHClient:
 
     def _build_base_sftp_cmd(self) -> List[str]:
         """Build the base SFTP command with common options. Never prompts for password."""
-        cmd = ["sftp"]
-        identity = (getattr(self.connection, "identityFile", None) or "").strip()
-        if identity:
-            cmd.extend(["-F", os.devnull])
-        cmd.extend(["-o", "BatchMode=yes", "-o", "PasswordAuthentication=no"])
-        if identity:
-            cmd.extend(["-o", "IdentitiesOnly=yes", "-i", identity])
+        cmd = ["sftp", *ssh_auth_options(self.connection)]
+        cmd.extend(ssh_control_masters.options(self.connection))
         if self.connection.port != 22:
             cmd.extend(["-P", str(self.connection.port)])
         cmd.extend(["-b", "-"])  # Read commands from stdin
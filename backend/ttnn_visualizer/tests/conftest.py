@@ -37,6 +37,8 @@ def app():
             "REPORT_DATA_DIRECTORY": tmpdir,
             "LOCAL_DATA_DIRECTORY": str(Path(tmpdir) / "local"),
             "REMOTE_DATA_DIRECTORY": str(Path(tmpdir) / "remote"),
+            # Tests mock subprocess; no real SSH masters
+            "SSH_CONTROL_MASTER": False,
         }
         app = create_app(settings_override=settings)
         yield app
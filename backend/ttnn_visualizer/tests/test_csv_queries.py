@@ -0,0 +1,817 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import orjson
+import pandas as pd
+from ttnn_visualizer.csv_queries import (
+    DataFrameCache,
+    DeviceLogProfilerQueries,
+    LocalCSVQueryRunner,
+    OpsPerformanceQueries,
+    OpsPerformanceReportQueries,
+    ReportResultCache,
+    TracyHostQueries,
+    columnar_engine_available,
+    columnar_sidecar_path,
+    convert_performance_report_in_background,
+    convert_performance_report_to_columnar,
+    dataframe_cache,
+    perf_report_cache,
+)
+from ttnn_visualizer.exceptions import DataFormatError
+from ttnn_visualizer.models import Instance
+from ttnn_visualizer.perf_report_jobs import ReportJobQueue
+
+DEVICE_LOG_CSV = """ARCH: wormhole_b0, CHIP_FREQ[MHz]: 1000
+PCIe slot, core_x, core_y, RISC processor type, timer_id, time[cycles since reset], stat value, run ID, run host ID,  zone name, zone phase, source line, source file
+0,1,1,BRISC,1,100,0,0,1,BRISC-FW,begin,10,fw.cc
+0,1,1,BRISC,1,250,0,0,1,BRISC-FW,end,10,fw.cc
+0,1,1,NCRISC,2,120,0,0,1,NCRISC-FW,begin,11,fw.cc
+0,1,1,NCRISC,2,180,0,0,1,NCRISC-FW,end,11,fw.cc
+"""
+
+OPS_PERF_CSV = """OP CODE, OP TYPE, DEVICE KERNEL DURATION [ns]
+ttnn.add,tt_dnn_device,100
+ttnn.relu,tt_dnn_device,
+"""
+
+
+def _write(path: Path, content: str):
+    path.write_text(content)
+    return path
+
+
+class TestDataFrameCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = DataFrameCache(max_bytes=10_000)
+
+    def _frame(self, rows):
+        return pd.DataFrame({"value": range(rows)})
+
+    def _key(self, name, mtime=1):
+        return (name, mtime, 0, 0, None)
+
+    def test_hit_returns_the_cached_frame_without_reloading(self):
+        loader = mock.Mock(return_value=self._frame(10))
+
+        first = self.cache.get_or_load(self._key("a.csv"), loader)
+        second = self.cache.get_or_load(self._key("a.csv"), loader)
+
+        self.assertIs(first, second)
+        loader.assert_called_once()
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_changed_mtime_replaces_the_stale_entry(self):
+        self.cache.get_or_load(self._key("a.csv", mtime=1), lambda: self._frame(10))
+        self.cache.get_or_load(self._key("a.csv", mtime=2), lambda: self._frame(10))
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["misses"], 2)
+
+    def test_least_recently_used_entry_is_evicted_over_budget(self):
+        frame_bytes = int(self._frame(400).memory_usage(deep=True).sum())
+        self.cache.configure(max_bytes=frame_bytes * 2)
+
+        self.cache.get_or_load(self._key("a.csv"), lambda: self._frame(400))
+        self.cache.get_or_load(self._key("b.csv"), lambda: self._frame(400))
+        self.cache.get_or_load(self._key("a.csv"), mock.Mock())  # touch a
+        self.cache.get_or_load(self._key("c.csv"), lambda: self._frame(400))
+
+        loader = mock.Mock(return_value=self._frame(400))
+        self.cache.get_or_load(self._key("a.csv"), loader)
+        loader.assert_not_called()
+        self.cache.get_or_load(self._key("b.csv"), loader)
+        loader.assert_called_once()
+        self.assertGreaterEqual(self.cache.stats()["evictions"], 1)
+        self.assertLessEqual(self.cache.stats()["bytes"], frame_bytes * 2)
+
+    def test_frame_larger_than_budget_is_not_cached(self):
+        self.cache.configure(max_bytes=1)
+
+        self.cache.get_or_load(self._key("a.csv"), lambda: self._frame(10))
+
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+
+class TestLocalCSVQueryRunnerCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmpdir.name)
+        dataframe_cache.clear()
+
+    def tearDown(self):
+        dataframe_cache.clear()
+        self.tmpdir.cleanup()
+
+    def test_repeat_queries_reuse_the_parsed_device_log(self):
+        _write(
+            self.directory / DeviceLogProfilerQueries.DEVICE_LOG_FILE, DEVICE_LOG_CSV
+        )
+        instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+
+        with mock.patch(
+            "ttnn_visualizer.csv_queries.pd.read_csv", wraps=pd.read_csv
+        ) as read_csv:
+            with DeviceLogProfilerQueries(instance) as csv:
+                first = csv.query_zone_statistics("BRISC-FW", as_dict=True)
+            with DeviceLogProfilerQueries(instance) as csv:
+                second = csv.query_zone_statistics("BRISC-FW", as_dict=True)
+
+        read_csv.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 2)
+        self.assertIn("zone_name", first[0])
+
+    def test_rewritten_file_is_reloaded(self):
+        path = _write(self.directory / "ops_perf_results.csv", OPS_PERF_CSV)
+        instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+
+        with OpsPerformanceQueries(instance) as csv:
+            self.assertEqual(len(csv.get_all_entries()), 2)
+
+        _write(path, OPS_PERF_CSV + "ttnn.gelu,tt_dnn_device,50\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with OpsPerformanceQueries(instance) as csv:
+            entries = csv.get_all_entries(as_dict=True)
+
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(dataframe_cache.stats()["entries"], 1)
+
+    def test_nulls_in_numeric_columns_become_none(self):
+        _write(self.directory / "ops_perf_results.csv", OPS_PERF_CSV)
+        instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+
+        with OpsPerformanceQueries(instance) as csv:
+            as_dicts = csv.get_all_entries(as_dict=True)
+            as_lists = csv.get_all_entries()
+
+        self.assertIsNone(as_dicts[1]["DEVICE_KERNEL_DURATION_[ns]"])
+        self.assertEqual(as_dicts[0]["DEVICE_KERNEL_DURATION_[ns]"], 100.0)
+        self.assertEqual(as_lists[1], ["ttnn.relu", "tt_dnn_device", None])
+
+    def test_json_path_matches_dict_path(self):
+        _write(
+            self.directory / DeviceLogProfilerQueries.DEVICE_LOG_FILE, DEVICE_LOG_CSV
+        )
+        _write(self.directory / "ops_perf_results.csv", OPS_PERF_CSV)
+        instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+
+        with DeviceLogProfilerQueries(instance) as csv:
+            self.assertEqual(
+                csv.get_all_entries_json(limit=3),
+                orjson.dumps(csv.get_all_entries(as_dict=True, limit=3)),
+            )
+            self.assertEqual(
+                csv.query_zone_statistics_json("BRISC-FW"),
+                orjson.dumps(csv.query_zone_statistics("BRISC-FW", as_dict=True)),
+            )
+        with OpsPerformanceQueries(instance) as csv:
+            self.assertEqual(
+                csv.get_all_entries_json(),
+                orjson.dumps(csv.get_all_entries(as_dict=True)),
+            )
+
+    def test_missing_file_raises_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            with LocalCSVQueryRunner(self.directory / "missing.csv"):
+                pass
+
+
+class TestStreamingCSVQueries(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmpdir.name)
+        _write(
+            self.directory / DeviceLogProfilerQueries.DEVICE_LOG_FILE, DEVICE_LOG_CSV
+        )
+        self.instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+        dataframe_cache.clear()
+
+    def tearDown(self):
+        dataframe_cache.clear()
+        self.tmpdir.cleanup()
+
+    def _query(self, fn):
+        with DeviceLogProfilerQueries(self.instance) as csv:
+            return fn(csv)
+
+    def _streamed(self, fn):
+        with (
+            mock.patch.object(LocalCSVQueryRunner, "STREAMING_THRESHOLD_BYTES", 0),
+            mock.patch.object(LocalCSVQueryRunner, "STREAMING_CHUNK_ROWS", 1),
+        ):
+            return self._query(fn)
+
+    def test_streamed_results_match_loaded_results(self):
+        misses_before = dataframe_cache.stats()["misses"]
+        for fn in (
+            lambda csv: csv.get_all_entries(as_dict=True),
+            lambda csv: csv.get_all_entries(limit=3),
+            lambda csv: csv.query_zone_statistics("NCRISC-FW", as_dict=True),
+            lambda csv: csv.query_zone_statistics("missing", as_dict=True),
+            lambda csv: csv.get_all_entries_json(limit=2),
+        ):
+            self.assertEqual(self._streamed(fn), self._query(fn))
+        # Only the non-streamed reads went through the cache.
+        self.assertEqual(dataframe_cache.stats()["misses"] - misses_before, 1)
+
+    def test_streaming_stops_once_limit_is_reached(self):
+        with mock.patch.object(
+            LocalCSVQueryRunner,
+            "_apply_filters",
+            wraps=LocalCSVQueryRunner._apply_filters,
+        ) as apply_filters:
+            rows = self._streamed(lambda csv: csv.get_all_entries(limit=1))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(apply_filters.call_count, 1)
+
+    def test_streaming_reads_only_needed_columns(self):
+        with mock.patch(
+            "ttnn_visualizer.csv_queries.pd.read_csv", wraps=pd.read_csv
+        ) as read_csv:
+            self._streamed(
+                lambda csv: csv.runner.execute_query(
+                    columns=["core_x"], filters={"zone name": "BRISC-FW"}
+                )
+            )
+
+        self.assertEqual(read_csv.call_args.kwargs["usecols"], ["core_x", "zone name"])
+        self.assertEqual(read_csv.call_args.kwargs["dtype"], {"zone name": "category"})
+
+    def test_streamed_logs_keep_derived_frames_out_of_the_cache(self):
+        statistics = self._streamed(lambda csv: csv.zone_duration_statistics())
+
+        self.assertEqual(
+            statistics, self._query(lambda csv: csv.zone_duration_statistics())
+        )
+        self.assertEqual(dataframe_cache.stats()["entries"], 2)
+        dataframe_cache.clear()
+        self._streamed(lambda csv: csv.zone_duration_statistics())
+        self._streamed(lambda csv: csv.query_cycle_window(start=0))
+        self.assertEqual(dataframe_cache.stats()["entries"], 0)
+
+
+class TestZoneIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        _write(
+            Path(self.tmpdir.name) / DeviceLogProfilerQueries.DEVICE_LOG_FILE,
+            DEVICE_LOG_CSV
+            + "0,1,1,BRISC,1,300,0,1,1,BRISC-FW,begin,10,fw.cc\n"
+            + "0,1,1,BRISC,1,340,0,1,1,BRISC-FW,end,10,fw.cc\n",
+        )
+        self.instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+        dataframe_cache.clear()
+
+    def tearDown(self):
+        dataframe_cache.clear()
+        self.tmpdir.cleanup()
+
+    def test_begin_and_end_markers_are_paired_per_run(self):
+        with DeviceLogProfilerQueries(self.instance) as csv:
+            index = csv.zone_index()
+
+        durations = index.set_index(["zone name", "run ID"])["duration"]
+        self.assertEqual(durations[("BRISC-FW", 0)], 150)
+        self.assertEqual(durations[("BRISC-FW", 1)], 40)
+        self.assertEqual(durations[("NCRISC-FW", 0)], 60)
+
+    def test_statistics_aggregate_runs_per_zone_core_and_risc(self):
+        with DeviceLogProfilerQueries(self.instance) as csv:
+            brisc, ncrisc = csv.zone_duration_statistics()
+
+        self.assertEqual(brisc["zone_name"], "BRISC-FW")
+        self.assertEqual(brisc["RISC_processor_type"], "BRISC")
+        self.assertEqual(
+            (brisc["count"], brisc["total"], brisc["min"], brisc["max"]),
+            (2, 190, 40, 150),
+        )
+        self.assertEqual(brisc["mean"], 95.0)
+        self.assertEqual(brisc["p50"], 95.0)
+        self.assertAlmostEqual(brisc["p99"], 148.9)
+        self.assertEqual(ncrisc["count"], 1)
+        self.assertEqual(ncrisc["p90"], 60.0)
+        orjson.dumps([brisc, ncrisc])
+
+    def test_zone_filter_and_index_is_built_once(self):
+        with mock.patch.object(
+            DeviceLogProfilerQueries,
+            "_build_zone_index",
+            autospec=True,
+            side_effect=DeviceLogProfilerQueries._build_zone_index,
+        ) as build:
+            with DeviceLogProfilerQueries(self.instance) as csv:
+                filtered = csv.zone_duration_statistics("NCRISC-FW")
+            with DeviceLogProfilerQueries(self.instance) as csv:
+                csv.zone_duration_statistics()
+
+        build.assert_called_once()
+        self.assertEqual([row["zone_name"] for row in filtered], ["NCRISC-FW"])
+
+
+class TestCycleWindow(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        # Rows deliberately out of cycle order, with a second core.
+        _write(
+            Path(self.tmpdir.name) / DeviceLogProfilerQueries.DEVICE_LOG_FILE,
+            DEVICE_LOG_CSV
+            + "0,2,3,BRISC,1,110,0,0,1,BRISC-FW,begin,10,fw.cc\n"
+            + "0,2,3,BRISC,1,260,0,0,1,BRISC-FW,end,10,fw.cc\n",
+        )
+        self.instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+        dataframe_cache.clear()
+
+    def tearDown(self):
+        dataframe_cache.clear()
+        self.tmpdir.cleanup()
+
+    def _window(self, **kwargs):
+        with DeviceLogProfilerQueries(self.instance) as csv:
+            rows = orjson.loads(csv.query_cycle_window(**kwargs))
+        return [row["time[cycles_since_reset]"] for row in rows]
+
+    def test_window_bounds_are_inclusive_and_sorted(self):
+        self.assertEqual(self._window(start=110, end=250), [110, 120, 180, 250])
+        self.assertEqual(self._window(start=251), [260])
+        self.assertEqual(self._window(end=99), [])
+        self.assertEqual(len(self._window()), 6)
+
+    def test_core_and_risc_filters_apply_within_the_window(self):
+        self.assertEqual(self._window(start=100, core_x=2, core_y=3), [110, 260])
+        self.assertEqual(self._window(core_x=1, risc="NCRISC"), [120, 180])
+        self.assertEqual(self._window(start=100, limit=2), [100, 110])
+
+    def test_cycle_order_is_built_once(self):
+        with mock.patch.object(
+            DeviceLogProfilerQueries,
+            "_build_cycle_order",
+            autospec=True,
+            side_effect=DeviceLogProfilerQueries._build_cycle_order,
+        ) as build:
+            self._window(start=100, end=200)
+            self._window(start=200)
+
+        build.assert_called_once()
+
+    def test_only_the_cycle_order_is_cached(self):
+        self._window(start=100)
+
+        with DeviceLogProfilerQueries(self.instance) as csv:
+            order = csv.cycle_order()
+        self.assertEqual(
+            list(order.columns),
+            [
+                DeviceLogProfilerQueries.CYCLES_COLUMN,
+                *DeviceLogProfilerQueries.CYCLE_WINDOW_FILTERS,
+                "position",
+            ],
+        )
+
+    def test_only_the_filtered_rows_within_the_limit_are_taken(self):
+        with mock.patch.object(
+            LocalCSVQueryRunner,
+            "take_rows",
+            autospec=True,
+            side_effect=LocalCSVQueryRunner.take_rows,
+        ) as take_rows:
+            self.assertEqual(self._window(core_x=1, limit=2), [100, 120])
+
+        positions = take_rows.call_args.args[1]
+        self.assertEqual(len(positions), 2)
+
+    def test_limit_is_defaulted_and_capped(self):
+        with mock.patch.object(DeviceLogProfilerQueries, "DEFAULT_WINDOW_LIMIT", 3):
+            with DeviceLogProfilerQueries(self.instance) as csv:
+                rows = orjson.loads(csv.query_cycle_window(limit=3))
+        self.assertEqual(len(rows), 3)
+        with mock.patch.object(DeviceLogProfilerQueries, "MAX_WINDOW_LIMIT", 4):
+            self.assertEqual(len(self._window(limit=100)), 4)
+
+    def test_streamed_window_is_one_chunked_pass(self):
+        with (
+            mock.patch.object(LocalCSVQueryRunner, "STREAMING_THRESHOLD_BYTES", 0),
+            mock.patch.object(LocalCSVQueryRunner, "STREAMING_CHUNK_ROWS", 2),
+            mock.patch.object(
+                DeviceLogProfilerQueries, "_build_cycle_order", autospec=True
+            ) as build,
+        ):
+            self.assertEqual(self._window(start=110, limit=3), [110, 120, 180])
+
+        build.assert_not_called()
+
+    def test_streamed_take_rows_keeps_the_requested_order(self):
+        with (
+            mock.patch.object(LocalCSVQueryRunner, "STREAMING_THRESHOLD_BYTES", 0),
+            mock.patch.object(LocalCSVQueryRunner, "STREAMING_CHUNK_ROWS", 2),
+            DeviceLogProfilerQueries(self.instance) as csv,
+        ):
+            assert csv.runner is not None
+            rows = csv.runner.take_rows(
+                np.array([5, 0, 3]), [DeviceLogProfilerQueries.CYCLES_COLUMN]
+            )
+        self.assertEqual(
+            rows[DeviceLogProfilerQueries.CYCLES_COLUMN].tolist(), [260, 100, 180]
+        )
+
+    def test_sidecar_and_streamed_windows_match_loaded_windows(self):
+        loaded = self._window(start=110, end=250, core_x=1)
+        with mock.patch.object(LocalCSVQueryRunner, "STREAMING_THRESHOLD_BYTES", 0):
+            self.assertEqual(self._window(start=110, end=250, core_x=1), loaded)
+        convert_performance_report_to_columnar(Path(self.tmpdir.name))
+        dataframe_cache.clear()
+        self.assertEqual(self._window(start=110, end=250, core_x=1), loaded)
+
+
+class TestCycleWindowView:
+    def test_inverted_window_is_a_bad_request(self, app, client, tmp_path):
+        from ttnn_visualizer.extensions import db
+        from ttnn_visualizer.models import InstanceTable
+
+        _write(tmp_path / DeviceLogProfilerQueries.DEVICE_LOG_FILE, DEVICE_LOG_CSV)
+        with app.app_context():
+            db.session.add(
+                InstanceTable(
+                    instance_id="window",
+                    active_report={},
+                    performance_path=str(tmp_path),
+                )
+            )
+            db.session.commit()
+
+        response = client.get(
+            "/api/performance/device-log/window",
+            query_string={"instanceId": "window", "start": 200, "end": 100},
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "start must not be after end"}
+
+
+KERNEL_ZONE_ROWS = """0,1,1,BRISC,1,100,0,0,7,BRISC-FW,begin,10,fw.cc
+0,1,1,BRISC,2,110,0,0,7,BRISC-KERNEL,begin,20,kernel.cc
+0,1,1,NCRISC,3,105,0,0,7,NCRISC-KERNEL,begin,20,kernel.cc
+0,1,1,BRISC,2,200,0,0,7,BRISC-KERNEL,end,20,kernel.cc
+0,1,1,NCRISC,3,220,0,0,7,NCRISC-KERNEL,end,20,kernel.cc
+0,1,1,BRISC,1,230,0,0,7,BRISC-FW,end,10,fw.cc
+0,2,1,BRISC,2,130,0,0,7,BRISC-KERNEL,begin,20,kernel.cc
+0,2,1,BRISC,2,160,0,0,7,BRISC-KERNEL,end,20,kernel.cc
+0,1,1,BRISC,2,400,0,1,8,BRISC-KERNEL,begin,20,kernel.cc
+0,1,1,BRISC,2,450,0,1,8,BRISC-KERNEL,end,20,kernel.cc
+"""
+
+
+class TestKernelDurations(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.device_log = (
+            Path(self.tmpdir.name) / DeviceLogProfilerQueries.DEVICE_LOG_FILE
+        )
+        self.instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+        dataframe_cache.clear()
+
+    def tearDown(self):
+        dataframe_cache.clear()
+        self.tmpdir.cleanup()
+
+    def _matrix(self, rows):
+        header = "".join(DEVICE_LOG_CSV.splitlines(keepends=True)[:2])
+        _write(self.device_log, header + rows)
+        with DeviceLogProfilerQueries(self.instance) as csv:
+            return csv.kernel_duration_matrix()
+
+    def test_core_duration_spans_all_risc_kernel_zones(self):
+        matrix = self._matrix(KERNEL_ZONE_ROWS)
+
+        self.assertEqual(matrix["frequency_mhz"], 1000)
+        self.assertEqual(
+            matrix["cores"],
+            [
+                {"device": 0, "core_x": 1, "core_y": 1},
+                {"device": 0, "core_x": 2, "core_y": 1},
+            ],
+        )
+        first, second = matrix["operations"]
+        # core (1,1): NCRISC begins at 105 and ends last at 220
+        self.assertEqual(first["run_host_id"], 7)
+        self.assertEqual(first["durations"], [115, 30])
+        self.assertEqual((first["min"], first["max"]), (30, 115))
+        self.assertEqual(second["durations"], [50, None])
+        orjson.dumps(matrix)
+
+    def test_unmatched_markers_are_ignored(self):
+        matrix = self._matrix(
+            KERNEL_ZONE_ROWS
+            + "0,3,3,BRISC,2,500,0,2,9,BRISC-KERNEL,begin,20,kernel.cc\n"
+        )
+
+        self.assertEqual(len(matrix["cores"]), 2)
+        self.assertEqual(len(matrix["operations"]), 2)
+
+    def test_log_without_kernel_zones_is_empty(self):
+        matrix = self._matrix(DEVICE_LOG_CSV.split("\n", 2)[2])
+
+        self.assertEqual((matrix["cores"], matrix["operations"]), ([], []))
+
+
+class TestReportResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmpdir.name)
+        self.perf_csv = _write(self.directory / "ops_perf_results.csv", OPS_PERF_CSV)
+        self.instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+        perf_report_cache.configure(self.directory / "cache", max_bytes=1024**2)
+        # Reports are generated, and cached, by the perf report jobs
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.jobs = ReportJobQueue(lambda: self.executor)
+        emit = mock.patch("ttnn_visualizer.perf_report_jobs.emit_report_job_update")
+        emit.start()
+        self.addCleanup(emit.stop)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        perf_report_cache.configure(None, max_bytes=0)
+        self.tmpdir.cleanup()
+
+    def _generate(self, **kwargs):
+        with mock.patch.object(
+            OpsPerformanceReportQueries,
+            "generate_report",
+            return_value={
+                "report": [{"id": "2"}],
+                "stacked_report": [],
+                "signposts": [],
+            },
+        ) as generate:
+            job = self.jobs.submit(self.instance, **kwargs)
+            self.jobs.wait(job)
+            # The body is cached by the job's done callback
+            self.executor.submit(lambda: None).result()
+            body = self.jobs.result(job)
+        assert body is not None
+        return orjson.loads(body), generate.call_count
+
+    def test_repeat_request_is_served_from_disk(self):
+        first, first_calls = self._generate(hide_host_ops=True)
+        second, second_calls = self._generate(hide_host_ops=True)
+
+        self.assertEqual((first_calls, second_calls), (1, 0))
+        self.assertEqual(first, second)
+        self.assertEqual(len(list((self.directory / "cache").glob("*.json"))), 1)
+
+    def test_options_and_file_changes_are_misses(self):
+        self._generate(start_signpost="a")
+        _, other_signpost_calls = self._generate(start_signpost="b")
+        _, toggled_back_calls = self._generate(start_signpost="a")
+
+        self.assertEqual((other_signpost_calls, toggled_back_calls), (1, 0))
+
+        _write(self.perf_csv, OPS_PERF_CSV + "ttnn.exp,tt_dnn_device,5\n")
+        os.utime(self.perf_csv, ns=(1, 1))
+        _, rewritten_calls = self._generate(start_signpost="a")
+        self.assertEqual(rewritten_calls, 1)
+
+    def test_least_recently_used_reports_are_evicted_over_budget(self):
+        cache = ReportResultCache(self.directory / "small", max_bytes=25)
+        cache.put(("a",), b"x" * 10)
+        cache.put(("b",), b"y" * 10)
+        os.utime(cache._path(cache.directory, ("a",)), ns=(1, 1))
+        os.utime(cache._path(cache.directory, ("b",)), ns=(2, 2))
+        self.assertEqual(cache.get(("a",)), b"x" * 10)  # refreshes "a"
+
+        cache.put(("c",), b"z" * 10)
+
+        self.assertIsNone(cache.get(("b",)))
+        self.assertEqual(cache.stats()["entries"], 2)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_unconfigured_cache_stores_nothing(self):
+        cache = ReportResultCache()
+        cache.put(("a",), b"x")
+
+        self.assertIsNone(cache.get(("a",)))
+
+
+@unittest.skipUnless(columnar_engine_available(), "pyarrow is not installed")
+class TestColumnarSidecar(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmpdir.name)
+        self.device_log = _write(
+            self.directory / DeviceLogProfilerQueries.DEVICE_LOG_FILE, DEVICE_LOG_CSV
+        )
+        _write(self.directory / "ops_perf_results_1.csv", OPS_PERF_CSV)
+        self.instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+        dataframe_cache.clear()
+
+    def tearDown(self):
+        dataframe_cache.clear()
+        self.tmpdir.cleanup()
+
+    def _zone_rows(self):
+        with DeviceLogProfilerQueries(self.instance) as csv:
+            return csv.query_zone_statistics("NCRISC-FW", as_dict=True)
+
+    def test_conversion_writes_typed_sidecars(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        written = convert_performance_report_to_columnar(self.directory)
+
+        self.assertEqual(
+            sorted(path.name for path in written),
+            ["ops_perf_results_1.parquet", "profile_log_device.parquet"],
+        )
+        schema = pq.read_schema(columnar_sidecar_path(self.device_log))
+        self.assertTrue(pa.types.is_dictionary(schema.field("zone name").type))
+        self.assertTrue(
+            pa.types.is_dictionary(schema.field("RISC processor type").type)
+        )
+        self.assertEqual(schema.field("time[cycles since reset]").type, pa.int64())
+
+    def test_sidecar_reads_match_csv_reads(self):
+        from_csv = self._zone_rows()
+        convert_performance_report_to_columnar(self.directory)
+
+        with mock.patch("ttnn_visualizer.csv_queries.pd.read_csv") as read_csv:
+            from_sidecar = self._zone_rows()
+            with DeviceLogProfilerQueries(self.instance) as csv:
+                limited = csv.get_all_entries(as_dict=False, limit=3)
+                by_timer = csv.query_by_timer_id("1")
+
+        read_csv.assert_not_called()
+        self.assertEqual(from_sidecar, from_csv)
+        self.assertEqual(len(limited), 3)
+        # A string never equals an integer column, on either path.
+        self.assertEqual(by_timer, [])
+
+    def test_stale_sidecar_is_ignored(self):
+        convert_performance_report_to_columnar(self.directory)
+        _write(
+            self.device_log,
+            DEVICE_LOG_CSV + "0,1,1,NCRISC,2,300,0,0,1,NCRISC-FW,begin,11,fw.cc\n",
+        )
+        sidecar_mtime = columnar_sidecar_path(self.device_log).stat().st_mtime_ns
+        os.utime(self.device_log, ns=(sidecar_mtime + 1, sidecar_mtime + 1))
+
+        self.assertEqual(len(self._zone_rows()), 3)
+
+    def test_sidecar_is_written_a_chunk_at_a_time(self):
+        from_csv = self._zone_rows()
+
+        with (
+            mock.patch.object(LocalCSVQueryRunner, "STREAMING_CHUNK_ROWS", 2),
+            mock.patch.object(LocalCSVQueryRunner, "_load", side_effect=AssertionError),
+        ):
+            written = convert_performance_report_to_columnar(self.directory)
+
+        self.assertIn(columnar_sidecar_path(self.device_log), written)
+        self.assertEqual(self._zone_rows(), from_csv)
+
+    def test_chunks_that_dont_fit_the_first_leave_no_sidecar(self):
+        _write(self.directory / "ops_perf_results_1.csv", OPS_PERF_CSV + "x,y,z\n")
+        runner = LocalCSVQueryRunner(self.directory / "ops_perf_results_1.csv")
+
+        with mock.patch.object(LocalCSVQueryRunner, "STREAMING_CHUNK_ROWS", 1):
+            self.assertIsNone(runner.write_columnar_sidecar())
+
+        self.assertEqual(
+            [path.name for path in self.directory.iterdir() if "parquet" in path.name],
+            [],
+        )
+
+    def test_request_handlers_convert_in_the_background_pool(self):
+        with mock.patch(
+            "ttnn_visualizer.csv_queries.background_offload.submit"
+        ) as submit:
+            convert_performance_report_in_background(self.directory)
+
+        submit.assert_called_once_with(
+            convert_performance_report_to_columnar, str(self.directory)
+        )
+
+    def test_conversion_is_skipped_without_pyarrow(self):
+        with mock.patch(
+            "ttnn_visualizer.csv_queries.columnar_engine_available",
+            return_value=False,
+        ):
+            self.assertEqual(convert_performance_report_to_columnar(self.directory), [])
+        self.assertFalse(columnar_sidecar_path(self.device_log).exists())
+
+
+# tracy-csvexport --unwrap output; zones are grouped by source location
+TRACY_EXPORT_CSV = """name,src_file,src_line,ns_since_start,exec_time_ns,thread
+TT_DNN_DEVICE_OP,op.cpp,10,100,50,1
+TT_DNN_DEVICE_OP,op.cpp,10,400,20,1
+ttnn.matmul,ops.py,5,90,400,2
+ttnn.add,ops.py,7,600,10,2
+"""
+
+
+class TestTracyHostQueries(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmpdir.name)
+        self.tracy = _write(self.directory / TracyHostQueries.TRACY_FILE, "capture")
+        self.instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+        dataframe_cache.clear()
+        # A stand-in for tracy-csvexport that prints a fixed export
+        self.csvexport = self.directory / "tracy-csvexport"
+        _write(self.directory / "export.csv", TRACY_EXPORT_CSV)
+        _write(self.csvexport, f"#!/bin/sh\ncat {self.directory / 'export.csv'}\n")
+        self.csvexport.chmod(0o755)
+        patcher = mock.patch.object(TracyHostQueries, "CSVEXPORT", str(self.csvexport))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        dataframe_cache.clear()
+        self.tmpdir.cleanup()
+
+    def _names(self, **window):
+        return TracyHostQueries(self.instance).query_window(**window)["columns"]["name"]
+
+    def test_zones_are_sorted_by_start(self):
+        zones = TracyHostQueries(self.instance).export_zones()
+
+        self.assertEqual(zones["start_ns"].tolist(), [90, 100, 400, 600])
+        self.assertEqual(zones["end_ns"].tolist(), [490, 150, 420, 610])
+
+    def test_window_includes_zones_that_started_before_it(self):
+        self.assertEqual(
+            self._names(start=420, end=500), ["ttnn.matmul", "TT_DNN_DEVICE_OP"]
+        )
+        self.assertEqual(self._names(start=495), ["ttnn.add"])
+        self.assertEqual(
+            self._names(name="TT_DNN_DEVICE_OP", end=120), ["TT_DNN_DEVICE_OP"]
+        )
+
+    def test_limit_reports_truncation(self):
+        window = TracyHostQueries(self.instance).query_window(limit=1)
+
+        self.assertEqual(window["total"], 4)
+        self.assertTrue(window["truncated"])
+
+    @unittest.skipUnless(columnar_engine_available(), "pyarrow is not installed")
+    def test_sidecar_reads_match_frame_reads(self):
+        windows = [{"start": 420, "end": 500}, {"start": 495}, {"end": 95}]
+        from_frame = [self._names(**window) for window in windows]
+
+        written = convert_performance_report_to_columnar(self.directory)
+
+        self.assertIn(columnar_sidecar_path(self.tracy), written)
+        with mock.patch.object(TracyHostQueries, "export_zones") as export:
+            from_sidecar = [self._names(**window) for window in windows]
+        export.assert_not_called()
+        self.assertEqual(from_sidecar, from_frame)
+
+    def test_tt_metal_export_is_used_without_the_tool(self):
+        _write(self.directory / TracyHostQueries.OPS_TIMES_FILE, TRACY_EXPORT_CSV)
+
+        with mock.patch.object(TracyHostQueries, "CSVEXPORT", "no-such-tool"):
+            self.assertEqual(len(self._names()), 4)
+
+    def test_capture_without_tool_or_export_is_an_error(self):
+        with mock.patch.object(TracyHostQueries, "CSVEXPORT", "no-such-tool"):
+            with self.assertRaises(DataFormatError):
+                TracyHostQueries(self.instance).export_zones()
+
+    def test_failing_export_is_an_error(self):
+        _write(self.csvexport, "#!/bin/sh\necho 'bad capture' >&2\nexit 1\n")
+
+        with self.assertRaisesRegex(DataFormatError, "bad capture"):
+            TracyHostQueries(self.instance).export_zones()
+
+
+class TestCacheStatsViews:
+    def test_csv_cache_stats_are_local_only(self, app, client):
+        assert app.config["SERVER_MODE"] is True
+
+        assert client.get("/api/performance/csv-cache").status_code == 403
+
+        app.config["SERVER_MODE"] = False
+        response = client.get("/api/performance/csv-cache")
+        assert response.status_code == 200
+        assert "entries" in response.get_json()
+
+    def test_report_cache_stats_are_local_only(self, app, client):
+        assert client.get("/api/performance/report-cache").status_code == 403
+
+        app.config["SERVER_MODE"] = False
+        response = client.get("/api/performance/report-cache")
+        assert response.status_code == 200
+        assert "entries" in response.get_json()
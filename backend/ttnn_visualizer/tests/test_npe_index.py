@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from pathlib import Path
+from unittest import mock
+
+import orjson
+import pytest
+import zstd
+from ttnn_visualizer.npe_index import (
+    CHUNK_TIMESTEPS,
+    NPETimelineIndex,
+    build_index,
+    index_path,
+)
+
+CYCLES_PER_TIMESTEP = 100
+TIMESTEP_COUNT = CHUNK_TIMESTEPS * 2 + 10
+
+
+def _timeline():
+    timesteps = [
+        {
+            "start_cycle": i * CYCLES_PER_TIMESTEP,
+            "end_cycle": (i + 1) * CYCLES_PER_TIMESTEP,
+            "active_transfers": list(range(i % 4)),
+            "avg_link_util": float(i % 10),
+            "avg_link_demand": float(i % 10) * 2,
+            "link_demand": [[0, 1, 1, "NOC0_OUT", float(i)]],
+        }
+        for i in range(TIMESTEP_COUNT)
+    ]
+    transfers = [
+        # Spans the first chunk boundary
+        {"id": 0, "start_cycle": 25_000, "end_cycle": 26_000},
+        {"id": 1, "start_cycle": 100, "end_cycle": 150},
+    ]
+    return {
+        "common_info": {"cycles_per_timestep": CYCLES_PER_TIMESTEP},
+        "chips": {"0": [0, 0]},
+        "noc_transfers": transfers,
+        "timestep_data": timesteps,
+    }
+
+
+@pytest.fixture
+def timeline_path(tmp_path):
+    path = tmp_path / "timeline.json.zst"
+    path.write_bytes(zstd.compress(orjson.dumps(_timeline())))
+    return path
+
+
+@pytest.fixture
+def index(timeline_path):
+    build_index(str(timeline_path))
+    return NPETimelineIndex.find(timeline_path)
+
+
+def test_index_is_written_beside_the_timeline(timeline_path, index):
+    assert index.path == index_path(timeline_path)
+    assert index.path.name.startswith(".")
+    assert len(index.manifest["chunks"]) == 3
+    assert index.manifest["chunks"][1]["max_link_demand"] == 2 * CHUNK_TIMESTEPS - 1
+
+
+def test_wide_window_is_summarized(index):
+    window = index.window(resolution=10)
+
+    assert window["level"] == "summary"
+    assert window["timesteps"] == TIMESTEP_COUNT
+    assert len(window["summary"]) == 10
+    assert sum(bucket["timesteps"] for bucket in window["summary"]) == TIMESTEP_COUNT
+    assert window["summary"][-1]["max_link_demand"] == TIMESTEP_COUNT - 1
+    assert max(bucket["active_transfers"] for bucket in window["summary"]) == 3
+
+
+def test_narrow_window_returns_raw_timesteps_and_transfers(index):
+    window = index.window(start=25_050, end=25_750, resolution=100)
+
+    assert window["level"] == "raw"
+    cycles = [t["start_cycle"] for t in window["timestep_data"]]
+    assert cycles == list(range(25_000, 25_800, CYCLES_PER_TIMESTEP))
+    # Stored with both chunks it spans, returned once
+    assert [t["id"] for t in window["noc_transfers"]] == [0]
+
+
+def test_window_past_the_end_is_empty(index):
+    window = index.window(start=10**9, end=10**9 + 1)
+
+    assert window["timesteps"] == 0
+    assert window["timestep_data"] == []
+
+
+def test_rewritten_timeline_needs_a_new_index(timeline_path, index):
+    stat = timeline_path.stat()
+    os.utime(timeline_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert NPETimelineIndex.find(timeline_path) is None
+
+
+def test_unwritable_directory_falls_back_to_the_temp_dir(timeline_path):
+    with mock.patch(
+        "ttnn_visualizer.npe_index.index_path",
+        return_value=Path("/proc/ttnn-visualizer/index"),
+    ):
+        written = build_index(str(timeline_path))
+        found = NPETimelineIndex.find(timeline_path)
+
+    assert found.path == Path(written)
+    Path(written).unlink()
+
+
+@pytest.fixture
+def window_query(app, timeline_path):
+    from ttnn_visualizer.extensions import db
+    from ttnn_visualizer.models import InstanceTable
+
+    npe_dir = timeline_path.parent / "performance" / "npe_viz"
+    npe_dir.mkdir(parents=True)
+    timeline_path.rename(npe_dir / timeline_path.name)
+    with app.app_context():
+        db.session.add(
+            InstanceTable(
+                instance_id="npe-window",
+                active_report={},
+                performance_path=str(npe_dir.parent),
+            )
+        )
+        db.session.commit()
+    return {"instanceId": "npe-window", "filename": timeline_path.name}
+
+
+def test_window_route_indexes_on_first_use(client, timeline_path, window_query):
+    with mock.patch(
+        "ttnn_visualizer.npe_index.run_in_process", side_effect=lambda fn, *a: fn(*a)
+    ):
+        response = client.get(
+            "/api/performance/npe/timeline/window",
+            query_string={**window_query, "resolution": 50},
+        )
+
+    data = response.get_json()
+    assert data["level"] == "summary"
+    assert data["common_info"] == {"cycles_per_timestep": CYCLES_PER_TIMESTEP}
+    npe_dir = timeline_path.parent / "performance" / "npe_viz"
+    assert index_path(npe_dir / timeline_path.name).exists()
+
+
+@pytest.mark.parametrize(
+    "error, status",
+    [
+        (BrokenProcessPool("worker died"), HTTPStatus.SERVICE_UNAVAILABLE),
+        (OSError("index unreadable"), HTTPStatus.UNPROCESSABLE_ENTITY),
+    ],
+)
+def test_window_route_maps_indexing_failures(client, window_query, error, status):
+    with mock.patch("ttnn_visualizer.npe_index.run_in_process", side_effect=error):
+        response = client.get(
+            "/api/performance/npe/timeline/window", query_string=window_query
+        )
+
+    assert response.status_code == status
+
+
+def test_transfers_without_an_id_are_kept_once(tmp_path):
+    timeline = _timeline()
+    # Spans the first chunk boundary too
+    timeline["noc_transfers"].append({"start_cycle": 25_500, "end_cycle": 25_700})
+    timeline["noc_transfers"].append({"start_cycle": 25_600, "end_cycle": 25_650})
+    path = tmp_path / "timeline.json.zst"
+    path.write_bytes(zstd.compress(orjson.dumps(timeline)))
+    build_index(str(path))
+
+    window = NPETimelineIndex.find(path).window(
+        start=25_050, end=25_750, resolution=100
+    )
+
+    assert window["noc_transfers"] == [
+        {"id": 0, "start_cycle": 25_000, "end_cycle": 26_000},
+        {"start_cycle": 25_500, "end_cycle": 25_700},
+        {"start_cycle": 25_600, "end_cycle": 25_650},
+    ]
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from http import HTTPStatus
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from ttnn_visualizer.decorators import concurrency_limit
+from ttnn_visualizer.offload import (
+    ConcurrencyLimit,
+    ConcurrencyLimitExceeded,
+    concurrency_limits,
+    get_concurrency_limit,
+    run_in_thread,
+    shutdown_offload,
+)
+
+
+def _hold(limit, entered, release):
+    with limit.acquire():
+        entered.release()
+        release.wait(timeout=5)
+
+
+def test_requests_past_the_queue_are_rejected():
+    limit = ConcurrencyLimit("test", max_concurrent=1, max_queued=1)
+    entered = threading.Semaphore(0)
+    release = threading.Event()
+    running = threading.Thread(target=_hold, args=(limit, entered, release))
+    queued = threading.Thread(target=_hold, args=(limit, entered, release))
+    running.start()
+    entered.acquire(timeout=5)
+    queued.start()
+    while limit.stats()["queued"] == 0:
+        time.sleep(0.001)
+
+    with pytest.raises(ConcurrencyLimitExceeded):
+        with limit.acquire():
+            pass
+
+    release.set()
+    running.join()
+    queued.join()
+    assert limit.stats() == {
+        "running": 0,
+        "queued": 0,
+        "max_concurrent": 1,
+        "max_queued": 1,
+        "rejected": 1,
+    }
+
+
+def test_slot_is_released_when_the_holder_raises():
+    limit = ConcurrencyLimit("test", max_concurrent=1, max_queued=0)
+
+    with pytest.raises(ValueError):
+        with limit.acquire():
+            raise ValueError()
+
+    with limit.acquire():
+        assert limit.stats()["running"] == 1
+
+
+def test_run_in_thread_calls_directly_without_gevent():
+    assert run_in_thread(threading.get_ident) == threading.get_ident()
+
+
+def test_route_over_its_limit_returns_503(app):
+    entered = threading.Event()
+    release = threading.Event()
+
+    @app.route("/test-limited")
+    @concurrency_limit("test-route", max_concurrent=1, max_queued=0)
+    def limited():
+        entered.set()
+        release.wait(timeout=5)
+        return "done"
+
+    try:
+        first = threading.Thread(target=app.test_client().get, args=("/test-limited",))
+        first.start()
+        entered.wait(timeout=5)
+
+        response = app.test_client().get("/test-limited")
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "5"
+        assert "test-route" in response.get_json()["error"]
+    finally:
+        release.set()
+        first.join()
+        concurrency_limits.pop("test-route", None)
+
+
+def test_shutdown_lets_the_process_exit_mid_job():
+    script = (
+        "import time\n"
+        "from ttnn_visualizer.offload import process_offload, shutdown_offload\n"
+        "if __name__ == '__main__':\n"
+        "    process_offload.configure(max_workers=1)\n"
+        "    process_offload.submit(time.sleep, 60)\n"
+        "    time.sleep(2)\n"
+        "    shutdown_offload()\n"
+    )
+    backend = Path(__file__).resolve().parents[2]
+
+    started = time.monotonic()
+    subprocess.run(
+        [sys.executable, "-c", script],
+        env={**os.environ, "PYTHONPATH": str(backend)},
+        check=True,
+        timeout=30,
+    )
+
+    # The worker is still sleeping; exit didn't wait for it
+    assert time.monotonic() - started < 30
+
+
+def test_app_shuts_the_pools_down_at_exit(tmp_path):
+    from ttnn_visualizer.app import create_app
+
+    settings = {
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'app.db'}",
+        "APP_DATA_DIRECTORY": str(tmp_path),
+        "REPORT_DATA_DIRECTORY": str(tmp_path),
+        "SSH_CONTROL_MASTER": False,
+    }
+    with mock.patch("ttnn_visualizer.app.atexit.register") as register:
+        create_app(settings_override=settings)
+
+    register.assert_called_once_with(shutdown_offload)
+
+
+def test_mismatched_limit_registration_is_refused():
+    get_concurrency_limit("test-mismatch", max_concurrent=1, max_queued=2)
+    try:
+        assert get_concurrency_limit("test-mismatch", 1, 2).max_queued == 2
+        with pytest.raises(ValueError):
+            get_concurrency_limit("test-mismatch", max_concurrent=2, max_queued=2)
+    finally:
+        concurrency_limits.pop("test-mismatch", None)
@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import json
+import sqlite3
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from unittest import mock
+
+from ttnn_visualizer.csv_queries import OpsPerformanceReportQueries
+from ttnn_visualizer.extensions import db
+from ttnn_visualizer.models import InstanceTable
+from ttnn_visualizer.perf_joined import (
+    collapse_device_repeats,
+    device_operation_names,
+    join_operations_with_perf,
+    map_device_operations,
+)
+from ttnn_visualizer.perf_report_jobs import report_jobs
+from ttnn_visualizer.queries import DatabaseQueries
+from ttnn_visualizer.tests.report_schemas import SCHEMA_V2
+
+
+def _graph(*names):
+    nodes = [{"node_type": "capture_start", "params": {}}]
+    for name in names:
+        nodes.append({"node_type": "function_start", "params": {"name": name}})
+        nodes.append({"node_type": "function_end", "params": {"name": name}})
+    return json.dumps(nodes)
+
+
+def _device(device_id):
+    return f"INSERT INTO devices VALUES ({device_id}{', 0' * 17});"
+
+
+_INSERTS_SQL = f"""
+{_device(0)}
+INSERT INTO operations VALUES
+(1, 'ttnn.matmul', 2.0),
+(2, 'ttnn.add', 1.0),
+(3, 'ttnn.relu', 0.5);
+INSERT INTO captured_graph VALUES
+(1, '{_graph("ttnn::matmul", "ttnn::prim::old_infra_device_operation", "Matmul")}'),
+(2, '{_graph("ttnn::add", "BinaryDeviceOperation")}'),
+(3, '{_graph("ttnn::relu", "UnaryDeviceOperation")}');
+INSERT INTO buffers VALUES
+(1, 0, 1024, 100, 1, 0),
+(1, 0, 4096, 300, 0, 0),
+(2, 0, 1024, 200, 1, 0);
+"""
+
+# Two devices: a matmul on both, an add on one only and a relu launched twice
+_MULTI_DEVICE_INSERTS_SQL = f"""
+{_device(0)}
+{_device(1)}
+INSERT INTO operations VALUES
+(1, 'ttnn.matmul', 2.0),
+(2, 'ttnn.add', 1.0),
+(3, 'ttnn.relu', 0.5);
+INSERT INTO captured_graph VALUES
+(1, '{_graph("ttnn::matmul", "Matmul", "Matmul")}'),
+(2, '{_graph("ttnn::add", "BinaryDeviceOperation")}'),
+(3, '{_graph(*["UnaryDeviceOperation"] * 4)}');
+"""
+
+
+def _row(perf_id, raw_op_code, device_time, op_type="tt_dnn_device"):
+    return {
+        "id": str(perf_id),
+        "op_code": raw_op_code,
+        "raw_op_code": raw_op_code,
+        "op_type": op_type,
+        "device_time": str(device_time),
+        "bound": "DRAM",
+        "flops_percent": "12.5",
+        "dram_percent": "",
+        "global_call_count": str(perf_id * 1024),
+    }
+
+
+class TestPerfJoined(unittest.TestCase):
+    def setUp(self):
+        connection = sqlite3.connect(":memory:")
+        connection.executescript(SCHEMA_V2)
+        connection.executescript(_INSERTS_SQL)
+        self.db = DatabaseQueries(connection=connection)
+
+    def tearDown(self):
+        self.db.query_runner.close()
+
+    def test_host_functions_are_not_device_operations(self):
+        self.assertEqual(
+            device_operation_names(_graph("ttnn::matmul", "Matmul", "ttnn.add")),
+            ["Matmul"],
+        )
+        self.assertEqual(device_operation_names("not json"), [])
+
+    def test_operations_align_with_perf_rows_in_order(self):
+        report = [
+            _row(2, "start", "", op_type="signpost"),
+            _row(3, "Matmul", 10.5),
+            _row(4, "BinaryDeviceOperation", 2),
+            _row(5, "UnaryDeviceOperation", 1),
+        ]
+
+        joined = join_operations_with_perf(self.db, report)
+
+        self.assertEqual(joined["matched"], 3)
+        columns = joined["columns"]
+        self.assertEqual(columns["operation_id"], [1, 2, 3])
+        self.assertEqual(columns["perf_id"], ["3", "4", "5"])
+        self.assertEqual(columns["device_time"], [10.5, 2.0, 1.0])
+        self.assertEqual(columns["dram_percent"], [None, None, None])
+        self.assertEqual(columns["global_call_count"], [3072, 4096, 5120])
+        self.assertEqual(columns["duration"], [2.0, 1.0, 0.5])
+        self.assertEqual(columns["peak_l1"], [100, 200, 0])
+        self.assertEqual(columns["buffer_count"], [2, 1, 0])
+
+    def test_alignment_stops_at_the_first_mismatch(self):
+        report = [
+            _row(2, "Matmul", 10.5),
+            _row(3, "Softmax", 2),
+            _row(4, "UnaryDeviceOperation", 1),
+        ]
+
+        joined = join_operations_with_perf(self.db, report)
+
+        self.assertEqual(joined["matched"], 1)
+        self.assertEqual(joined["device_operations"], 3)
+        self.assertEqual(joined["columns"]["operation_id"], [1])
+
+    def test_per_device_repeats_are_collapsed(self):
+        connection = sqlite3.connect(":memory:")
+        connection.executescript(SCHEMA_V2)
+        connection.executescript(_MULTI_DEVICE_INSERTS_SQL)
+        queries = DatabaseQueries(connection=connection)
+        try:
+            operations = list(queries.query_operations())
+            mapping = map_device_operations(queries, operations)
+        finally:
+            queries.query_runner.close()
+
+        self.assertEqual(
+            mapping,
+            [
+                (1, "Matmul"),
+                (2, "BinaryDeviceOperation"),
+                (3, "UnaryDeviceOperation"),
+                (3, "UnaryDeviceOperation"),
+            ],
+        )
+
+    def test_collapse_keeps_launches_on_fewer_devices(self):
+        self.assertEqual(collapse_device_repeats(["A", "A", "A"], 2), ["A", "A"])
+        self.assertEqual(collapse_device_repeats(["A", "B", "A"], 1), ["A", "B", "A"])
+
+
+class TestPerfJoinedView:
+    def test_requires_a_performance_report(self, client, make_report):
+        instance_id = make_report(inserts_sql=_INSERTS_SQL)
+
+        response = client.get(
+            "/api/operations/perf-joined", query_string={"instanceId": instance_id}
+        )
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_joins_the_generated_perf_report(self, app, client, tmp_path):
+        profiler_path = tmp_path / "db.sqlite"
+        connection = sqlite3.connect(profiler_path)
+        connection.executescript(SCHEMA_V2)
+        connection.executescript(_MULTI_DEVICE_INSERTS_SQL)
+        connection.close()
+        (tmp_path / "ops_perf_results.csv").write_text("OP CODE,OP TYPE\n")
+        with app.app_context():
+            db.session.add(
+                InstanceTable(
+                    instance_id="joined",
+                    active_report={},
+                    profiler_path=str(profiler_path),
+                    performance_path=str(tmp_path),
+                )
+            )
+            db.session.commit()
+        report = {
+            "report": [
+                _row(1, "Matmul", 10.5),
+                _row(2, "BinaryDeviceOperation", 2),
+                _row(3, "UnaryDeviceOperation", 1),
+            ],
+            "stacked_report": [],
+            "signposts": [],
+        }
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            mock.patch.object(report_jobs, "_executor_factory", lambda: executor),
+            mock.patch.object(
+                OpsPerformanceReportQueries, "generate_report", return_value=report
+            ),
+        ):
+            response = client.get(
+                "/api/operations/perf-joined", query_string={"instanceId": "joined"}
+            )
+
+        assert response.status_code == HTTPStatus.OK
+        joined = response.get_json()
+        assert joined["matched"] == 3
+        assert joined["device_operations"] == 4
+        assert joined["columns"]["operation_id"] == [1, 2, 3]
+        assert joined["columns"]["device_time"] == [10.5, 2.0, 1.0]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,13 +5,17 @@
 """Tests that the per-RISC kernel durations from the raw ops perf CSV are surfaced on
 the generated perf report rows (#1518)."""
 
+import csv
+import io
 import tempfile
 import unittest
 import zipfile
 from pathlib import Path
 from unittest import mock
 
-from ttnn_visualizer.csv_queries import OpsPerformanceReportQueries
+import orjson
+from ttnn_visualizer.csv_queries import OpsPerformanceReportQueries, perf_report_cache
+from ttnn_visualizer.exceptions import DataFormatError
 from ttnn_visualizer.models import Instance
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
@@ -154,19 +158,15 @@ class TestPerfReportKernelDurationSchemaCompatibility(unittest.TestCase):
                     + "\n"
                 )
 
-        instance = Instance(instance_id="test", performance_path="/tmp")
+        with tempfile.TemporaryDirectory() as performance_path:
+            Path(performance_path, "ops_perf_results.csv").write_text(raw_csv)
+            instance = Instance(instance_id="test", performance_path=performance_path)
 
-        with (
-            mock.patch(
-                "ttnn_visualizer.csv_queries.OpsPerformanceQueries.get_raw_csv",
-                return_value=raw_csv,
-            ),
-            mock.patch(
+            with mock.patch(
                 "ttnn_visualizer.csv_queries.perf_report.generate_perf_report",
                 side_effect=_fake_generate_perf_report,
-            ),
-        ):
-            report = OpsPerformanceReportQueries.generate_report(instance)["report"]
+            ):
+                report = OpsPerformanceReportQueries.generate_report(instance)["report"]
 
         self.assertEqual(len(report), 1)
         expected = {
@@ -184,5 +184,301 @@ class TestPerfReportKernelDurationSchemaCompatibility(unittest.TestCase):
             self.assertEqual(report[0][key], value)
 
 
+class TestOpsPerfResultsIndex(unittest.TestCase):
+    RAW_CSV = "\n".join(
+        [
+            "OP CODE,OP TYPE,PROGRAM HASH,PROGRAM CACHE HIT,DEVICE KERNEL DURATION [ns]",
+            "start,signpost,,,",
+            "Matmul,tt_dnn_device,123,True,1200",
+            "",
+            "start,signpost,,,",
+            "Add,tt_dnn_device,456,False",
+            "end,signpost,,,",
+            "",
+        ]
+    )
+
+    def setUp(self):
+        self.index = OpsPerformanceReportQueries.index_ops_perf_results(
+            io.BytesIO(self.RAW_CSV.encode())
+        )
+
+    def test_blank_lines_are_not_rows(self):
+        self.assertEqual(self.index.row_count, 5)
+        self.assertEqual(self.index.value(3, "OP CODE"), None)  # not indexed
+        self.assertEqual(self.index.value(3, "PROGRAM HASH"), "456")
+
+    def test_first_row_of_each_signpost_name_is_kept(self):
+        self.assertEqual(
+            self.index.signposts,
+            [{"id": 2, "op_code": "start"}, {"id": 6, "op_code": "end"}],
+        )
+
+    def test_every_signpost_occurrence_is_indexed_with_its_bytes(self):
+        raw = self.RAW_CSV.encode()
+        occurrences = self.index.signpost_occurrences
+
+        self.assertEqual(
+            [(o["id"], o["op_code"], o["ordinal"]) for o in occurrences],
+            [(2, "start", 0), (4, "start", 1), (6, "end", 0)],
+        )
+        for occurrence in occurrences:
+            line = raw[occurrence["offset"] : occurrence["end_offset"]]
+            self.assertTrue(
+                line.startswith(f"{occurrence['op_code']},signpost".encode())
+            )
+        self.assertEqual(raw[: self.index.data_offset], raw.split(b"\n")[0] + b"\n")
+
+    def test_short_rows_and_out_of_range_ids_give_none(self):
+        self.assertIsNone(self.index.value(3, "DEVICE KERNEL DURATION [ns]"))
+        self.assertIsNone(self.index.value(5, "OP TYPE"))
+        self.assertIsNone(self.index.value(-1, "OP TYPE"))
+
+    def test_hash_and_cache_hit_come_from_the_index(self):
+        row = OpsPerformanceReportQueries.set_hash_from_results({}, 1, self.index)
+
+        self.assertEqual(row, {"hash": "123", "cache_hit": True})
+
+    def test_input_shapes_prefer_the_padded_logical_columns(self):
+        dimensions = [
+            f"INPUT_{i}_{d}{suffix}"
+            for i in range(2)
+            for d in "WZYX"
+            for suffix in ("", "_PAD[LOGICAL]")
+        ]
+        raw = "\n".join(
+            [
+                ",".join(dimensions),
+                ",".join(["0", "1[1]"] * 8),
+                ",".join(["0", "1[1]"] * 4 + [""] * 8),
+            ]
+        )
+        index = OpsPerformanceReportQueries.index_ops_perf_results(
+            io.BytesIO(raw.encode())
+        )
+        shapes = OpsPerformanceReportQueries.INPUT_SHAPES_COLUMN
+
+        self.assertEqual(
+            index.value(0, shapes), "1[1]x1[1]x1[1]x1[1]; 1[1]x1[1]x1[1]x1[1]"
+        )
+        # An op with a single input
+        self.assertEqual(index.value(1, shapes), "1[1]x1[1]x1[1]x1[1]")
+        self.assertIsNone(self.index.value(0, shapes))
+
+
+class TestSignpostWindow(unittest.TestCase):
+    RAW_CSV = "\n".join(
+        [
+            "OP CODE,OP TYPE,DEVICE ID",
+            "warmup,tt_dnn_device,0",
+            "iteration,signpost,",
+            "Matmul,tt_dnn_device,0",
+            "",
+            "iteration,signpost,",
+            "Add,tt_dnn_device,0",
+            "Mul,tt_dnn_device,0",
+            "iteration,signpost,",
+            "Sub,tt_dnn_device,0",
+            "",
+        ]
+    )
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        Path(self.tmpdir.name, "ops_perf_results.csv").write_text(self.RAW_CSV)
+        self.instance = Instance(instance_id="test", performance_path=self.tmpdir.name)
+        self.index = OpsPerformanceReportQueries.index_ops_perf_results(
+            io.BytesIO(self.RAW_CSV.encode())
+        )
+        self.calls = []
+
+    def _window(self, *args):
+        return OpsPerformanceReportQueries.signpost_window(self.index, *args)
+
+    def test_same_start_and_end_name_ends_at_the_next_occurrence(self):
+        window = self._window("iteration", "iteration")
+
+        self.assertEqual((window.first_row, window.row_count), (2, 1))
+
+    def test_repeated_signposts_are_addressed_by_ordinal(self):
+        window = self._window("iteration", "iteration", 1, 2)
+
+        self.assertEqual((window.first_row, window.row_count), (4, 2))
+        self.assertEqual(self._window("iteration", None, 2).row_count, 1)
+
+    def test_unknown_signpost_is_left_to_tt_perf_report(self):
+        self.assertIsNone(self._window("missing", None))
+
+    def test_missing_or_reversed_ordinals_are_errors(self):
+        with self.assertRaises(DataFormatError):
+            self._window("iteration", None, 3)
+        with self.assertRaises(DataFormatError):
+            self._window("iteration", "iteration", 2, 1)
+
+    def _fake_generate_perf_report(self, *args):
+        self.calls.append(args)
+        with open(args[0][0], newline="") as input_file:
+            rows = [row for row in csv.DictReader(input_file)]
+        with open(args[8], "w", newline="") as output_file:
+            writer = csv.writer(output_file)
+            writer.writerow(REPORT_HEADER)
+            for index, row in enumerate(rows):
+                writer.writerow([index + 2, "", "", row["OP CODE"]])
+
+    def _report(self, **kwargs):
+        with mock.patch(
+            "ttnn_visualizer.csv_queries.perf_report.generate_perf_report",
+            side_effect=self._fake_generate_perf_report,
+        ):
+            return OpsPerformanceReportQueries.generate_report(self.instance, **kwargs)
+
+    def test_only_the_window_is_reported_with_file_row_ids(self):
+        result = self._report(
+            start_signpost="iteration",
+            end_signpost="iteration",
+            start_signpost_ordinal=1,
+            end_signpost_ordinal=2,
+        )
+
+        self.assertEqual(
+            [(row["id"], row["op_code"], row["op_type"]) for row in result["report"]],
+            [("6", "Add", "tt_dnn_device"), ("7", "Mul", "tt_dnn_device")],
+        )
+        # The range was cut out before tt-perf-report, which ignores signposts
+        start_signpost, end_signpost, ignore_signposts = self.calls[0][1:4]
+        self.assertEqual(
+            (start_signpost, end_signpost, ignore_signposts), (None, None, True)
+        )
+        self.assertEqual(
+            [o["ordinal"] for o in result["signpost_occurrences"]], [0, 1, 2]
+        )
+        self.assertEqual(result["signposts"], [{"id": 3, "op_code": "iteration"}])
+
+    def test_signposts_inside_the_window_follow_print_signposts(self):
+        window = dict(start_signpost="iteration", end_signpost="iteration")
+        window.update(start_signpost_ordinal=0, end_signpost_ordinal=2)
+
+        printed = self._report(print_signposts=True, **window)["report"]
+        hidden = self._report(print_signposts=False, **window)["report"]
+
+        self.assertEqual([row["id"] for row in printed], ["4", "5", "6", "7"])
+        self.assertEqual([row["id"] for row in hidden], ["4", "6", "7"])
+
+    def test_cached_signpost_index_only_reads_the_window(self):
+        perf_report_cache.configure(Path(self.tmpdir.name, "cache"), 1024**2)
+        self.addCleanup(perf_report_cache.configure, None, max_bytes=0)
+        self._report()
+
+        with mock.patch.object(
+            OpsPerformanceReportQueries,
+            "index_ops_perf_results",
+            wraps=OpsPerformanceReportQueries.index_ops_perf_results,
+        ) as index:
+            result = self._report(start_signpost="iteration", end_signpost="iteration")
+
+        self.assertEqual(index.call_args.args[1].first_row, 2)
+        self.assertEqual([row["id"] for row in result["report"]], ["4"])
+        self.assertEqual(len(result["signpost_occurrences"]), 3)
+
+
+class TestReportTable(unittest.TestCase):
+    ROWS = [
+        {
+            "id": "2",
+            "op_code": "Matmul",
+            "bound": "DRAM",
+            "device": "0",
+            "device_time": "10.5",
+        },
+        {
+            "id": "3",
+            "op_code": "Add",
+            "bound": "FLOP",
+            "device": "1",
+            "device_time": "2",
+        },
+        {
+            "id": "4",
+            "op_code": "start (signpost)",
+            "bound": "",
+            "device": "",
+            "device_time": "",
+        },
+        {
+            "id": "5",
+            "op_code": "matmul_1d",
+            "bound": "DRAM",
+            "device": "1",
+            "device_time": "7.25",
+        },
+    ]
+
+    def setUp(self):
+        self.body = orjson.dumps(
+            {
+                "report": self.ROWS,
+                "stacked_report": [{"op_code": "Matmul"}],
+                "signposts": [],
+            }
+        )
+        # Unique per test so cached tables don't leak between them
+        self.key = (f"/report/{self.id()}", 1, len(self.body), "options")
+
+    def _ids(self, **kwargs):
+        page = OpsPerformanceReportQueries.query_report_table(
+            self.key, self.body, **kwargs
+        )
+        return [row["id"] for row in page["report"]]
+
+    def test_rows_are_returned_unchanged_with_the_rest_of_the_report(self):
+        page = OpsPerformanceReportQueries.query_report_table(
+            self.key, self.body, limit=2
+        )
+
+        self.assertEqual(page["report"], self.ROWS[:2])
+        self.assertEqual(page["stacked_report"], [{"op_code": "Matmul"}])
+        self.assertEqual((page["total"], page["offset"], page["limit"]), (4, 0, 2))
+
+    def test_numeric_columns_sort_numerically_with_blanks_last(self):
+        self.assertEqual(self._ids(sort="device_time"), ["3", "5", "2", "4"])
+        self.assertEqual(
+            self._ids(sort="device_time", descending=True), ["2", "5", "3", "4"]
+        )
+
+    def test_text_columns_sort_case_insensitively(self):
+        self.assertEqual(self._ids(sort="op_code"), ["3", "2", "5", "4"])
+
+    def test_ties_keep_report_order_in_both_directions(self):
+        self.assertEqual(self._ids(sort="bound"), ["2", "5", "3", "4"])
+        self.assertEqual(self._ids(sort="bound", descending=True), ["3", "2", "5", "4"])
+        self.assertEqual(
+            self._ids(sort="device", descending=True), ["3", "5", "2", "4"]
+        )
+
+    def test_filters_combine_and_total_counts_every_match(self):
+        self.assertEqual(self._ids(op_code="MATMUL"), ["2", "5"])
+        self.assertEqual(self._ids(bound=["DRAM"], device=[1]), ["5"])
+        self.assertEqual(self._ids(min_device_time=7.25, sort="id"), ["2", "5"])
+
+        page = OpsPerformanceReportQueries.query_report_table(
+            self.key, self.body, sort="device_time", offset=1, limit=1
+        )
+        self.assertEqual([row["id"] for row in page["report"]], ["5"])
+        self.assertEqual(page["total"], 4)
+
+    def test_cached_table_size_counts_the_rows(self):
+        rows = [{**row, "advice": ["x" * 10_000]} for row in self.ROWS]
+        table = OpsPerformanceReportQueries.report_table(
+            self.key, lambda: {"report": rows}
+        )
+
+        self.assertGreater(table.memory_usage(deep=True).sum(), len(rows) * 10_000)
+
+    def test_unknown_sort_column_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self._ids(sort="advice")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,242 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import multiprocessing
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from ttnn_visualizer.csv_queries import OpsPerformanceReportQueries, perf_report_cache
+from ttnn_visualizer.exceptions import DataFormatError
+from ttnn_visualizer.models import Instance
+from ttnn_visualizer.perf_report_jobs import (
+    TREND_REPORT_OPTIONS,
+    TREND_SUBSCRIBER,
+    ReportJobQueue,
+)
+from ttnn_visualizer.perf_trends import perf_trend_store
+from ttnn_visualizer.sockets import ReportJobStatus
+
+OPS_PERF_CSV = """OP CODE,OP TYPE,DEVICE ID
+ttnn.add,tt_dnn_device,0
+"""
+
+
+class TestReportJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        Path(self.tmpdir.name, "ops_perf_results.csv").write_text(OPS_PERF_CSV)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.background_executor = ThreadPoolExecutor(max_workers=1)
+        self.queue = ReportJobQueue(
+            lambda: self.executor, lambda: self.background_executor
+        )
+        self.release_worker = threading.Event()
+        self.calls = []
+
+        def generate(performance_path, options, *cache_settings):
+            self.calls.append(options)
+            self.release_worker.wait(timeout=5)
+            if options.get("start_signpost") == "broken":
+                raise DataFormatError("bad CSV")
+            return b'{"report": []}'
+
+        patcher = mock.patch(
+            "ttnn_visualizer.perf_report_jobs.generate_report_body",
+            side_effect=generate,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        emit = mock.patch("ttnn_visualizer.perf_report_jobs.emit_report_job_update")
+        self.emit = emit.start()
+        self.addCleanup(emit.stop)
+
+    def tearDown(self):
+        self.release_worker.set()
+        self.executor.shutdown()
+        self.background_executor.shutdown()
+        perf_report_cache.configure(None, max_bytes=0)
+        self.tmpdir.cleanup()
+
+    def _instance(self, instance_id="tab-a"):
+        return Instance(instance_id=instance_id, performance_path=self.tmpdir.name)
+
+    def _wait(self, job):
+        future = job.future
+        if future is not None:
+            future.exception(timeout=5)
+        return job
+
+    def test_job_finishes_and_notifies_its_tab(self):
+        job = self.queue.submit(self._instance(), hide_host_ops=True)
+        self.assertEqual(job.status, ReportJobStatus.QUEUED)
+
+        self.release_worker.set()
+        self._wait(job)
+
+        self.assertEqual(job.status, ReportJobStatus.FINISHED)
+        self.assertEqual(job.result, b'{"report": []}')
+        self.assertIs(self.queue.get(job.job_id, "tab-a"), job)
+        update, subscribers = self.emit.call_args.args
+        self.assertEqual(update.status, ReportJobStatus.FINISHED)
+        self.assertEqual(subscribers, {"tab-a"})
+
+    def test_identical_in_flight_requests_share_one_job(self):
+        first = self.queue.submit(self._instance("tab-a"), group_by="op")
+        second = self.queue.submit(self._instance("tab-b"), group_by="op")
+        other = self.queue.submit(self._instance("tab-a"), group_by="device")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(first.subscribers, {"tab-a", "tab-b"})
+
+        self.release_worker.set()
+        self._wait(first)
+        self._wait(other)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_failure_is_reported(self):
+        self.release_worker.set()
+        job = self._wait(self.queue.submit(self._instance(), start_signpost="broken"))
+
+        self.assertEqual(job.status, ReportJobStatus.FAILED)
+        self.assertEqual(job.error, "bad CSV")
+        self.assertIsNone(job.result)
+
+    def test_disconnect_cancels_queued_jobs_nobody_waits_on(self):
+        running = self.queue.submit(self._instance("tab-a"), group_by="op")
+        queued = self.queue.submit(self._instance("tab-a"), group_by="device")
+        shared = self.queue.submit(self._instance("tab-a"), group_by="core")
+        self.queue.submit(self._instance("tab-b"), group_by="core")
+
+        self.queue.release("tab-a")
+
+        self.assertEqual(queued.status, ReportJobStatus.CANCELLED)
+        self.release_worker.set()
+        self._wait(running)
+        self._wait(shared)
+        # The running job can't be interrupted; the shared one still has tab-b
+        self.assertEqual(running.status, ReportJobStatus.FINISHED)
+        self.assertEqual(shared.status, ReportJobStatus.FINISHED)
+
+    def test_disconnect_leaves_jobs_a_request_is_blocked_on(self):
+        running = self.queue.submit(self._instance("tab-a"), group_by="op")
+        queued = self.queue.submit(self._instance("tab-a"), group_by="device")
+        waiter = threading.Thread(target=self.queue.wait, args=(queued,))
+        waiter.start()
+        while not queued.waiters:
+            time.sleep(0.01)
+
+        self.queue.release("tab-a")
+        self.release_worker.set()
+        waiter.join(timeout=5)
+        self._wait(running)
+
+        self.assertEqual(queued.status, ReportJobStatus.FINISHED)
+        self.assertEqual(queued.waiters, 0)
+
+    def test_jobs_are_only_visible_to_the_tabs_that_submitted_them(self):
+        job = self.queue.submit(self._instance("tab-a"), group_by="op")
+
+        self.assertIs(self.queue.get(job.job_id, "tab-a"), job)
+        self.assertIsNone(self.queue.get(job.job_id, "tab-b"))
+        self.assertIsNone(self.queue.get("unknown", "tab-a"))
+
+    def _trend_store(self, path):
+        return mock.patch.object(perf_trend_store, "path", path)
+
+    def test_trend_jobs_only_run_with_the_trend_store_on(self):
+        with self._trend_store(None):
+            self.assertIsNone(self.queue.submit_for_trends(self.tmpdir.name))
+
+        with self._trend_store(Path(self.tmpdir.name, "trends.db")):
+            job = self.queue.submit_for_trends(self.tmpdir.name)
+
+        self.assertTrue(job.background)
+        self.assertEqual(job.subscribers, {TREND_SUBSCRIBER})
+
+    def test_requests_take_over_queued_background_jobs(self):
+        other_run = Path(self.tmpdir.name, "other")
+        other_run.mkdir()
+        (other_run / "ops_perf_results.csv").write_text(OPS_PERF_CSV)
+        with self._trend_store(Path(self.tmpdir.name, "trends.db")):
+            running = self.queue.submit_for_trends(str(other_run))
+            queued = self.queue.submit_for_trends(self.tmpdir.name)
+
+            job = self.queue.submit(self._instance(), **TREND_REPORT_OPTIONS)
+
+        self.assertEqual(queued.status, ReportJobStatus.CANCELLED)
+        self.assertIsNot(job, queued)
+        self.assertFalse(job.background)
+        self.release_worker.set()
+        self._wait(job)
+        self._wait(running)
+        self.assertEqual(job.status, ReportJobStatus.FINISHED)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_cached_report_finishes_without_a_worker(self):
+        perf_report_cache.configure(Path(self.tmpdir.name, "cache"), 1024**2)
+        self.release_worker.set()
+        self._wait(self.queue.submit(self._instance(), tracing_mode=True))
+
+        job = self.queue.submit(self._instance(), tracing_mode=True)
+
+        self.assertEqual(job.status, ReportJobStatus.FINISHED)
+        self.assertIsNone(job.future)
+        self.assertIsNone(job.result)
+        self.assertEqual(self.queue.result(job), b'{"report": []}')
+        self.assertEqual(self.queue.wait(job), b'{"report": []}')
+        self.assertEqual(len(self.calls), 1)
+
+    def test_finished_jobs_leave_their_body_to_the_cache(self):
+        perf_report_cache.configure(Path(self.tmpdir.name, "cache"), 1024**2)
+        job = self.queue.submit(self._instance(), group_by="op")
+        future = job.future
+
+        self.release_worker.set()
+        future.exception(timeout=5)
+        # The done callback runs just after waiters are woken
+        deadline = time.monotonic() + 5
+        while job.future is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertIsNone(job.result)
+        self.assertIsNone(job.future)
+        self.assertEqual(self.queue.result(job), b'{"report": []}')
+
+        perf_report_cache.clear()
+        self.assertIsNone(self.queue.result(job))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestReportJobInProcessPool(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.csv_path = Path(self.tmpdir.name, "ops_perf_results.csv")
+        self.csv_path.write_text(OPS_PERF_CSV)
+        perf_report_cache.configure(Path(self.tmpdir.name, "cache"), 1024**2)
+        self.addCleanup(perf_report_cache.configure, None, max_bytes=0)
+        self.executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+        self.addCleanup(self.executor.shutdown)
+
+    def test_spawned_worker_stores_the_signpost_index(self):
+        queue = ReportJobQueue(lambda: self.executor)
+        instance = Instance(instance_id="tab-a", performance_path=self.tmpdir.name)
+
+        with mock.patch("ttnn_visualizer.perf_report_jobs.emit_report_job_update"):
+            job = queue.submit(instance)
+            job.future.exception(timeout=60)
+
+        key = OpsPerformanceReportQueries.signpost_index_cache_key(self.csv_path)
+        self.assertIsNotNone(perf_report_cache.get(key))
@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from ttnn_visualizer.perf_trends import (
+    PerfTrendStore,
+    input_signature,
+    perf_trend_store,
+    summarize_report,
+)
+
+
+def _row(op_code, global_call_count, device_time, shapes="1x1x32x32", **extra):
+    return {
+        "op_code": op_code,
+        "op_type": "tt_dnn_device",
+        "global_call_count": str(global_call_count),
+        "device_time": str(device_time),
+        "flops_percent": "40.0",
+        "dram_percent": "12.5 %",
+        "input_shapes": shapes,
+        "input_0_datatype": "BFLOAT16",
+        "input_1_datatype": "",
+        **extra,
+    }
+
+
+class TestSummarizeReport(unittest.TestCase):
+    def test_device_ops_are_summarized_by_key(self):
+        summaries = summarize_report(
+            [
+                _row("Matmul", 1024, 10.0),
+                # The same op on a second device keeps the slower time
+                _row("Matmul", 1024, 12.5),
+                _row("start", 0, "", op_type="signpost"),
+                _row("Host", 2048, ""),
+            ]
+        )
+
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0]["device_time"], 12.5)
+        self.assertEqual(summaries[0]["dram_percent"], 12.5)
+        self.assertEqual(summaries[0]["input_datatypes"], "BFLOAT16")
+
+    def test_signature_covers_shapes_and_datatypes(self):
+        base = _row("Matmul", 1, 1)
+
+        self.assertEqual(input_signature(base), input_signature(dict(base)))
+        self.assertNotEqual(
+            input_signature(base), input_signature({**base, "input_shapes": "2x2"})
+        )
+        self.assertNotEqual(
+            input_signature(base),
+            input_signature({**base, "input_0_datatype": "BFLOAT8_B"}),
+        )
+
+
+class TestPerfTrendStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.store = PerfTrendStore(Path(self.tmpdir.name, "trends.db"))
+
+    def _record(self, name, mtime, report):
+        performance_path = Path(self.tmpdir.name, name)
+        performance_path.mkdir(exist_ok=True)
+        csv_path = performance_path / "ops_perf_results.csv"
+        csv_path.write_text(name)
+        os.utime(csv_path, (mtime, mtime))
+        return self.store.record_run(performance_path, csv_path, report)
+
+    def test_disabled_store_records_nothing(self):
+        store = PerfTrendStore()
+
+        self.assertIsNone(store.record_run("run", "missing.csv", []))
+        self.assertEqual(store.trends("Matmul")["series"], [])
+
+    def test_trends_follow_csv_time_and_flag_the_latest_change(self):
+        self._record("run-b", 2000, [_row("Matmul", 1024, 11), _row("Add", 1, 5)])
+        self._record("run-a", 1000, [_row("Matmul", 1024, 9), _row("Add", 1, 5)])
+        self._record("run-c", 3000, [_row("Matmul", 1024, 11)])
+
+        trends = self.store.trends("Matmul")
+
+        self.assertEqual(
+            [run["name"] for run in trends["runs"]], ["run-a", "run-b", "run-c"]
+        )
+        (series,) = trends["series"]
+        self.assertEqual([p["device_time"] for p in series["points"]], [9, 11, 11])
+        self.assertEqual(series["baseline"], 10)
+        self.assertAlmostEqual(series["change_percent"], 10.0)
+        # Only the last two runs
+        self.assertEqual(
+            self.store.trends("Matmul", runs=2)["series"][0]["baseline"], 11
+        )
+
+    def test_shapes_and_call_counts_are_separate_series(self):
+        self._record(
+            "run",
+            1000,
+            [
+                _row("Matmul", 1024, 9),
+                _row("Matmul", 2048, 9),
+                _row("Matmul", 1024, 9, shapes="1x1x64x64"),
+            ],
+        )
+
+        trends = self.store.trends("Matmul")
+        self.assertEqual(len(trends["series"]), 3)
+        self.assertIsNone(trends["series"][0]["change_percent"])
+        self.assertEqual(
+            len(self.store.trends("Matmul", global_call_count=1024)["series"]), 2
+        )
+
+    def test_re_reporting_a_run_replaces_it(self):
+        self._record("run", 1000, [_row("Matmul", 1024, 9)])
+        self._record("run", 1000, [_row("Matmul", 1024, 7)])
+
+        trends = self.store.trends("Matmul")
+        self.assertEqual(len(trends["runs"]), 1)
+        self.assertEqual(trends["series"][0]["points"][0]["device_time"], 7)
+
+    def test_regressions_compare_the_latest_run_with_the_mean(self):
+        self._record("run-a", 1000, [_row("Matmul", 1, 10), _row("Add", 2, 10)])
+        self._record("run-b", 2000, [_row("Matmul", 1, 10), _row("Add", 2, 10)])
+        self._record(
+            "run-c",
+            3000,
+            [_row("Matmul", 1, 10.4), _row("Add", 2, 20), _row("New", 3, 1)],
+        )
+
+        regressions = self.store.regressions(threshold=5)["regressions"]
+
+        self.assertEqual([r["op_code"] for r in regressions], ["Add"])
+        self.assertAlmostEqual(regressions[0]["change_percent"], 100.0)
+        self.assertEqual(len(self.store.regressions(threshold=1)["regressions"]), 2)
+
+
+class TestPerfTrendsView:
+    def test_route_queries_the_configured_store(self, app, client):
+        assert perf_trend_store.path.parent == Path(app.config["APP_DATA_DIRECTORY"])
+
+        response = client.get("/api/performance/trends?op=Matmul")
+        regressions = client.get("/api/performance/trends")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"op_code": "Matmul", "runs": [], "series": []}
+        assert regressions.get_json() == {"runs": [], "regressions": []}
+
+    def test_run_count_is_bounded(self, client):
+        response = client.get("/api/performance/trends?op=Matmul&runs=0")
+
+        assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    unittest.main()
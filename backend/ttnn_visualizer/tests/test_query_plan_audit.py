@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import sqlite3
+import unittest
+
+from ttnn_visualizer.queries import DatabaseQueries
+from ttnn_visualizer.query_plan_audit import (
+    _audit_calls,
+    audit_query_plans,
+    format_audit,
+)
+from ttnn_visualizer.tests.report_schemas import SCHEMA_V2
+
+_INSERTS_SQL = """
+INSERT INTO operations VALUES (1, 'ttnn.add', 1.0), (2, 'ttnn.relu', 0.5);
+INSERT INTO buffers VALUES
+(1, 0, 1024, 64, 1, 0),
+(1, 0, 2048, 64, 0, 0),
+(2, 0, 1024, 64, 1, 0);
+INSERT INTO tensors VALUES
+(10, '[32, 32]', 'BFLOAT16', 'TILE', 'L1_INTERLEAVED', 0, 1024, 1);
+"""
+
+
+class TestQueryPlanAudit(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.executescript(SCHEMA_V2)
+        self.connection.executescript(_INSERTS_SQL)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def _findings(self, method, min_rows=1):
+        return [
+            finding
+            for statement in audit_query_plans(self.connection, min_rows=min_rows)
+            for finding in statement.findings
+            if finding.method == method
+        ]
+
+    def test_every_query_method_is_audited(self):
+        db = DatabaseQueries(connection=self.connection)
+        audited = {name.split("[")[0] for name, _ in _audit_calls(db)}
+        query_methods = {
+            name
+            for name in dir(DatabaseQueries)
+            if name.startswith("query_") and callable(getattr(DatabaseQueries, name))
+        }
+        self.assertEqual(query_methods - audited, set())
+
+    def test_filtered_scan_suggests_index_on_filter_columns(self):
+        (finding,) = self._findings("query_buffers")
+
+        self.assertEqual(finding.table, "buffers")
+        self.assertEqual(finding.rows, 3)
+        self.assertIn("SCAN", finding.detail)
+        self.assertEqual(
+            finding.suggested_index,
+            "CREATE INDEX IF NOT EXISTS idx_buffers_operation_id_buffer_type "
+            "ON buffers(operation_id, buffer_type)",
+        )
+
+    def test_suggested_index_removes_the_scan(self):
+        (finding,) = self._findings("query_buffers")
+        self.connection.execute(finding.suggested_index)
+
+        self.assertEqual(self._findings("query_buffers"), [])
+
+    def test_range_predicate_follows_equality_columns(self):
+        (finding,) = self._findings("query_next_buffer")
+
+        self.assertIn("buffers(address, operation_id)", finding.suggested_index)
+
+    def test_full_read_has_no_suggestion(self):
+        (finding,) = self._findings("query_devices", min_rows=0)
+
+        self.assertIsNone(finding.suggested_index)
+
+    def test_row_threshold_filters_small_tables(self):
+        self.assertEqual(self._findings("query_buffers", min_rows=4), [])
+
+    def test_format_lists_fix(self):
+        output = format_audit(audit_query_plans(self.connection, min_rows=1))
+
+        self.assertIn("query_buffers: SCAN buffers", output)
+        self.assertIn("fix: CREATE INDEX IF NOT EXISTS idx_buffers_", output)
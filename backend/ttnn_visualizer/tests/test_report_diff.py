@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import sqlite3
+import unittest
+from http import HTTPStatus
+
+import pytest
+from ttnn_visualizer.extensions import db
+from ttnn_visualizer.models import InstanceTable
+from ttnn_visualizer.queries import DatabaseQueries
+from ttnn_visualizer.report_diff import diff_reports
+from ttnn_visualizer.tests.report_schemas import SCHEMA_V2
+
+_BASE_INSERTS_SQL = """
+INSERT INTO operations VALUES
+(1, 'ttnn.matmul', 2.0),
+(2, 'ttnn.add', 1.0),
+(3, 'ttnn.matmul', 2.0),
+(4, 'ttnn.relu', 0.5);
+INSERT INTO operation_arguments VALUES
+(1, 'shape', '[32, 32]'),
+(2, 'shape', '[32, 32]'),
+(3, 'shape', '[32, 32]'),
+(4, 'shape', '[32, 32]');
+INSERT INTO buffers VALUES
+(1, 0, 1024, 100, 1, 0),
+(1, 0, 4096, 300, 0, 0),
+(3, 0, 1024, 200, 1, 0);
+INSERT INTO tensors VALUES
+(10, '[32, 32]', 'BFLOAT16', 'TILE', 'DRAM_INTERLEAVED', 0, 4096, 0);
+INSERT INTO output_tensors VALUES (1, 0, 10);
+"""
+
+# Same program with a slower second matmul, an L1 output, relu dropped and a
+# new gelu appended. Operation ids are shifted to prove alignment ignores them.
+_CANDIDATE_INSERTS_SQL = """
+INSERT INTO operations VALUES
+(11, 'ttnn.matmul', 2.5),
+(12, 'ttnn.add', 1.0),
+(13, 'ttnn.matmul', 5.0),
+(14, 'ttnn.gelu', 0.7);
+INSERT INTO operation_arguments VALUES
+(11, 'shape', '[32, 32]'),
+(12, 'shape', '[32, 32]'),
+(13, 'shape', '[32, 32]'),
+(14, 'shape', '[32, 32]');
+INSERT INTO buffers VALUES
+(11, 0, 1024, 400, 1, 0),
+(13, 0, 1024, 200, 1, 0);
+INSERT INTO tensors VALUES
+(20, '[32, 32]', 'BFLOAT16', 'TILE', 'L1_INTERLEAVED', 0, 1024, 1);
+INSERT INTO output_tensors VALUES (11, 0, 20);
+"""
+
+
+def _make_db(inserts_sql):
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(SCHEMA_V2)
+    connection.executescript(inserts_sql)
+    return DatabaseQueries(connection=connection)
+
+
+class TestDiffReports(unittest.TestCase):
+    def setUp(self):
+        self.base_db = _make_db(_BASE_INSERTS_SQL)
+        self.candidate_db = _make_db(_CANDIDATE_INSERTS_SQL)
+
+    def tearDown(self):
+        self.base_db.query_runner.close()
+        self.candidate_db.query_runner.close()
+
+    def _diff(self, window_size):
+        return diff_reports(self.base_db, self.candidate_db, window_size=window_size)
+
+    def test_operations_are_aligned_by_name_arguments_and_ordinal(self):
+        diff = self._diff(window_size=500)
+
+        pairs = [
+            (op["base_operation_id"], op["candidate_operation_id"])
+            for op in diff["operations"]
+        ]
+        self.assertEqual(pairs, [(1, 11), (2, 12), (3, 13)])
+        self.assertEqual(
+            [op["ordinal"] for op in diff["operations"]],
+            [0, 0, 1],
+        )
+
+    def test_deltas_and_memory_config_changes(self):
+        first_matmul, _, second_matmul = self._diff(window_size=500)["operations"]
+
+        self.assertAlmostEqual(first_matmul["duration_delta"], 0.5)
+        self.assertEqual(first_matmul["buffer_size_delta"], 0)
+        self.assertEqual(first_matmul["l1_size_delta"], 300)
+        self.assertEqual(len(first_matmul["memory_config_changes"]), 1)
+        self.assertEqual(first_matmul["memory_config_changes"][0]["output_index"], 0)
+
+        self.assertAlmostEqual(second_matmul["duration_delta"], 3.0)
+        self.assertEqual(second_matmul["memory_config_changes"], [])
+
+    def test_unmatched_operations_and_l1_peak(self):
+        diff = self._diff(window_size=500)
+
+        self.assertEqual(
+            diff["removed"], [{"operation_id": 4, "name": "ttnn.relu", "ordinal": 0}]
+        )
+        self.assertEqual(
+            diff["added"], [{"operation_id": 14, "name": "ttnn.gelu", "ordinal": 0}]
+        )
+        self.assertEqual(diff["l1_peak"], {"base": 200, "candidate": 400, "delta": 200})
+
+    def test_small_windows_give_the_same_result(self):
+        self.assertEqual(self._diff(window_size=1), self._diff(window_size=500))
+
+
+class TestReportDiffView:
+    @pytest.fixture
+    def query(self, app, tmp_path):
+        app.config["SERVER_MODE"] = False
+        for name, inserts_sql in (
+            ("active", ""),
+            ("base", _BASE_INSERTS_SQL),
+            ("candidate", _CANDIDATE_INSERTS_SQL),
+        ):
+            (tmp_path / name).mkdir()
+            connection = sqlite3.connect(tmp_path / name / "db.sqlite")
+            connection.executescript(SCHEMA_V2)
+            connection.executescript(inserts_sql)
+            connection.close()
+        with app.app_context():
+            db.session.add(
+                InstanceTable(
+                    instance_id="diff",
+                    active_report={},
+                    profiler_path=str(tmp_path / "active" / "db.sqlite"),
+                )
+            )
+            db.session.commit()
+        return {"instanceId": "diff"}
+
+    def test_reports_next_to_the_active_one_are_diffed(self, client, query):
+        response = client.get(
+            "/api/diff",
+            query_string={**query, "base": "base", "candidate": "candidate"},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        diff = response.get_json()
+        assert len(diff["operations"]) == 3
+        assert diff["l1_peak"]["delta"] == 200
+
+    def test_unknown_report_is_not_found(self, client, query):
+        response = client.get(
+            "/api/diff", query_string={**query, "base": "base", "candidate": "missing"}
+        )
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    @pytest.mark.parametrize("name", ["..", ".", "../active", "/etc"])
+    def test_names_outside_the_reports_directory_are_rejected(
+        self, client, query, name
+    ):
+        response = client.get(
+            "/api/diff", query_string={**query, "base": "base", "candidate": name}
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -11,8 +11,10 @@ import pytest
 from ttnn_visualizer.enums import SyncMethod
 from ttnn_visualizer.models import RemoteConnection
 from ttnn_visualizer.sftp_operations import (
+    DOWNLOAD_TIMEOUT_PER_BATCH,
     _scp_remote_target,
     _sftp_subsystem_unavailable,
+    download_files_sftp,
     download_single_file_sftp,
     get_active_sync_method,
 )
@@ -110,3 +112,58 @@ def test_active_sync_method_reflects_fallback_state(connection, tmp_path):
     ):
         download_single_file_sftp(connection, "/remote/a.txt", tmp_path / "a.txt")
     assert get_active_sync_method(connection) == SyncMethod.SCP
+
+
+def test_batch_downloads_in_one_sftp_session(connection, tmp_path):
+    transfers = [
+        ("/remote/a b.txt", tmp_path / "a b.txt"),
+        ("/remote/sub/c.txt", tmp_path / "sub" / "c.txt"),
+    ]
+    with patch(
+        "subprocess.run",
+        return_value=subprocess.CompletedProcess(args=["sftp"], returncode=0),
+    ) as run:
+        method = download_files_sftp(connection, transfers)
+
+    assert method == SyncMethod.SFTP
+    run.assert_called_once()
+    assert run.call_args.kwargs["input"] == (
+        f"get '/remote/a b.txt' '{tmp_path / 'a b.txt'}'\n"
+        f"get /remote/sub/c.txt {tmp_path / 'sub' / 'c.txt'}\n"
+        "quit\n"
+    )
+    assert (tmp_path / "sub").is_dir()
+
+
+def test_batch_session_timeout_is_capped(connection, tmp_path):
+    transfers = [(f"/remote/{n}.txt", tmp_path / f"{n}.txt") for n in range(64)]
+    with patch(
+        "subprocess.run",
+        return_value=subprocess.CompletedProcess(args=["sftp"], returncode=0),
+    ) as run:
+        download_files_sftp(connection, transfers)
+
+    assert run.call_args.kwargs["timeout"] == DOWNLOAD_TIMEOUT_PER_BATCH
+
+
+def test_batch_subsystem_failure_falls_back_to_scp_per_file(connection, tmp_path):
+    sftp_error = subprocess.CalledProcessError(
+        returncode=255,
+        cmd=["sftp"],
+        output="",
+        stderr="subsystem request failed on channel 0\n",
+    )
+    transfers = [
+        ("/remote/a.txt", tmp_path / "a.txt"),
+        ("/remote/b.txt", tmp_path / "b.txt"),
+    ]
+
+    with patch(
+        "subprocess.run",
+        side_effect=[sftp_error, _scp_success(), _scp_success()],
+    ) as run:
+        method = download_files_sftp(connection, transfers)
+
+    assert method == SyncMethod.SCP
+    assert [call[0][0][0] for call in run.call_args_list] == ["sftp", "scp", "scp"]
+    assert get_active_sync_method(connection) == SyncMethod.SCP
@@ -13,6 +13,8 @@ need network access or a real SSH server.
 
 import shlex
 import subprocess
+import threading
+import time
 from http import HTTPStatus
 from unittest.mock import patch
 
@@ -20,6 +22,7 @@ import pytest
 from ttnn_visualizer.enums import SyncMethod
 from ttnn_visualizer.exceptions import (
     AuthenticationException,
+    AuthenticationFailedException,
     HostKeyVerificationException,
     NoValidConnectionsError,
     RemoteConnectionException,
@@ -27,6 +30,7 @@ from ttnn_visualizer.exceptions import (
 from ttnn_visualizer.models import RemoteConnection
 from ttnn_visualizer.sftp_operations import (
     _get_remote_file_list_without_sizes,
+    _host_session_slots,
     _remote_transfer_key,
     _sftp_subsystem_unavailable,
     get_remote_directory_list,
@@ -509,6 +513,139 @@ class TestSyncFilesAndDirectoriesSyncMethod:
         assert excinfo.value.sync_method == SyncMethod.SFTP.value
 
 
+class TestSyncFilesAndDirectoriesBatching:
+    """Files download in batches, one sftp session each, several at a time."""
+
+    @pytest.fixture(autouse=True)
+    def clear_host_sessions(self):
+        _host_session_slots.clear()
+        yield
+        _host_session_slots.clear()
+
+    @staticmethod
+    def _sync(app, tmp_path, connection, files, **patches):
+        with (
+            app.app_context(),
+            patch(
+                "ttnn_visualizer.sftp_operations.get_remote_file_list",
+                return_value=files,
+            ),
+            patch(
+                "ttnn_visualizer.sftp_operations.get_remote_directory_list",
+                return_value=["/remote/reports"],
+            ),
+            patch(
+                "ttnn_visualizer.sftp_operations.download_files_sftp",
+                **patches.pop("batch", {}),
+            ) as batch_download,
+            patch(
+                "ttnn_visualizer.sftp_operations.download_single_file_sftp",
+                **patches.pop("single", {}),
+            ) as single_download,
+            patch("ttnn_visualizer.sftp_operations.update_last_synced"),
+            patch("ttnn_visualizer.sftp_operations.emit_file_status") as emit_status,
+        ):
+            app.config.update(SFTP_BATCH_SIZE=2, SFTP_SESSIONS_PER_HOST=2)
+            try:
+                result = sync_files_and_directories(
+                    connection, "/remote/reports", tmp_path, exclude_patterns=[]
+                )
+            except RemoteConnectionException as e:
+                result = e
+        return result, batch_download, single_download, emit_status
+
+    def test_files_are_split_into_batches(self, app, tmp_path, connection):
+        files = [(f"/remote/reports/{name}.txt", 10) for name in "abcde"]
+
+        result, batch_download, _, emit_status = self._sync(
+            app, tmp_path, connection, files, batch={"return_value": SyncMethod.SFTP}
+        )
+
+        assert result == SyncMethod.SFTP
+        batches = sorted(
+            [remote for remote, _ in call.args[1]]
+            for call in batch_download.call_args_list
+        )
+        assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+        assert sum(batches, []) == sorted(remote for remote, _ in files)
+        progress = [call.args[0] for call in emit_status.call_args_list]
+        downloading = [p for p in progress if p.status == FileStatus.DOWNLOADING]
+        downloaded = [p for p in downloading if p.percent_of_current == 100]
+        assert [p.finished_files for p in downloaded] == [1, 2, 3, 4, 5]
+        # Each batch announces its first file as it starts
+        starting = [p for p in downloading if p.percent_of_current == 0]
+        assert sorted(p.current_file_name for p in starting) == [
+            "a.txt",
+            "c.txt",
+            "e.txt",
+        ]
+        assert downloaded[-1].bytes_transferred == 50
+        assert progress[-1].status == FileStatus.FINISHED
+
+    def test_failed_batch_is_retried_one_file_at_a_time(
+        self, app, tmp_path, connection
+    ):
+        files = [(f"/remote/reports/{name}.txt", 3) for name in "abcd"]
+
+        def partial_batch(_conn, transfers):
+            # sftp got the first file, then stopped at the second
+            transfers[0][1].write_text("abc")
+            raise RuntimeError(f"Failed to download a batch of {len(transfers)} files")
+
+        result, _, single_download, emit_status = self._sync(
+            app,
+            tmp_path,
+            connection,
+            files,
+            batch={"side_effect": partial_batch},
+            single={"side_effect": RuntimeError("No such file")},
+        )
+
+        assert isinstance(result, RemoteConnectionException)
+        assert "2 of 4" in result.message
+        assert "No such file" in result.message
+        assert sorted(call.args[1] for call in single_download.call_args_list) == [
+            "/remote/reports/b.txt",
+            "/remote/reports/d.txt",
+        ]
+        assert emit_status.call_args_list[-1][0][0].status == FileStatus.FAILED
+
+    def test_fatal_ssh_errors_end_the_sync(self, app, tmp_path, connection):
+        files = [(f"/remote/reports/{name}.txt", 10) for name in "abcd"]
+
+        result, _, single_download, _ = self._sync(
+            app,
+            tmp_path,
+            connection,
+            files,
+            batch={"side_effect": AuthenticationException("denied")},
+        )
+
+        assert isinstance(result, AuthenticationFailedException)
+        single_download.assert_not_called()
+
+    def test_fatal_errors_wait_for_the_other_sessions(self, app, tmp_path, connection):
+        files = [(f"/remote/reports/{name}.txt", 10) for name in "abcd"]
+        other_started = threading.Event()
+        other_finished = threading.Event()
+
+        def batch_download(_conn, transfers):
+            if transfers[0][0].endswith("a.txt"):
+                other_started.wait(timeout=5)
+                raise AuthenticationException("denied")
+            other_started.set()
+            time.sleep(0.2)
+            other_finished.set()
+            return SyncMethod.SFTP
+
+        result, _, _, _ = self._sync(
+            app, tmp_path, connection, files, batch={"side_effect": batch_download}
+        )
+
+        assert isinstance(result, AuthenticationFailedException)
+        assert other_finished.is_set()
+
+
 class TestGetRemoteFileListWithoutSizes:
     def test_returns_paths_with_zero_size(self, connection):
         stdout = "/remote/a.txt\n/remote/b.txt\n"
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""Tests for the shared SSH ControlMaster connections. Subprocess is mocked."""
+
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+from ttnn_visualizer.models import RemoteConnection
+from ttnn_visualizer.sftp_operations import (
+    _scp_cmd_prefix,
+    _sftp_cmd_prefix,
+    _ssh_cmd_prefix,
+)
+from ttnn_visualizer.ssh_client import (
+    SSHClient,
+    SSHControlMasters,
+    ssh_auth_options,
+)
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="unix sockets only")
+
+
+@pytest.fixture
+def connection() -> RemoteConnection:
+    return RemoteConnection(
+        name="test",
+        username="user",
+        host="example.test",
+        port=2222,
+        profilerPath="/remote/profiler",
+    )
+
+
+@pytest.fixture
+def masters(tmp_path):
+    masters = SSHControlMasters()
+    masters.configure(tmp_path / "control")
+    with (
+        patch("ttnn_visualizer.ssh_client.ssh_control_masters", masters),
+        patch("ttnn_visualizer.sftp_operations.ssh_control_masters", masters),
+    ):
+        yield masters
+    masters.configure(None)
+
+
+def _completed(returncode=0) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=["ssh"], returncode=returncode)
+
+
+def test_disabled_masters_leave_commands_unchanged(connection):
+    masters = SSHControlMasters()
+
+    with patch("subprocess.run") as run:
+        assert masters.options(connection) == []
+
+    run.assert_not_called()
+
+
+def test_first_command_starts_a_master(masters, connection):
+    with patch("subprocess.run", return_value=_completed()) as run:
+        command = _ssh_cmd_prefix(connection)
+
+    start = run.call_args.args[0]
+    socket = str(masters.socket_path(connection))
+    assert start[-1] == "user@example.test"
+    assert {"-N", "-f", "ControlMaster=yes", f"ControlPath={socket}"} <= set(start)
+    assert ["-p", "2222"] == start[-3:-1]
+    assert command[-1] == "user@example.test"
+    assert "ControlMaster=no" in command
+    assert f"ControlPath={socket}" in command
+    assert oct(masters.directory.stat().st_mode & 0o777) == oct(0o700)
+
+
+def test_start_waits_no_longer_than_configured(masters, connection, tmp_path):
+    masters.configure(tmp_path / "control", start_timeout_seconds=10)
+
+    with patch("subprocess.run", return_value=_completed()) as run:
+        masters.options(connection)
+
+    assert "ConnectTimeout=10" in run.call_args.args[0]
+    assert run.call_args.kwargs["timeout"] == 10
+
+
+def test_start_timeout_is_never_raised(masters, tmp_path):
+    masters.configure(tmp_path / "control", start_timeout_seconds=120)
+
+    assert masters.start_timeout_seconds == SSHControlMasters.START_TIMEOUT_SECONDS
+
+
+def test_every_command_shares_the_auth_options(masters, connection):
+    connection.identityFile = "/keys/id_ed25519"
+    auth = ssh_auth_options(connection)
+
+    with patch("subprocess.run", return_value=_completed()):
+        client = SSHClient(connection)
+        commands = [
+            _ssh_cmd_prefix(connection),
+            _sftp_cmd_prefix(connection),
+            _scp_cmd_prefix(connection),
+            client._base_ssh_cmd,
+            client._base_sftp_cmd,
+        ]
+
+    assert "/keys/id_ed25519" in auth
+    for command in commands:
+        start = command.index(auth[0])
+        assert command[start : start + len(auth)] == auth
+
+
+def test_master_is_reused_between_probes(masters, connection):
+    with patch("subprocess.run", return_value=_completed()) as run:
+        _ssh_cmd_prefix(connection)
+        SSHClient(connection)
+        scp = _scp_cmd_prefix(connection)
+
+    assert run.call_count == 1
+    assert f"ControlPath={masters.socket_path(connection)}" in scp
+
+
+def test_live_master_is_probed_not_restarted(masters, connection):
+    masters.directory.mkdir(mode=0o700)
+    masters.socket_path(connection).touch()
+
+    with patch("subprocess.run", return_value=_completed()) as run:
+        masters.options(connection)
+
+    (probe,) = [call.args[0] for call in run.call_args_list]
+    assert probe[-3:] == ["-O", "check", "user@example.test"]
+
+
+def test_failed_start_connects_directly_for_a_while(masters, connection):
+    with patch("subprocess.run", return_value=_completed(255)) as run:
+        assert masters.options(connection) == []
+        assert masters.options(connection) == []
+
+    assert run.call_count == 1
+    assert "ControlPath" not in " ".join(_ssh_cmd_prefix(connection))
+
+
+def test_shared_control_directory_is_refused(masters, connection):
+    masters.directory.mkdir(mode=0o777)
+    masters.directory.chmod(0o777)
+
+    with patch("subprocess.run") as run:
+        assert masters.options(connection) == []
+
+    run.assert_not_called()
+
+
+def test_close_stops_the_master(masters, connection):
+    masters.socket_path(connection).parent.mkdir(mode=0o700)
+    masters.socket_path(connection).touch()
+
+    with patch("subprocess.run", return_value=_completed()) as run:
+        masters.close(connection)
+
+    (stop_command,) = [call.args[0] for call in run.call_args_list]
+    assert stop_command[-3:] == ["-O", "stop", "user@example.test"]
+
+
+def test_masters_outlive_the_process_that_started_them(tmp_path):
+    with patch("atexit.register") as register:
+        SSHControlMasters().configure(tmp_path / "control")
+
+    register.assert_not_called()
+
+
+def test_each_identity_file_has_its_own_master(masters, connection):
+    keyed = connection.model_copy(update={"identityFile": "~/.ssh/other"})
+
+    assert masters.socket_path(keyed) != masters.socket_path(connection)
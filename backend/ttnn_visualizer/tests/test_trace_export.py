@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+from ttnn_visualizer.csv_queries import (
+    DeviceLogProfilerQueries,
+    LocalCSVQueryRunner,
+    convert_performance_report_to_columnar,
+)
+from ttnn_visualizer.exceptions import DataFormatError
+from ttnn_visualizer.offload import get_concurrency_limit
+from ttnn_visualizer.trace_export import TraceFilters, chrome_trace
+
+DEVICE_LOG_CSV = """ARCH: wormhole_b0, CHIP_FREQ[MHz]: 1000
+PCIe slot, core_x, core_y, RISC processor type, timer_id, time[cycles since reset], stat value, run ID, run host ID,  zone name, zone phase, source line, source file
+0,1,1,BRISC,1,1000,0,0,7,BRISC-FW,begin,10,fw.cc
+0,1,1,BRISC,1,2500,0,0,7,BRISC-FW,end,10,fw.cc
+0,1,1,BRISC,3,1200,5,0,7,STAT,total,12,fw.cc
+0,2,1,NCRISC,2,1200,0,0,7,NCRISC-FW,begin,11,fw.cc
+0,2,1,NCRISC,2,1800,0,0,7,NCRISC-FW,end,11,fw.cc
+1,1,1,BRISC,1,3000,0,0,8,BRISC-FW,begin,10,fw.cc
+1,1,1,BRISC,1,3500,0,0,8,BRISC-FW,end,10,fw.cc
+"""
+
+OPS_PERF_CSV = """OP CODE,OP TYPE,GLOBAL CALL COUNT,DEVICE ID,DEVICE FW START CYCLE,DEVICE FW END CYCLE
+ttnn.add,tt_dnn_device,1024,0,1000,2500
+ttnn.relu,tt_dnn_device,2048,1,3000,3500
+host,tt_dnn_cpu,3072,,,
+"""
+
+
+def _events(trace, phase):
+    return [event for event in trace["traceEvents"] if event["ph"] == phase]
+
+
+class TestChromeTrace(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.directory = Path(self.tmpdir.name)
+        (self.directory / DeviceLogProfilerQueries.DEVICE_LOG_FILE).write_text(
+            DEVICE_LOG_CSV
+        )
+        self.ops_perf = self.directory / "ops_perf_results_1.csv"
+        self.ops_perf.write_text(OPS_PERF_CSV)
+
+    def _trace(self, **kwargs):
+        return orjson.loads(b"".join(chrome_trace(self.directory, **kwargs)))
+
+    def test_zone_markers_become_begin_and_end_events(self):
+        trace = self._trace()
+
+        self.assertEqual(trace["otherData"], {"chip_frequency_mhz": 1000})
+        begins = _events(trace, "B")
+        self.assertEqual(
+            [event["name"] for event in begins], ["BRISC-FW", "NCRISC-FW", "BRISC-FW"]
+        )
+        # 1000 cycles at 1000 MHz is one microsecond
+        self.assertEqual([event["ts"] for event in begins], [1.0, 1.2, 3.0])
+        self.assertEqual(begins[0]["args"], {"run_host_id": 7})
+        self.assertEqual(len(_events(trace, "E")), 3)
+
+    def test_each_core_and_risc_is_a_named_thread(self):
+        trace = self._trace()
+
+        names = {
+            (event["pid"], event["tid"]): event["args"]["name"]
+            for event in _events(trace, "M")
+            if event["name"] == "thread_name"
+        }
+        self.assertEqual(
+            sorted(names.values()),
+            ["Core (1, 1) BRISC", "Core (1, 1) BRISC", "Core (2, 1) NCRISC"],
+        )
+        for event in _events(trace, "B") + _events(trace, "E"):
+            self.assertIn((event["pid"], event["tid"]), names)
+
+    def test_filters_narrow_the_device_log(self):
+        trace = self._trace(filters=TraceFilters(cores={(2, 1)}))
+        self.assertEqual(
+            {event["name"] for event in _events(trace, "B")}, {"NCRISC-FW"}
+        )
+
+        trace = self._trace(filters=TraceFilters(devices={1}, zones={"BRISC-FW"}))
+        self.assertEqual([event["pid"] for event in _events(trace, "B")], [1])
+
+        trace = self._trace(filters=TraceFilters(riscs={"TRISC_0"}))
+        self.assertEqual(trace["traceEvents"], [])
+
+    def test_device_ops_are_complete_events(self):
+        trace = self._trace(ops_perf_path=self.ops_perf)
+
+        ops = _events(trace, "X")
+        self.assertEqual([op["name"] for op in ops], ["ttnn.add", "ttnn.relu"])
+        self.assertEqual((ops[0]["ts"], ops[0]["dur"]), (1.0, 1.5))
+        self.assertEqual(ops[1]["pid"], 1)
+        self.assertEqual(ops[0]["args"], {"global_call_count": 1024})
+
+    def test_ops_without_timing_columns_fail_before_streaming(self):
+        self.ops_perf.write_text(
+            "OP CODE,OP TYPE,DEVICE ID\nttnn.add,tt_dnn_device,0\n"
+        )
+
+        with self.assertRaises(DataFormatError):
+            chrome_trace(self.directory, ops_perf_path=self.ops_perf)
+
+    def test_sidecar_export_matches_csv_export(self):
+        from_csv = self._trace(ops_perf_path=self.ops_perf)
+        convert_performance_report_to_columnar(self.directory)
+
+        with mock.patch("ttnn_visualizer.csv_queries.pd.read_csv") as read_csv:
+            from_sidecar = self._trace(ops_perf_path=self.ops_perf)
+
+        read_csv.assert_not_called()
+        self.assertEqual(from_sidecar, from_csv)
+
+    def test_each_chunk_is_converted_off_the_loop(self):
+        with (
+            mock.patch("ttnn_visualizer.trace_export.EXPORT_CHUNK_ROWS", 3),
+            mock.patch(
+                "ttnn_visualizer.trace_export.run_in_thread",
+                side_effect=lambda fn, *args: fn(*args),
+            ) as run_in_thread,
+        ):
+            trace = self._trace()
+
+        self.assertEqual(len(_events(trace, "B")), 3)
+        # Three device log chunks, then the end of the source
+        self.assertEqual(run_in_thread.call_count, 4)
+
+    def test_events_are_read_a_chunk_at_a_time(self):
+        runner = DeviceLogProfilerQueries.create_runner(self.directory)
+
+        chunks = list(runner.iter_chunks(["zone name", "missing"], chunk_rows=3))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(list(chunks[0].columns), ["zone name"])
+        self.assertIsInstance(runner, LocalCSVQueryRunner)
+
+
+class TestChromeTraceView:
+    def _instance(self, app, tmp_path):
+        from ttnn_visualizer.extensions import db
+        from ttnn_visualizer.models import InstanceTable
+
+        (tmp_path / DeviceLogProfilerQueries.DEVICE_LOG_FILE).write_text(DEVICE_LOG_CSV)
+        (tmp_path / "ops_perf_results_1.csv").write_text(OPS_PERF_CSV)
+        with app.app_context():
+            db.session.add(
+                InstanceTable(
+                    instance_id="trace",
+                    active_report={},
+                    performance_path=str(tmp_path),
+                )
+            )
+            db.session.commit()
+        return {"instanceId": "trace"}
+
+    def test_trace_is_a_json_download(self, app, client, tmp_path):
+        query = self._instance(app, tmp_path)
+
+        response = client.get(
+            "/api/performance/export/trace",
+            query_string={**query, "core": "1,1", "zone": "BRISC-FW"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["Content-Disposition"] == (
+            "attachment; filename=trace.json"
+        )
+        trace = orjson.loads(response.data)
+        assert len(_events(trace, "B")) == 2
+        assert len(_events(trace, "X")) == 2
+
+    def test_slot_is_held_until_the_stream_closes(self, app, client, tmp_path):
+        query = self._instance(app, tmp_path)
+        limit = get_concurrency_limit(
+            "performance-csv", max_concurrent=4, max_queued=32
+        )
+
+        response = client.get(
+            "/api/performance/export/trace", query_string=query, buffered=False
+        )
+        running = limit.stats()["running"]
+        response.close()
+
+        assert response.status_code == 200
+        assert running == 1
+        assert limit.stats()["running"] == 0
+
+    def test_ops_without_timing_columns_are_unprocessable(self, app, client, tmp_path):
+        query = self._instance(app, tmp_path)
+        (tmp_path / "ops_perf_results_1.csv").write_text("OP CODE,OP TYPE\n")
+        limit = get_concurrency_limit(
+            "performance-csv", max_concurrent=4, max_queued=32
+        )
+
+        response = client.get("/api/performance/export/trace", query_string=query)
+
+        assert response.status_code == 422
+        assert limit.stats()["running"] == 0
+
+    def test_bad_core_is_rejected(self, app, client, tmp_path):
+        query = self._instance(app, tmp_path)
+
+        response = client.get(
+            "/api/performance/export/trace", query_string={**query, "core": "1"}
+        )
+
+        assert response.status_code == 400
+
+    def test_missing_device_log_is_not_found(self, app, client, tmp_path):
+        query = self._instance(app, tmp_path)
+        (tmp_path / DeviceLogProfilerQueries.DEVICE_LOG_FILE).unlink()
+
+        response = client.get("/api/performance/export/trace", query_string=query)
+
+        assert response.status_code == 404
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+from http import HTTPStatus
+
+import pytest
+from ttnn_visualizer.extensions import db
+from ttnn_visualizer.models import InstanceTable
+
+OPS_PERF_CSV = b"OP CODE,OP TYPE\nttnn.add,tt_dnn_device\nttnn.mul,tt_dnn_device\n"
+
+
+@pytest.fixture
+def downloads_instance(app, tmp_path):
+    performance = tmp_path / "performance"
+    performance.mkdir()
+    (performance / "ops_perf_results_2026.csv").write_bytes(OPS_PERF_CSV)
+    profiler = tmp_path / "profiler"
+    profiler.mkdir()
+    (profiler / "operation_history.json").write_text('[{"operation_id": 1}]')
+
+    with app.app_context():
+        db.session.add(
+            InstanceTable(
+                instance_id="downloads",
+                active_report={},
+                performance_path=str(performance),
+                profiler_path=str(profiler / "db.sqlite"),
+            )
+        )
+        db.session.commit()
+    return {"instanceId": "downloads"}
+
+
+def test_raw_csv_is_a_revalidated_attachment(client, downloads_instance):
+    response = client.get(
+        "/api/performance/perf-results/raw", query_string=downloads_instance
+    )
+
+    assert response.data == OPS_PERF_CSV
+    assert response.headers["Content-Disposition"] == (
+        "attachment; filename=op_perf_results.csv"
+    )
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert "no-cache" in response.headers["Cache-Control"]
+    assert "private" in response.headers["Cache-Control"]
+
+    revalidated = client.get(
+        "/api/performance/perf-results/raw",
+        query_string=downloads_instance,
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_raw_csv_download_can_resume(client, downloads_instance):
+    response = client.get(
+        "/api/performance/perf-results/raw",
+        query_string=downloads_instance,
+        headers={"Range": "bytes=16-"},
+    )
+
+    assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+    assert response.data == OPS_PERF_CSV[16:]
+    assert response.headers["Content-Range"] == (
+        f"bytes 16-{len(OPS_PERF_CSV) - 1}/{len(OPS_PERF_CSV)}"
+    )
+
+
+def test_operation_history_is_sent_as_stored(client, downloads_instance):
+    response = client.get("/api/operation-history", query_string=downloads_instance)
+
+    assert response.data == b'[{"operation_id": 1}]'
+    assert response.mimetype == "application/json"
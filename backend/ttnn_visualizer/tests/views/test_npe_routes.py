@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+from http import HTTPStatus
+from pathlib import Path
+from unittest import mock
+
+import orjson
+import pytest
+import zstd
+from ttnn_visualizer.extensions import db
+from ttnn_visualizer.models import InstanceTable
+
+NPE_DATA = {"common_info": {"cycles_per_timestep": 4}, "timestep_data": [{"t": 0}]}
+
+
+@pytest.fixture
+def npe_instance(app, tmp_path):
+    """Returns an instance id whose NPE trace and timeline are zstd files."""
+    compressed = zstd.compress(orjson.dumps(NPE_DATA))
+    npe_path = tmp_path / "trace.npeviz.zst"
+    npe_path.write_bytes(compressed)
+    timeline_dir = tmp_path / "performance" / "npe_viz"
+    timeline_dir.mkdir(parents=True)
+    (timeline_dir / "timeline.json.zst").write_bytes(compressed)
+    (timeline_dir / "timeline.json").write_bytes(orjson.dumps(NPE_DATA))
+
+    with app.app_context():
+        db.session.add(
+            InstanceTable(
+                instance_id="npe",
+                active_report={},
+                npe_path=str(npe_path),
+                performance_path=str(tmp_path / "performance"),
+            )
+        )
+        db.session.commit()
+    return "npe"
+
+
+def test_npe_is_passed_through_compressed_when_accepted(client, npe_instance):
+    response = client.get(
+        "/api/npe",
+        query_string={"instanceId": npe_instance},
+        headers={"Accept-Encoding": "gzip, zstd"},
+    )
+
+    assert response.headers["Content-Encoding"] == "zstd"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert orjson.loads(zstd.uncompress(response.data)) == NPE_DATA
+
+
+def test_npe_is_decompressed_for_other_clients(client, npe_instance):
+    response = client.get(
+        "/api/npe",
+        query_string={"instanceId": npe_instance},
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert "Content-Encoding" not in response.headers
+    assert response.get_json() == NPE_DATA
+
+
+def test_npe_file_that_is_not_zstd_is_unprocessable(client, npe_instance, tmp_path):
+    Path(tmp_path, "trace.npeviz.zst").write_text("{}")
+
+    response = client.get("/api/npe", query_string={"instanceId": npe_instance})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize("filename", ["timeline.json.zst", "timeline.json"])
+def test_npe_timeline_is_sent_without_parsing(client, npe_instance, filename):
+    with mock.patch(
+        "ttnn_visualizer.csv_queries.NPEQueries.get_npe_timeline"
+    ) as get_npe_timeline:
+        response = client.get(
+            "/api/performance/npe/timeline",
+            query_string={"instanceId": npe_instance, "filename": filename},
+        )
+
+        assert response.get_json() == NPE_DATA
+        get_npe_timeline.assert_not_called()
+
+
+def test_missing_npe_timeline_is_empty(client, npe_instance):
+    response = client.get(
+        "/api/performance/npe/timeline",
+        query_string={"instanceId": npe_instance, "filename": "missing.json.zst"},
+    )
+
+    assert response.get_json() == {}
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+from concurrent.futures import CancelledError
+from http import HTTPStatus
+from unittest import mock
+
+import orjson
+from ttnn_visualizer.perf_report_jobs import ReportJob
+from ttnn_visualizer.sockets import ReportJobStatus
+
+REPORT = {
+    "report": [
+        {"id": "2", "op_code": "Matmul", "device_time": "10.5"},
+        {"id": "3", "op_code": "Add", "device_time": "2"},
+    ],
+    "stacked_report": [],
+    "signposts": [],
+}
+
+
+def _get_result(client, **query_string):
+    job = ReportJob(
+        job_id="job",
+        key=("/table-view/ops_perf_results.csv", 1, 2, "options"),
+        status=ReportJobStatus.FINISHED,
+        result=orjson.dumps(REPORT),
+    )
+    with mock.patch("ttnn_visualizer.views.report_jobs.get", return_value=job):
+        return client.get(
+            "/api/performance/perf-results/report/jobs/job/result",
+            query_string={"instanceId": "tab", **query_string},
+        )
+
+
+def test_full_report_without_table_arguments(client):
+    response = _get_result(client)
+
+    assert response.get_json() == REPORT
+
+
+def test_table_arguments_return_one_sorted_page(client):
+    response = _get_result(client, sort="device_time", order="desc", limit=1)
+
+    data = response.get_json()
+    assert [row["id"] for row in data["report"]] == ["2"]
+    assert data["total"] == 2
+
+
+def test_unknown_sort_column_is_a_bad_request(client):
+    response = _get_result(client, sort="nope")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_non_integer_device_is_a_bad_request(client):
+    response = _get_result(client, device="first")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_result_evicted_from_the_report_cache_is_not_found(client):
+    job = ReportJob(job_id="job", key=("evicted",), status=ReportJobStatus.FINISHED)
+    with mock.patch("ttnn_visualizer.views.report_jobs.get", return_value=job):
+        response = client.get(
+            "/api/performance/perf-results/report/jobs/job/result",
+            query_string={"instanceId": "tab"},
+        )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_jobs_of_other_tabs_are_not_found(client):
+    from ttnn_visualizer.perf_report_jobs import report_jobs
+
+    job = ReportJob(job_id="owned", key=("owned",), owners={"tab"})
+    report_jobs._jobs[job.job_id] = job
+    try:
+        own = client.get(
+            "/api/performance/perf-results/report/jobs/owned",
+            query_string={"instanceId": "tab"},
+        )
+        other = client.get(
+            "/api/performance/perf-results/report/jobs/owned",
+            query_string={"instanceId": "other-tab"},
+        )
+    finally:
+        report_jobs._jobs.pop(job.job_id)
+
+    assert own.status_code == HTTPStatus.OK
+    assert other.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_cancelled_job_is_retryable(app, client, tmp_path):
+    from ttnn_visualizer.extensions import db
+    from ttnn_visualizer.models import InstanceTable
+
+    with app.app_context():
+        db.session.add(
+            InstanceTable(
+                instance_id="tab", active_report={}, performance_path=str(tmp_path)
+            )
+        )
+        db.session.commit()
+    job = ReportJob(job_id="job", key=("key",))
+    with (
+        mock.patch("ttnn_visualizer.views.report_jobs.submit", return_value=job),
+        mock.patch(
+            "ttnn_visualizer.views.report_jobs.wait", side_effect=CancelledError
+        ),
+    ):
+        response = client.get(
+            "/api/performance/perf-results/report", query_string={"instanceId": "tab"}
+        )
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+API tests for ``/api/operations/rank-summary`` cross-rank duration statistics.
+"""
+
+from http import HTTPStatus
+
+import pytest
+from ttnn_visualizer.tests.report_schemas import SCHEMA_V2
+
+_RANKED_OPERATIONS_SQL = """
+CREATE TABLE operations (
+    operation_id int,
+    name text,
+    duration float,
+    rank int NOT NULL DEFAULT 0,
+    UNIQUE(operation_id, rank)
+);
+"""
+
+_RANKED_INSERTS_SQL = """
+INSERT INTO operations VALUES
+(1, 'ttnn.matmul', 2.0, 0),
+(1, 'ttnn.matmul', 6.0, 1),
+(1, 'ttnn.matmul', 4.0, 2),
+(2, 'ttnn.add', 1.0, 0),
+(2, 'ttnn.add', 1.0, 1),
+(2, 'ttnn.add', 1.0, 2);
+"""
+
+
+def test_rank_summary_reports_spread_and_straggler(client, make_report):
+    instance_id = make_report(
+        inserts_sql=_RANKED_INSERTS_SQL, schema_sql=_RANKED_OPERATIONS_SQL
+    )
+
+    response = client.get(
+        "/api/operations/rank-summary", query_string={"instanceId": instance_id}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.get_json()
+    assert [row["operation_id"] for row in data] == [1, 2]
+
+    matmul = data[0]
+    assert matmul["name"] == "ttnn.matmul"
+    assert matmul["rank_count"] == 3
+    assert matmul["min_duration"] == 2.0
+    assert matmul["max_duration"] == 6.0
+    assert matmul["mean_duration"] == pytest.approx(4.0)
+    assert matmul["stddev_duration"] == pytest.approx((8 / 3) ** 0.5)
+    assert matmul["max_rank"] == 1
+
+    add = data[1]
+    assert add["stddev_duration"] == 0.0
+
+
+def test_rank_summary_on_legacy_db_is_single_rank(client, make_report):
+    instance_id = make_report(
+        inserts_sql="INSERT INTO operations VALUES (1, 'legacy_op', 0.5);",
+        schema_sql=SCHEMA_V2,
+    )
+
+    response = client.get(
+        "/api/operations/rank-summary", query_string={"instanceId": instance_id}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.get_json()
+    assert len(data) == 1
+    assert data[0]["rank_count"] == 1
+    assert data[0]["max_rank"] == 0
+    assert data[0]["min_duration"] == data[0]["max_duration"] == 0.5
@@ -0,0 +1,268 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Export the device log, and the ops of the perf results, as a Chrome Trace
+Event JSON file, which Perfetto and chrome://tracing both open.
+
+The trace is produced as a stream: the device log is read a chunk at a time
+and every zone begin and end marker becomes a ``B``/``E`` event on its own,
+so nothing needs pairing and memory stays flat however large the log is.
+Each chunk is read and converted on a native thread, off the gevent loop.
+Each device is a process and each core and RISC a thread; the ops of the perf
+results are ``X`` events on an "Ops" thread of their device. Device cycles
+are converted to microseconds with the log's chip frequency.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import orjson
+import pandas as pd
+from ttnn_visualizer.csv_queries import DeviceLogProfilerQueries, LocalCSVQueryRunner
+from ttnn_visualizer.exceptions import DataFormatError
+from ttnn_visualizer.offload import run_in_thread
+
+EXPORT_CHUNK_ROWS = 50_000
+OPS_THREAD_ID = 0
+
+DEVICE_COLUMN = "PCIe slot"
+RISC_COLUMN = "RISC processor type"
+ZONE_COLUMN = "zone name"
+PHASE_COLUMN = "zone phase"
+EVENT_COLUMNS = [
+    DEVICE_COLUMN,
+    "core_x",
+    "core_y",
+    RISC_COLUMN,
+    ZONE_COLUMN,
+    PHASE_COLUMN,
+    DeviceLogProfilerQueries.CYCLES_COLUMN,
+    "run host ID",
+]
+
+OP_CODE_COLUMN = "OP CODE"
+OP_DEVICE_COLUMN = "DEVICE ID"
+OP_START_COLUMN = "DEVICE FW START CYCLE"
+OP_END_COLUMN = "DEVICE FW END CYCLE"
+OP_CALL_COUNT_COLUMN = "GLOBAL CALL COUNT"
+# Ops can't be placed on the timeline without these
+OP_REQUIRED_COLUMNS = [OP_CODE_COLUMN, OP_DEVICE_COLUMN, OP_START_COLUMN, OP_END_COLUMN]
+OP_COLUMNS = [*OP_REQUIRED_COLUMNS, OP_CALL_COUNT_COLUMN]
+
+PHASES = {"begin": "B", "end": "E"}
+
+
+@dataclass
+class TraceFilters:
+    """Narrows an export to some devices, cores, RISCs and zones; empty is all."""
+
+    devices: Set[int] = field(default_factory=set)
+    cores: Set[Tuple[int, int]] = field(default_factory=set)
+    riscs: Set[str] = field(default_factory=set)
+    zones: Set[str] = field(default_factory=set)
+
+    def mask(self, chunk: pd.DataFrame) -> np.ndarray:
+        keep: np.ndarray = np.ones(len(chunk), dtype=bool)
+        if self.devices:
+            keep &= chunk[DEVICE_COLUMN].isin(self.devices).to_numpy()
+        if self.cores:
+            keep &= (
+                pd.Series(list(zip(chunk["core_x"], chunk["core_y"])), dtype=object)
+                .isin(self.cores)
+                .to_numpy()
+            )
+        if self.riscs:
+            keep &= (
+                chunk[RISC_COLUMN].astype(str).str.strip().isin(self.riscs).to_numpy()
+            )
+        if self.zones:
+            keep &= (
+                chunk[ZONE_COLUMN].astype(str).str.strip().isin(self.zones).to_numpy()
+            )
+        return keep
+
+
+class _Tracks:
+    """Process and thread ids, with their name events emitted on first use."""
+
+    def __init__(self):
+        self.processes: Set[int] = set()
+        self.threads: Dict[Tuple[int, str], int] = {}
+
+    def process(self, pid: int, events: List[Dict]):
+        if pid not in self.processes:
+            self.processes.add(pid)
+            events.append(
+                {
+                    "ph": "M",
+                    "name": "process_name",
+                    "pid": pid,
+                    "tid": OPS_THREAD_ID,
+                    "args": {"name": f"Device {pid}"},
+                }
+            )
+
+    def thread(self, pid: int, name: str, events: List[Dict]) -> int:
+        key = (pid, name)
+        tid = self.threads.get(key)
+        if tid is None:
+            self.process(pid, events)
+            tid = OPS_THREAD_ID if name == "Ops" else len(self.threads) + 1
+            self.threads[key] = tid
+            events.append(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        return tid
+
+
+def _device_log_events(
+    runner: LocalCSVQueryRunner,
+    cycles_per_us: float,
+    filters: TraceFilters,
+    tracks: _Tracks,
+) -> Iterator[List[Dict]]:
+    for chunk in runner.iter_chunks(EVENT_COLUMNS, EXPORT_CHUNK_ROWS):
+        phases = chunk[PHASE_COLUMN].astype(str).str.strip().str.lower().map(PHASES)
+        chunk = chunk[phases.notna().to_numpy() & filters.mask(chunk)]
+        if chunk.empty:
+            continue
+        events: List[Dict] = []
+        timestamps = chunk[DeviceLogProfilerQueries.CYCLES_COLUMN].to_numpy() / (
+            cycles_per_us
+        )
+        for device, core_x, core_y, risc, zone, phase, ts, run_host_id in zip(
+            chunk[DEVICE_COLUMN].tolist(),
+            chunk["core_x"].tolist(),
+            chunk["core_y"].tolist(),
+            chunk[RISC_COLUMN].astype(str).str.strip().tolist(),
+            chunk[ZONE_COLUMN].astype(str).str.strip().tolist(),
+            phases[chunk.index].tolist(),
+            timestamps.tolist(),
+            chunk["run host ID"].tolist(),
+        ):
+            tid = tracks.thread(device, f"Core ({core_x}, {core_y}) {risc}", events)
+            event = {"ph": phase, "name": zone, "pid": device, "tid": tid, "ts": ts}
+            if phase == "B":
+                event["args"] = {"run_host_id": run_host_id}
+            events.append(event)
+        yield events
+
+
+def _op_events(
+    runner: LocalCSVQueryRunner,
+    cycles_per_us: float,
+    filters: TraceFilters,
+    tracks: _Tracks,
+) -> Iterator[List[Dict]]:
+    for chunk in runner.iter_chunks(OP_COLUMNS, EXPORT_CHUNK_ROWS):
+        starts = pd.to_numeric(chunk[OP_START_COLUMN], errors="coerce")
+        ends = pd.to_numeric(chunk[OP_END_COLUMN], errors="coerce")
+        devices = pd.to_numeric(chunk[OP_DEVICE_COLUMN], errors="coerce")
+        keep = (starts.notna() & ends.notna() & devices.notna()).to_numpy()
+        if filters.devices:
+            keep &= devices.isin(filters.devices).to_numpy()
+        call_counts = (
+            chunk[OP_CALL_COUNT_COLUMN]
+            if OP_CALL_COUNT_COLUMN in chunk
+            else pd.Series([None] * len(chunk), index=chunk.index)
+        )
+        events: List[Dict] = []
+        for op_code, device, start, end, call_count in zip(
+            chunk[OP_CODE_COLUMN][keep].tolist(),
+            devices[keep].astype(int).tolist(),
+            starts[keep].tolist(),
+            ends[keep].tolist(),
+            call_counts[keep].tolist(),
+        ):
+            tid = tracks.thread(device, "Ops", events)
+            events.append(
+                {
+                    "ph": "X",
+                    "name": op_code,
+                    "pid": device,
+                    "tid": tid,
+                    "ts": start / cycles_per_us,
+                    "dur": (end - start) / cycles_per_us,
+                    "args": {"global_call_count": call_count},
+                }
+            )
+        if events:
+            yield events
+
+
+def chrome_trace(
+    performance_path: Union[str, Path],
+    ops_perf_path: Optional[Union[str, Path]] = None,
+    filters: Optional[TraceFilters] = None,
+) -> Iterator[bytes]:
+    """
+    The Chrome trace JSON of the device log in ``performance_path``, plus the
+    ops of ``ops_perf_path`` when given, a chunk of events at a time. The
+    files are opened and checked before the first chunk, so a missing file
+    (``OSError``) or an ops perf CSV without the op timing columns
+    (``DataFormatError``) is raised here rather than mid-stream.
+    """
+    runner = DeviceLogProfilerQueries.create_runner(performance_path)
+    frequency_mhz = DeviceLogProfilerQueries.read_chip_frequency_mhz(runner.file_path)
+    ops_runner = None
+    if ops_perf_path is not None:
+        ops_runner = LocalCSVQueryRunner(
+            file_path=ops_perf_path,
+            dtypes={OP_CODE_COLUMN: "category"},
+        )
+        missing = [
+            column
+            for column in OP_REQUIRED_COLUMNS
+            if column not in ops_runner.file_columns()
+        ]
+        if missing:
+            raise DataFormatError(
+                f"{Path(ops_perf_path).name} has no {', '.join(missing)} column "
+                "to place ops on the timeline; export without ops instead"
+            )
+    return _trace_chunks(runner, ops_runner, frequency_mhz, filters or TraceFilters())
+
+
+def _trace_chunks(
+    runner: LocalCSVQueryRunner,
+    ops_runner: Optional[LocalCSVQueryRunner],
+    frequency_mhz: Optional[int],
+    filters: TraceFilters,
+) -> Iterator[bytes]:
+    # Without a frequency the timeline is in cycles, labelled as microseconds
+    cycles_per_us = float(frequency_mhz or 1)
+    tracks = _Tracks()
+
+    yield orjson.dumps(
+        {"otherData": {"chip_frequency_mhz": frequency_mhz}, "displayTimeUnit": "ns"}
+    )[:-1] + b',"traceEvents":['
+
+    sources = [_device_log_events(runner, cycles_per_us, filters, tracks)]
+    if ops_runner is not None:
+        sources.append(_op_events(ops_runner, cycles_per_us, filters, tracks))
+
+    separator = b""
+    for source in sources:
+        serialized = _serialized(source)
+        # Each step parses, converts and serializes one chunk in Python, which
+        # would otherwise hold the gevent loop for the whole chunk
+        while (body := run_in_thread(next, serialized, None)) is not None:
+            yield separator + body
+            separator = b","
+    yield b"]}"
+
+
+def _serialized(source: Iterator[List[Dict]]) -> Iterator[bytes]:
+    for events in source:
+        # Strip the list brackets so chunks join into one array
+        yield orjson.dumps(events)[1:-1]
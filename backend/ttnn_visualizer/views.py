@@ -3,7 +3,6 @@
 # SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
 
 import dataclasses
-import json
 import logging
 import platform
 import re
@@ -11,27 +10,43 @@ import shutil
 import time
 import urllib
 import urllib.request
+from concurrent.futures import CancelledError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
 from http import HTTPStatus
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import orjson
 import yaml
-import zstd
-from flask import Blueprint, Response, abort, current_app, jsonify, request, session
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    jsonify,
+    request,
+    send_file,
+    session,
+)
 from pydantic import ValidationError
 from ttnn_visualizer.csv_queries import (
     DeviceLogProfilerQueries,
     NPEQueries,
     OpsPerformanceQueries,
     OpsPerformanceReportQueries,
+    TracyHostQueries,
+    convert_performance_report_in_background,
+    dataframe_cache,
+    perf_report_cache,
 )
-from ttnn_visualizer.decorators import local_only, with_instance
+from ttnn_visualizer.decorators import concurrency_limit, local_only, with_instance
 from ttnn_visualizer.enums import ConnectionTestStates, StackSourceOrigin
 from ttnn_visualizer.exceptions import (
     AuthenticationFailedException,
     DataFormatError,
     PerformanceReportNotLoadedException,
+    ProfilerReportNotLoadedException,
     RemoteConnectionException,
     RemoteFileReadException,
     error_response,
@@ -60,7 +75,19 @@ from ttnn_visualizer.models import (
     ReportLocation,
     StatusMessage,
 )
+from ttnn_visualizer.npe_index import DEFAULT_RESOLUTION, NPETimelineIndex
+from ttnn_visualizer.offload import get_concurrency_limit, run_in_thread
+from ttnn_visualizer.perf_joined import join_operations_with_perf, joined_cache_key
+from ttnn_visualizer.perf_report_jobs import report_jobs
+from ttnn_visualizer.perf_trends import (
+    DEFAULT_REGRESSION_LIMIT,
+    DEFAULT_REGRESSION_THRESHOLD,
+    DEFAULT_RUNS,
+    MAX_RUNS,
+    perf_trend_store,
+)
 from ttnn_visualizer.queries import DatabaseQueries
+from ttnn_visualizer.report_diff import diff_reports
 from ttnn_visualizer.report_source_file import (
     read_report_source_file,
     report_source_file_available,
@@ -84,6 +111,7 @@ from ttnn_visualizer.sftp_operations import (
     sync_remote_performance_folders,
     sync_remote_profiler_folders,
 )
+from ttnn_visualizer.sockets import ReportJobStatus
 from ttnn_visualizer.ssh_client import SSHClient
 from ttnn_visualizer.stack_trace_source import (
     check_stack_source_local_with_origin,
@@ -92,6 +120,7 @@ from ttnn_visualizer.stack_trace_source import (
     read_stack_source_remote,
     stack_source_response,
 )
+from ttnn_visualizer.trace_export import TraceFilters, chrome_trace
 from ttnn_visualizer.utils import (
     create_path_resolver,
     get_mlir_path,
@@ -114,6 +143,30 @@ def test_ssh_connection(connection) -> bool:
 
 logger = logging.getLogger(__name__)
 
+
+def _file_response(
+    file_path: Union[str, Path], mimetype: str, download_name: Optional[str] = None
+) -> Response:
+    """
+    ``file_path`` streamed from disk rather than read into memory, through
+    the server's sendfile where it has one. Supports Range requests, so
+    downloads can resume, and ETag / Last-Modified revalidation; reports
+    can be regenerated in place, so clients must revalidate before reuse.
+    """
+    response = send_file(
+        file_path,
+        mimetype=mimetype,
+        as_attachment=download_name is not None,
+        download_name=download_name,
+        conditional=True,
+        etag=True,
+        max_age=0,
+    )
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
 api = Blueprint("api", __name__)
 
 
@@ -384,6 +437,118 @@ def operation_list(instance: Instance):
         )
 
 
+@api.route("/operations/rank-summary", methods=["GET"])
+@with_instance
+@timer
+def operation_rank_summary(instance: Instance):
+    """
+    Per-operation duration spread across ranks (min/max/mean/stddev plus the
+    rank that ran slowest), so stragglers show up without paging ``?rank=``.
+    """
+    with DatabaseQueries(instance) as db:
+        summaries = [
+            dataclasses.asdict(summary) for summary in db.query_operation_rank_summary()
+        ]
+        return Response(
+            orjson.dumps(summaries),
+            mimetype="application/json",
+        )
+
+
+@api.route("/operations/perf-joined", methods=["GET"])
+@with_instance
+@timer
+@concurrency_limit("perf-report", max_concurrent=2, max_queued=8)
+def operation_perf_joined(instance: Instance):
+    """
+    The memory report's device ops aligned with the perf report's rows: perf
+    duration, bound and utilization next to each op's peak L1 and buffer
+    count, as columns. Takes the perf report options of the report route.
+    """
+    rank = _optional_rank_query_param()
+    if not instance.profiler_path:
+        raise ProfilerReportNotLoadedException()
+    options = _perf_report_options(instance)
+
+    with DatabaseQueries(instance) as db:
+        rejected = _reject_nonzero_rank_on_legacy_db(db, rank)
+        if rejected is not None:
+            return rejected
+
+        report_key = OpsPerformanceReportQueries.report_cache_key(instance, **options)
+        key = joined_cache_key(report_key, instance.profiler_path, rank)
+        body = perf_report_cache.get(key)
+        if body is None:
+            try:
+                job = report_jobs.submit(instance, **options)
+                report = orjson.loads(report_jobs.wait(job))
+            except DataFormatError as error:
+                return response_unprocessable_entity(str(error))
+            except CancelledError:
+                return _perf_report_job_cancelled()
+            body = orjson.dumps(
+                join_operations_with_perf(db, report.get("report", []), rank)
+            )
+            perf_report_cache.put(key, body)
+
+    return Response(body, mimetype="application/json")
+
+
+def _sibling_profiler_instance(
+    instance: Instance, report_name: str
+) -> Optional[Instance]:
+    """
+    Point a copy of ``instance`` at another profiler report stored next to the
+    active one, or None when ``report_name`` isn't a plain report folder name.
+    """
+    if not instance.profiler_path:
+        raise ProfilerReportNotLoadedException()
+    if report_name in ("", ".", "..") or Path(report_name).name != report_name:
+        return None
+    reports_directory = Path(instance.profiler_path).parent.parent.resolve()
+    profiler_path = (
+        reports_directory / report_name / current_app.config["SQLITE_DB_PATH"]
+    ).resolve()
+    if not profiler_path.is_relative_to(reports_directory / report_name):
+        return None
+    return instance.model_copy(update={"profiler_path": str(profiler_path)})
+
+
+@api.route("/diff", methods=["GET"])
+@with_instance
+@local_only
+@timer
+def report_diff(instance: Instance):
+    base_name = request.args.get("base")
+    candidate_name = request.args.get("candidate")
+    if not base_name or not candidate_name:
+        return response_bad_request(
+            "Missing required query parameters: base and candidate"
+        )
+
+    # Operation ids repeat per rank, so align a single rank (0 unless asked).
+    rank = _optional_rank_query_param()
+    if rank is None:
+        rank = 0
+
+    base_instance = _sibling_profiler_instance(instance, base_name)
+    candidate_instance = _sibling_profiler_instance(instance, candidate_name)
+    if base_instance is None or candidate_instance is None:
+        return response_bad_request("base and candidate must be report names")
+
+    with (
+        DatabaseQueries(base_instance) as base_db,
+        DatabaseQueries(candidate_instance) as candidate_db,
+    ):
+        for db in (base_db, candidate_db):
+            rejected = _reject_nonzero_rank_on_legacy_db(db, rank)
+            if rejected is not None:
+                return rejected
+        diff = diff_reports(base_db, candidate_db, rank=rank)
+
+    return Response(orjson.dumps(diff), mimetype="application/json")
+
+
 @api.route("/operations/<operation_id>", methods=["GET"])
 @with_instance
 @timer
@@ -559,11 +724,7 @@ def operation_history(instance: Instance):
     )
     if not operation_history_file.exists():
         return jsonify([])
-    with open(operation_history_file, "r") as file:
-        return Response(
-            orjson.dumps(json.load(file)),
-            mimetype="application/json",
-        )
+    return _file_response(operation_history_file, mimetype="application/json")
 
 
 @api.route("/errors", methods=["GET"])
@@ -1085,19 +1246,37 @@ def get_performance_data_list(instance: Instance):
 
 @api.route("/performance/device-log", methods=["GET"])
 @with_instance
+@concurrency_limit("performance-csv", max_concurrent=4, max_queued=32)
 def get_performance_data(instance: Instance):
     with DeviceLogProfilerQueries(instance) as csv:
-        result = csv.get_all_entries(as_dict=True, limit=100)
-        return Response(orjson.dumps(result), mimetype="application/json")
+        return Response(
+            csv.get_all_entries_json(limit=100), mimetype="application/json"
+        )
+
+
+@api.route("/performance/csv-cache", methods=["GET"])
+@local_only
+def get_csv_cache_stats():
+    return Response(orjson.dumps(dataframe_cache.stats()), mimetype="application/json")
+
+
+@api.route("/performance/report-cache", methods=["GET"])
+@local_only
+def get_report_cache_stats():
+    return Response(
+        orjson.dumps(perf_report_cache.stats()), mimetype="application/json"
+    )
 
 
 @api.route("/performance/perf-results", methods=["GET"])
 @with_instance
+@concurrency_limit("performance-csv", max_concurrent=4, max_queued=32)
 def get_profiler_performance_data(instance: Instance):
     with OpsPerformanceQueries(instance) as csv:
         # result = csv.query_by_op_code(op_code="(torch) contiguous", as_dict=True)
-        result = csv.get_all_entries(as_dict=True, limit=100)
-        return Response(orjson.dumps(result), mimetype="application/json")
+        return Response(
+            csv.get_all_entries_json(limit=100), mimetype="application/json"
+        )
 
 
 @api.route("/performance/<performance_name>", methods=["DELETE"])
@@ -1150,25 +1329,19 @@ def delete_performance_report(performance_name, instance: Instance):
 @api.route("/performance/perf-results/raw", methods=["GET"])
 @with_instance
 def get_performance_results_data_raw(instance: Instance):
-    content = OpsPerformanceQueries.get_raw_csv(instance)
-    return Response(
-        content,
+    return _file_response(
+        OpsPerformanceQueries.get_local_ops_perf_file_path(instance),
         mimetype="text/csv",
-        headers={"Content-Disposition": "attachment; filename=op_perf_results.csv"},
+        download_name="op_perf_results.csv",
     )
 
 
-@api.route("/performance/perf-results/report", methods=["GET"])
-@with_instance
-def get_performance_results_report(instance: Instance):
+def _perf_report_options(instance: Instance) -> dict:
+    """
+    Report options from the query string. Also points the instance at the
+    ``name``d performance report when one is given outside server mode.
+    """
     name = request.args.get("name", None)
-    start_signpost = request.args.get("start_signpost", None)
-    end_signpost = request.args.get("end_signpost", None)
-    print_signposts = str_to_bool(request.args.get("print_signposts", "true"))
-    hide_host_ops = str_to_bool(request.args.get("hide_host_ops", "true"))
-    merge_devices = str_to_bool(request.args.get("merge_devices", "true"))
-    tracing_mode = str_to_bool(request.args.get("tracing_mode", "false"))
-    group_by = request.args.get("group_by", None)
 
     if not instance.performance_path:
         raise PerformanceReportNotLoadedException()
@@ -1178,21 +1351,167 @@ def get_performance_results_report(instance: Instance):
         instance.performance_path = str(performance_path)
         logger.info(f"************ Performance path set to {instance.performance_path}")
 
+    return {
+        "start_signpost": request.args.get("start_signpost", None),
+        "end_signpost": request.args.get("end_signpost", None),
+        # Which occurrence of a repeated signpost name, counting from 0
+        "start_signpost_ordinal": request.args.get(
+            "start_signpost_ordinal", None, type=int
+        ),
+        "end_signpost_ordinal": request.args.get(
+            "end_signpost_ordinal", None, type=int
+        ),
+        "print_signposts": str_to_bool(request.args.get("print_signposts", "true")),
+        "hide_host_ops": str_to_bool(request.args.get("hide_host_ops", "true")),
+        "merge_devices": str_to_bool(request.args.get("merge_devices", "true")),
+        "tracing_mode": str_to_bool(request.args.get("tracing_mode", "false")),
+        "group_by": request.args.get("group_by", None),
+    }
+
+
+PERF_REPORT_TABLE_ARGS = (
+    "sort",
+    "order",
+    "op_code",
+    "bound",
+    "device",
+    "min_device_time",
+    "offset",
+    "limit",
+)
+
+
+def _perf_report_response(key, report: bytes) -> Response:
+    """
+    The whole report, or when any table argument is given, one sorted and
+    filtered page of its rows, so the table can render before all of it loads.
+    """
+    if not any(arg in request.args for arg in PERF_REPORT_TABLE_ARGS):
+        return Response(report, mimetype="application/json")
+    devices = request.args.getlist("device", type=int)
+    if len(devices) != len(request.args.getlist("device")):
+        return response_bad_request("device must be an integer")
+
     try:
-        report = OpsPerformanceReportQueries.generate_report(
-            instance,
-            start_signpost=start_signpost,
-            print_signposts=print_signposts,
-            end_signpost=end_signpost,
-            hide_host_ops=hide_host_ops,
-            merge_devices=merge_devices,
-            tracing_mode=tracing_mode,
-            group_by=group_by,
+        page = OpsPerformanceReportQueries.query_report_table(
+            key,
+            report,
+            sort=request.args.get("sort", None),
+            descending=request.args.get("order", "asc") == "desc",
+            op_code=request.args.get("op_code", None),
+            bound=request.args.getlist("bound"),
+            device=devices,
+            min_device_time=request.args.get("min_device_time", None, type=float),
+            offset=max(request.args.get("offset", 0, type=int), 0),
+            limit=request.args.get("limit", None, type=int),
         )
+    except ValueError as error:
+        return response_bad_request(str(error))
+
+    return Response(orjson.dumps(page), mimetype="application/json")
+
+
+@api.route("/performance/perf-results/report", methods=["GET"])
+@with_instance
+@concurrency_limit("perf-report", max_concurrent=2, max_queued=8)
+def get_performance_results_report(instance: Instance):
+    options = _perf_report_options(instance)
+
+    try:
+        # Generated in the process pool, sharing any identical in-flight job
+        job = report_jobs.submit(instance, **options)
+        report = report_jobs.wait(job)
     except DataFormatError as error:
         return response_unprocessable_entity(str(error))
+    except CancelledError:
+        return _perf_report_job_cancelled()
+
+    return _perf_report_response(job.key, report)
+
+
+def _perf_report_job_cancelled():
+    # The tab that shared the job disconnected just before this request joined
+    return error_response(
+        HTTPStatus.SERVICE_UNAVAILABLE, "Perf report job was cancelled; retry"
+    )
+
+
+@api.route("/performance/perf-results/report/jobs", methods=["POST"])
+@with_instance
+def create_performance_report_job(instance: Instance):
+    job = report_jobs.submit(instance, **_perf_report_options(instance))
+    return Response(
+        orjson.dumps(job.to_dict()),
+        status=HTTPStatus.ACCEPTED,
+        mimetype="application/json",
+    )
+
+
+@api.route("/performance/perf-results/report/jobs/<job_id>", methods=["GET"])
+@with_instance
+def get_performance_report_job(job_id, instance: Instance):
+    job = report_jobs.get(job_id, instance.instance_id)
+    if job is None:
+        return response_not_found(f"Unknown report job: {job_id}")
+
+    return Response(orjson.dumps(job.to_dict()), mimetype="application/json")
+
+
+@api.route("/performance/perf-results/report/jobs/<job_id>/result", methods=["GET"])
+@with_instance
+def get_performance_report_job_result(job_id, instance: Instance):
+    job = report_jobs.get(job_id, instance.instance_id)
+    if job is None:
+        return response_not_found(f"Unknown report job: {job_id}")
+    if job.status is ReportJobStatus.FAILED:
+        return response_unprocessable_entity(job.error)
+    if job.status is not ReportJobStatus.FINISHED:
+        # Still queued or running, or cancelled
+        return Response(
+            orjson.dumps(job.to_dict()),
+            status=HTTPStatus.CONFLICT,
+            mimetype="application/json",
+        )
+    body = report_jobs.result(job)
+    if body is None:
+        return response_not_found(
+            f"Result of report job {job_id} has left the report cache; resubmit"
+        )
 
-    return Response(orjson.dumps(report), mimetype="application/json")
+    return _perf_report_response(job.key, body)
+
+
+@api.route("/performance/trends", methods=["GET"])
+def get_performance_trends():
+    """
+    Device time of ``op`` across the last ``runs`` reported runs, one series
+    per input signature and call count. Without ``op``, the ops of the latest
+    run at least ``threshold`` percent slower than their earlier mean. Not
+    scoped to an instance: the runs are all those reported on this server.
+    """
+    runs = request.args.get("runs", DEFAULT_RUNS, type=int)
+    if not 1 <= runs <= MAX_RUNS:
+        return response_bad_request(f"runs must be between 1 and {MAX_RUNS}")
+
+    op_code = request.args.get("op")
+    if op_code:
+        result = run_in_thread(
+            perf_trend_store.trends,
+            op_code,
+            runs=runs,
+            signature=request.args.get("signature"),
+            global_call_count=request.args.get("global_call_count", type=int),
+        )
+    else:
+        result = run_in_thread(
+            perf_trend_store.regressions,
+            runs=runs,
+            threshold=request.args.get(
+                "threshold", DEFAULT_REGRESSION_THRESHOLD, type=float
+            ),
+            limit=request.args.get("limit", DEFAULT_REGRESSION_LIMIT, type=int),
+        )
+    return Response(orjson.dumps(result), mimetype="application/json")
 
 
 # this is no longer used atm. keeping for now until confirmed "not needed"
@@ -1209,12 +1528,10 @@ def get_performance_data_raw(instance: Instance):
         instance.performance_path = str(performance_path)
         logger.info(f"************ Performance path set to {instance.performance_path}")
 
-    content = DeviceLogProfilerQueries.get_raw_csv(instance)
-
-    return Response(
-        content,
+    return _file_response(
+        DeviceLogProfilerQueries.get_raw_csv_path(instance),
         mimetype="text/csv",
-        headers={"Content-Disposition": "attachment; filename=profile_log_device.csv"},
+        download_name="profile_log_device.csv",
     )
 
 
@@ -1268,6 +1585,26 @@ def get_performance_device_meta(instance: Instance):
         return response_internal_server_error(str(e))
 
 
+def _npe_json_response(file_path: Path, compressed: bool) -> Response:
+    """
+    The NPE JSON in ``file_path``, sent without parsing it. A zstd file goes
+    out as stored with ``Content-Encoding: zstd`` when the client accepts
+    that, and is otherwise decompressed as it streams.
+    """
+    if not compressed:
+        return _file_response(file_path, mimetype="application/json")
+
+    if request.accept_encodings["zstd"]:
+        response = _file_response(file_path, mimetype="application/json")
+        response.headers["Content-Encoding"] = "zstd"
+    else:
+        response = Response(
+            NPEQueries.iter_decompressed(file_path), mimetype="application/json"
+        )
+    response.vary.add("Accept-Encoding")
+    return response
+
+
 @api.route("/performance/npe/manifest", methods=["GET"])
 @with_instance
 def get_npe_manifest(instance: Instance):
@@ -1281,6 +1618,7 @@ def get_npe_manifest(instance: Instance):
 
 @api.route("/performance/npe/timeline", methods=["GET"])
 @with_instance
+@concurrency_limit("npe-timeline", max_concurrent=4, max_queued=16)
 def get_npe_timeline(instance: Instance):
     filename = request.args.get("filename", default=None)
 
@@ -1288,21 +1626,187 @@ def get_npe_timeline(instance: Instance):
         return Response(orjson.dumps({}), mimetype="application/json")
 
     filename = Path(filename).name
+    file_path = NPEQueries.get_npe_timeline_path(instance, filename)
+    if not file_path.exists():
+        return Response(orjson.dumps({}), mimetype="application/json")
+
+    return _npe_json_response(file_path, compressed=filename.endswith(".zst"))
+
+
+@api.route("/performance/npe/timeline/window", methods=["GET"])
+@with_instance
+@concurrency_limit("npe-timeline", max_concurrent=4, max_queued=16)
+def get_npe_timeline_window(instance: Instance):
+    filename = request.args.get("filename", default=None)
+    if not filename:
+        return response_bad_request("filename is required")
+
+    start = request.args.get("start", type=int)
+    end = request.args.get("end", type=int)
+    if start is not None and end is not None and start > end:
+        return response_bad_request("start must not be after end")
+
+    file_path = NPEQueries.get_npe_timeline_path(instance, Path(filename).name)
+    if not file_path.exists():
+        return response_not_found(f"NPE timeline not found: {filename}")
+
+    try:
+        # Indexed on first use, so later windows read only what they show
+        index = NPETimelineIndex.load(file_path)
+        window = index.window(
+            start=start,
+            end=end,
+            resolution=request.args.get("resolution", DEFAULT_RESOLUTION, type=int),
+        )
+    except BrokenProcessPool as e:
+        # A pool worker died (e.g. out of memory); the next request gets a new pool
+        logger.error(f"Could not index NPE timeline {file_path}: {e}")
+        return error_response(
+            HTTPStatus.SERVICE_UNAVAILABLE, "NPE timeline indexing failed; retry"
+        )
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.error(f"Could not index NPE timeline {file_path}: {e}")
+        return response_unprocessable_entity(f"Invalid NPE timeline: {filename}")
+
+    return Response(orjson.dumps(window), mimetype="application/json")
+
+
+@api.route("/performance/host-timeline", methods=["GET"])
+@with_instance
+@concurrency_limit("performance-csv", max_concurrent=4, max_queued=32)
+def get_host_timeline(instance: Instance):
+    """
+    Host zones from the Tracy capture overlapping ``start``..``end``, in ns
+    since the capture started, optionally of one zone ``name``.
+    """
+    start = request.args.get("start", type=int)
+    end = request.args.get("end", type=int)
+    if start is not None and end is not None and start > end:
+        return response_bad_request("start must not be after end")
+    limit = request.args.get("limit", TracyHostQueries.DEFAULT_WINDOW_LIMIT, type=int)
+    limit = min(max(limit, 1), TracyHostQueries.MAX_WINDOW_LIMIT)
 
     try:
-        content = NPEQueries.get_npe_timeline(instance, filename=filename)
+        window = TracyHostQueries(instance).query_window(
+            start=start, end=end, name=request.args.get("name"), limit=limit
+        )
     except FileNotFoundError:
-        return Response(orjson.dumps({}), mimetype="application/json")
+        return response_not_found("No Tracy host profile in this performance report")
+    except DataFormatError as error:
+        return response_unprocessable_entity(str(error))
+    return Response(orjson.dumps(window), mimetype="application/json")
 
-    return Response(orjson.dumps(content), mimetype="application/json")
+
+@api.route("/performance/export/trace", methods=["GET"])
+@with_instance
+def export_chrome_trace(instance: Instance):
+    """
+    The device log, and the ops of the perf results unless ``ops=false``, as
+    a Chrome trace JSON download for Perfetto, streamed as it is built.
+    Repeatable ``device``, ``core`` (``x,y``), ``risc`` and ``zone`` narrow
+    the device log events. Holds a ``performance-csv`` concurrency slot
+    until the stream is closed, not just until this view returns.
+    """
+    cores = set()
+    for core in request.args.getlist("core"):
+        match = re.fullmatch(r"\s*(\d+)\s*,\s*(\d+)\s*", core)
+        if not match:
+            return response_bad_request(f"core must be x,y, got {core!r}")
+        cores.add((int(match.group(1)), int(match.group(2))))
+    devices = request.args.getlist("device", type=int)
+    if len(devices) != len(request.args.getlist("device")):
+        return response_bad_request("device must be an integer")
+    filters = TraceFilters(
+        devices=set(devices),
+        cores=cores,
+        riscs=set(request.args.getlist("risc")),
+        zones=set(request.args.getlist("zone")),
+    )
+
+    if not instance.performance_path:
+        raise PerformanceReportNotLoadedException()
+    device_log = Path(
+        instance.performance_path, DeviceLogProfilerQueries.DEVICE_LOG_FILE
+    )
+    if not device_log.exists():
+        return response_not_found("No device log in this performance report")
+    ops_perf_path = None
+    if str_to_bool(request.args.get("ops", "true")):
+        try:
+            ops_perf_path = OpsPerformanceQueries.get_local_ops_perf_file_path(instance)
+        except FileNotFoundError:
+            pass
+
+    limit = get_concurrency_limit("performance-csv", max_concurrent=4, max_queued=32)
+    with ExitStack() as slot:
+        slot.enter_context(limit.acquire())
+        try:
+            chunks = chrome_trace(instance.performance_path, ops_perf_path, filters)
+        except FileNotFoundError:
+            return response_not_found("No device log in this performance report")
+        except DataFormatError as error:
+            return response_unprocessable_entity(str(error))
+        response = Response(chunks, mimetype="application/json")
+        response.call_on_close(slot.pop_all().close)
+    response.headers["Content-Disposition"] = "attachment; filename=trace.json"
+    return response
+
+
+@api.route("/performance/device-log/zones", methods=["GET"])
+@with_instance
+@concurrency_limit("performance-csv", max_concurrent=4, max_queued=32)
+def get_zone_duration_statistics(instance: Instance):
+    zone = request.args.get("zone")
+    with DeviceLogProfilerQueries(instance) as csv:
+        result = csv.zone_duration_statistics(zone_name=zone)
+        return Response(orjson.dumps(result), mimetype="application/json")
+
+
+@api.route("/performance/device-log/window", methods=["GET"])
+@with_instance
+@concurrency_limit("performance-csv", max_concurrent=4, max_queued=32)
+def get_device_log_window(instance: Instance):
+    start = request.args.get("start", type=int)
+    end = request.args.get("end", type=int)
+    if start is not None and end is not None and start > end:
+        return response_bad_request("start must not be after end")
+    limit = request.args.get(
+        "limit", DeviceLogProfilerQueries.DEFAULT_WINDOW_LIMIT, type=int
+    )
+    limit = min(max(limit, 1), DeviceLogProfilerQueries.MAX_WINDOW_LIMIT)
+
+    with DeviceLogProfilerQueries(instance) as csv:
+        return Response(
+            csv.query_cycle_window(
+                start=start,
+                end=end,
+                core_x=request.args.get("core_x", type=int),
+                core_y=request.args.get("core_y", type=int),
+                risc=request.args.get("risc"),
+                limit=limit,
+            ),
+            mimetype="application/json",
+        )
+
+
+@api.route("/performance/kernel-durations", methods=["GET"])
+@with_instance
+@concurrency_limit("performance-csv", max_concurrent=4, max_queued=32)
+def get_kernel_durations(instance: Instance):
+    with DeviceLogProfilerQueries(instance) as csv:
+        return Response(
+            orjson.dumps(csv.kernel_duration_matrix()), mimetype="application/json"
+        )
 
 
 @api.route("/performance/device-log/zone/<zone>", methods=["GET"])
 @with_instance
 def get_zone_statistics(zone, instance: Instance):
     with DeviceLogProfilerQueries(instance) as csv:
-        result = csv.query_zone_statistics(zone_name=zone, as_dict=True)
-        return Response(orjson.dumps(result), mimetype="application/json")
+        return Response(
+            csv.query_zone_statistics_json(zone_name=zone),
+            mimetype="application/json",
+        )
 
 
 @api.route("/devices", methods=["GET"])
@@ -1418,6 +1922,8 @@ def create_performance_files():
         return response_unprocessable_entity()
 
     performance_path = str(paths[0].parent)
+    convert_performance_report_in_background(performance_path)
+    report_jobs.submit_for_trends(performance_path)
 
     instance_id = request.args.get("instanceId")
     update_instance(
@@ -2102,21 +2608,21 @@ def get_npe_data(instance: Instance):
         )
         return response_not_found()
 
-    try:
-        if compressed_path and compressed_path.exists():
-            with open(compressed_path, "rb") as file:
-                compressed_data = file.read()
-                npe_data = zstd.uncompress(compressed_data)
-        else:
-            if uncompressed_path is None:
-                return response_not_found()
-            with open(uncompressed_path, "r") as file:
-                npe_data = file.read()
-    except Exception as e:
-        logger.error(f"Error reading NPE file: {e}")
-        return response_unprocessable_entity()
-
-    return Response(npe_data, mimetype="application/json")
+    if compressed_path and compressed_path.exists():
+        try:
+            # Checked up front; once streaming starts the status is sent
+            is_zstd = NPEQueries.is_zstd_file(compressed_path)
+        except OSError as e:
+            logger.error(f"Error reading NPE file: {e}")
+            return response_unprocessable_entity()
+        if not is_zstd:
+            logger.error(f"NPE file is not zstd compressed: {compressed_path}")
+            return response_unprocessable_entity()
+        return _npe_json_response(compressed_path, compressed=True)
+
+    if uncompressed_path is None:
+        return response_not_found()
+    return _npe_json_response(uncompressed_path, compressed=False)
 
 
 @api.route("/mlir", methods=["GET"])
@@ -2133,14 +2639,7 @@ def get_mlir_json(instance: Instance):
         logger.error(f"MLIR file does not exist: {mlir_path}")
         return response_not_found()
 
-    try:
-        with open(mlir_path, "r") as file:
-            mlir_data = file.read()
-    except Exception as e:
-        logger.error(f"Error reading MLIR file: {e}")
-        return response_unprocessable_entity()
-
-    return Response(mlir_data, mimetype="application/json")
+    return _file_response(mlir_path, mimetype="application/json")
 
 
 @api.route("/notify", methods=["POST"])
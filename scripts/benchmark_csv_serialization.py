@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Benchmark device-log query serialization: the old per-cell ``applymap`` NaN
+sanitizing path against LocalCSVQueryRunner's vectorized dict path and its
+JSON bytes path.
+
+Builds a synthetic frame shaped like ``profile_log_device.csv`` (10M rows by
+default; needs several GB of RAM at that size) and prints the per-row cost of
+each path. Both paths include ``orjson.dumps`` so the numbers reflect the full
+response body cost.
+
+    python scripts/benchmark_csv_serialization.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import orjson
+import pandas as pd
+from ttnn_visualizer.csv_queries import DeviceLogProfilerQueries, LocalCSVQueryRunner
+
+
+def make_device_log(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    zones = np.array(["BRISC-FW", "NCRISC-FW", "TRISC-KERNEL", "ERISC-FW"])
+    risc = np.array(["BRISC", "NCRISC", "TRISC_0", "TRISC_1", "TRISC_2"])
+    source_file = pd.Series("kernel.cc", index=range(rows), dtype=object)
+    source_file[rng.random(rows) < 0.3] = np.nan
+    return pd.DataFrame(
+        {
+            "PCIe slot": np.zeros(rows, dtype=np.int64),
+            "core_x": rng.integers(0, 8, rows),
+            "core_y": rng.integers(0, 8, rows),
+            "RISC processor type": pd.Categorical(rng.choice(risc, rows)),
+            "timer_id": rng.integers(0, 1 << 16, rows),
+            "time[cycles since reset]": np.cumsum(rng.integers(1, 50, rows)),
+            # stat value is empty on most rows, as in real logs
+            "stat value": np.where(rng.random(rows) < 0.9, np.nan, 1.0),
+            "run ID": rng.integers(0, 4, rows),
+            "run host ID": rng.integers(0, 1024, rows),
+            "zone name": pd.Categorical(rng.choice(zones, rows)),
+            "zone phase": pd.Categorical(rng.choice(["begin", "end"], rows)),
+            "source line": rng.integers(1, 500, rows),
+            "source file": source_file,
+        },
+        columns=DeviceLogProfilerQueries.DEVICE_LOG_COLUMNS,
+    )
+
+
+def before(df: pd.DataFrame) -> bytes:
+    """The serialization LocalCSVQueryRunner used before vectorizing."""
+    sanitized_df = df.map(lambda x: None if pd.isna(x) else x)
+    sanitized_columns = {col: col.replace(" ", "_") for col in sanitized_df.columns}
+    sanitized_df = sanitized_df.copy()
+    sanitized_df.rename(columns=sanitized_columns, inplace=True)
+    return orjson.dumps(sanitized_df.to_dict(orient="records"))
+
+
+def after_dicts(df: pd.DataFrame) -> bytes:
+    return orjson.dumps(LocalCSVQueryRunner._serialize(df, as_dict=True))
+
+
+def after_json(df: pd.DataFrame) -> bytes:
+    return orjson.dumps(LocalCSVQueryRunner._records(df, sanitize_nulls=False))
+
+
+def best_of(fn, df: pd.DataFrame, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    df = make_device_log(args.rows)
+    assert before(df.head(1000)) == after_json(df.head(1000))
+
+    print(f"{args.rows:,} rows x {df.shape[1]} columns")
+    for label, fn in (
+        ("before (applymap)", before),
+        ("after (execute_query)", after_dicts),
+        ("after (execute_query_json)", after_json),
+    ):
+        seconds = best_of(fn, df, args.repeat)
+        print(
+            f"  {label:<28} {seconds:8.2f} s  "
+            f"{seconds / args.rows * 1e6:6.3f} us/row"
+        )
+
+
+if __name__ == "__main__":
+    main()
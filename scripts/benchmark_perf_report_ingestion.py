@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+#
+# SPDX-FileCopyrightText: © 2026 Tenstorrent AI ULC
+
+"""
+Benchmark how generate_report ingests the ops perf results CSV: the old path
+(whole file read into a string, split to count lines, then every row parsed
+into a dict) against the single-pass OpsPerformanceReportQueries index.
+
+Writes a synthetic ops_perf_results CSV (200k rows by default) to a temporary
+directory and prints wall time and tracemalloc peak for each path. Neither
+number includes tt-perf-report's own parse, which is unchanged.
+
+    python scripts/benchmark_perf_report_ingestion.py [--rows N] [--signposts N]
+"""
+
+import argparse
+import csv
+import random
+import tempfile
+import time
+import tracemalloc
+from io import StringIO
+from pathlib import Path
+
+from ttnn_visualizer.csv_queries import OpsPerformanceReportQueries
+
+# Padding columns stand in for the ~60 columns tt-metal writes that the
+# report does not read back.
+FILLER_COLUMNS = [f"FILLER {index}" for index in range(40)]
+HEADER = [
+    "OP CODE",
+    "OP TYPE",
+    "GLOBAL CALL COUNT",
+    "DEVICE ID",
+    "PROGRAM HASH",
+    "PROGRAM CACHE HIT",
+    *OpsPerformanceReportQueries.PASSTHROUGH_COLUMNS.values(),
+    *FILLER_COLUMNS,
+]
+
+
+def write_ops_perf_results(path: Path, rows: int, signposts: int):
+    rng = random.Random(0)
+    signpost_every = max(rows // max(signposts, 1), 1)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for index in range(rows):
+            if index % signpost_every == 0:
+                op_code, op_type = f"signpost_{index // signpost_every}", "signpost"
+            else:
+                op_code, op_type = "ttnn.matmul", "tt_dnn_device"
+            writer.writerow(
+                [
+                    op_code,
+                    op_type,
+                    index,
+                    index % 8,
+                    rng.getrandbits(48),
+                    rng.choice(["True", "False"]),
+                    *(rng.randint(1, 100_000) for _ in range(8)),
+                    *(rng.random() for _ in FILLER_COLUMNS),
+                ]
+            )
+
+
+def before(path: Path):
+    """The ingestion generate_report used before the single-pass index."""
+    with open(path) as f:
+        raw_csv = f.read()
+    csv_file = StringIO(raw_csv)
+    csv_lines = raw_csv.strip().split("\n")
+    assert len(csv_lines) >= 2
+
+    csv_file.seek(0)
+    ops_perf_results = list(csv.DictReader(csv_file))
+    signposts = []
+    for index, row in enumerate(ops_perf_results):
+        if row.get("OP TYPE") == "signpost":
+            op_code = row["OP CODE"]
+            if not any(s["op_code"] == op_code for s in signposts):
+                signposts.append({"id": index + 2, "op_code": op_code})
+    return len(ops_perf_results), signposts
+
+
+def after(path: Path):
+    with open(path, "rb") as f:
+        index = OpsPerformanceReportQueries.index_ops_perf_results(f)
+    return index.row_count, index.signposts
+
+
+def measure(fn, path: Path):
+    # Timed and traced in separate runs; tracemalloc slows allocation down.
+    start = time.perf_counter()
+    result = fn(path)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--signposts", type=int, default=1_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "ops_perf_results.csv"
+        write_ops_perf_results(path, args.rows, args.signposts)
+        size_mb = path.stat().st_size / 1024**2
+        print(f"{args.rows:,} rows, {args.signposts:,} signposts, {size_mb:.0f} MiB")
+
+        results = []
+        for label, fn in (("before (string + DictReader)", before), ("after", after)):
+            result, seconds, peak = measure(fn, path)
+            results.append(result)
+            print(f"  {label:<30} {seconds:7.2f} s  peak {peak / 1024**2:8.1f} MiB")
+        assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main()